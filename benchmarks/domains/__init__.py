@@ -0,0 +1,14 @@
+class Problem:
+    """
+    Read-only problem data shared by every state of a benchmark domain.
+    States keep a reference to the problem, and copying a state does not copy the problem.
+    """
+
+    def __init__(self, **data):
+        self.__dict__.update(data)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
@@ -0,0 +1,72 @@
+import random
+from typing import List
+
+from explorateur import BaseMove, BaseState
+from benchmarks.domains import Problem
+
+
+class StepMove(BaseMove):
+
+    def __init__(self, row: int, col: int):
+        self.row = row
+        self.col = col
+
+    def __str__(self) -> str:
+        return str((self.row, self.col))
+
+    def __eq__(self, other):
+        return isinstance(other, StepMove) and self.row == other.row and self.col == other.col
+
+    def __hash__(self):
+        return hash((self.row, self.col))
+
+
+class GridState(BaseState):
+    """ Shortest path on a 4-connected grid with obstacles from the top-left to the bottom-right corner. """
+
+    DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+    def __init__(self, problem: Problem):
+        super().__init__()
+        self.problem = problem
+        self.row, self.col = 0, 0
+        self.cost = 0
+
+    def get_moves(self) -> List[StepMove]:
+        n, blocked = self.problem.n, self.problem.blocked
+        moves = []
+        for dr, dc in GridState.DIRECTIONS:
+            row, col = self.row + dr, self.col + dc
+            if 0 <= row < n and 0 <= col < n and (row, col) not in blocked:
+                moves.append(StepMove(row, col))
+        return moves
+
+    def execute(self, move: StepMove) -> bool:
+        self.row, self.col = move.row, move.col
+        self.cost += 1
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        n = self.problem.n
+        return self.row == n - 1 and self.col == n - 1
+
+    def get_objective(self) -> float:
+        n = self.problem.n
+        return self.cost + (n - 1 - self.row) + (n - 1 - self.col)
+
+    def __str__(self) -> str:
+        return str((self.row, self.col))
+
+    def __eq__(self, other):
+        return isinstance(other, GridState) and self.row == other.row and self.col == other.col
+
+    def __hash__(self):
+        return hash((self.row, self.col))
+
+
+def generate(size: int, seed: int) -> GridState:
+    """ Returns a (size x size) grid with 20% random obstacles, keeping the corners free. """
+    rng = random.Random(seed)
+    blocked = {(r, c) for r in range(size) for c in range(size) if rng.random() < 0.2}
+    blocked -= {(0, 0), (size - 1, size - 1)}
+    return GridState(Problem(n=size, blocked=frozenset(blocked)))
@@ -0,0 +1,88 @@
+import random
+from typing import List, Tuple
+
+from explorateur import BaseMove, BaseState
+from benchmarks.domains import Problem
+
+
+class PuzzleMove(BaseMove):
+
+    # Offsets of the blank tile
+    DIRECTIONS = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}
+
+    def __init__(self, direction: str):
+        self.direction = direction
+
+    def __str__(self) -> str:
+        return self.direction
+
+    def __eq__(self, other):
+        return isinstance(other, PuzzleMove) and self.direction == other.direction
+
+    def __hash__(self):
+        return hash(self.direction)
+
+
+class PuzzleState(BaseState):
+    """ Sliding tile puzzle over an n x n board, where 0 denotes the blank. """
+
+    def __init__(self, tiles: Tuple[int, ...], problem: Problem):
+        super().__init__()
+        self.tiles = tiles
+        self.problem = problem
+        self.cost = 0
+
+    def get_moves(self) -> List[PuzzleMove]:
+        n = self.problem.n
+        row, col = divmod(self.tiles.index(0), n)
+        return [PuzzleMove(direction) for direction, (dr, dc) in PuzzleMove.DIRECTIONS.items()
+                if 0 <= row + dr < n and 0 <= col + dc < n]
+
+    def execute(self, move: PuzzleMove) -> bool:
+        n = self.problem.n
+        blank = self.tiles.index(0)
+        dr, dc = PuzzleMove.DIRECTIONS[move.direction]
+        target = blank + dr * n + dc
+        tiles = list(self.tiles)
+        tiles[blank], tiles[target] = tiles[target], tiles[blank]
+        self.tiles = tuple(tiles)
+        self.cost += 1
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return self.tiles == self.problem.goal
+
+    def get_objective(self) -> float:
+        # A* with the Manhattan distance heuristic
+        n = self.problem.n
+        distance = 0
+        for index, tile in enumerate(self.tiles):
+            if tile:
+                row, col = divmod(index, n)
+                goal_row, goal_col = divmod(tile - 1, n)
+                distance += abs(row - goal_row) + abs(col - goal_col)
+        return self.cost + distance
+
+    def __str__(self) -> str:
+        return str(self.tiles)
+
+    def __eq__(self, other):
+        return isinstance(other, PuzzleState) and self.tiles == other.tiles
+
+    def __hash__(self):
+        return hash(self.tiles)
+
+
+def generate(size: int, seed: int) -> PuzzleState:
+    """ Returns a (size x size) puzzle scrambled by 4 * size random moves from the goal. """
+    rng = random.Random(seed)
+    goal = tuple(range(1, size * size)) + (0,)
+    state = PuzzleState(goal, Problem(n=size, goal=goal))
+    previous = None
+    for _ in range(4 * size):
+        moves = [m for m in state.get_moves() if m.direction != previous]
+        move = rng.choice(moves)
+        state.execute(move)
+        previous = {"up": "down", "down": "up", "left": "right", "right": "left"}[move.direction]
+    state.cost = 0
+    return state
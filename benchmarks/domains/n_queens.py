@@ -0,0 +1,62 @@
+from typing import List, Tuple
+
+from explorateur import BaseMove, BaseState
+from benchmarks.domains import Problem
+
+
+class QueenMove(BaseMove):
+
+    def __init__(self, col: int):
+        self.col = col
+
+    def __str__(self) -> str:
+        return "col " + str(self.col)
+
+    def __eq__(self, other):
+        return isinstance(other, QueenMove) and self.col == other.col
+
+    def __hash__(self):
+        return hash(self.col)
+
+
+class QueensState(BaseState):
+    """ Places one queen per row. Moves into attacked columns fail on execution. """
+
+    def __init__(self, problem: Problem):
+        super().__init__()
+        self.problem = problem
+        self.cols: Tuple[int, ...] = ()
+
+    def get_moves(self) -> List[QueenMove]:
+        if len(self.cols) == self.problem.n:
+            return []
+        return [QueenMove(col) for col in range(self.problem.n)]
+
+    def execute(self, move: QueenMove) -> bool:
+        row = len(self.cols)
+        for r, c in enumerate(self.cols):
+            if c == move.col or abs(c - move.col) == row - r:
+                return False
+        self.cols = self.cols + (move.col,)
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return len(self.cols) == self.problem.n
+
+    def get_objective(self) -> float:
+        # Prefer states with more queens placed
+        return self.problem.n - len(self.cols)
+
+    def __str__(self) -> str:
+        return str(self.cols)
+
+    def __eq__(self, other):
+        return isinstance(other, QueensState) and self.cols == other.cols
+
+    def __hash__(self):
+        return hash(self.cols)
+
+
+def generate(size: int, seed: int) -> QueensState:
+    """ Returns the empty board of the size-queens problem. The seed is unused. """
+    return QueensState(Problem(n=size))
@@ -0,0 +1,60 @@
+import random
+from typing import List
+
+from explorateur import BaseMove, BaseState
+from benchmarks.domains import Problem
+
+
+class EdgeMove(BaseMove):
+
+    def __init__(self, u: int):
+        self.u = u
+
+    def __str__(self) -> str:
+        return "Move to: " + str(self.u)
+
+    def __eq__(self, other):
+        return isinstance(other, EdgeMove) and self.u == other.u
+
+    def __hash__(self):
+        return hash(self.u)
+
+
+class GraphState(BaseState):
+    """ Shortest path on a random weighted directed graph from vertex 0 to vertex n-1. """
+
+    def __init__(self, problem: Problem):
+        super().__init__()
+        self.problem = problem
+        self.v = 0
+        self.cost = 0
+
+    def get_moves(self) -> List[EdgeMove]:
+        return [EdgeMove(u) for u in self.problem.graph[self.v]]
+
+    def execute(self, move: EdgeMove) -> bool:
+        self.cost += self.problem.graph[self.v][move.u]
+        self.v = move.u
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return self.v == self.problem.n - 1
+
+    def get_objective(self) -> float:
+        return self.cost
+
+    def __str__(self) -> str:
+        return str(self.v) + " cost: " + str(self.cost)
+
+    def __eq__(self, other):
+        return isinstance(other, GraphState) and self.v == other.v
+
+    def __hash__(self):
+        return hash(self.v)
+
+
+def generate(size: int, seed: int) -> GraphState:
+    """ Returns a graph of `size` vertices, each with 3 random out-edges of weight 1 to 10. """
+    rng = random.Random(seed)
+    graph = {v: {u: rng.randint(1, 10) for u in rng.sample(range(size), 3) if u != v} for v in range(size)}
+    return GraphState(Problem(n=size, graph=graph))
@@ -0,0 +1,60 @@
+import random
+from typing import FrozenSet, List, Tuple
+
+from explorateur import BaseMove, BaseState
+from benchmarks.domains import Problem
+
+
+class RotMove(BaseMove):
+
+    def __init__(self, cells: FrozenSet[Tuple[int, int]]):
+        self.cells = cells
+
+    def __str__(self) -> str:
+        return "Rot " + str(len(self.cells)) + " cells"
+
+
+class OrangesState(BaseState):
+    """ Rotting oranges: every minute, fresh oranges next to a rotten one rot. Ends when none is fresh. """
+
+    DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+    def __init__(self, fresh: FrozenSet[Tuple[int, int]], rotten: FrozenSet[Tuple[int, int]], problem: Problem):
+        super().__init__()
+        self.problem = problem
+        self.fresh = fresh
+        self.rotten = rotten
+
+    def get_moves(self) -> List[RotMove]:
+        # Unary branching over the cells that rot in the next minute
+        cells = frozenset((r + dr, c + dc) for r, c in self.rotten for dr, dc in OrangesState.DIRECTIONS
+                          if (r + dr, c + dc) in self.fresh)
+        return [RotMove(cells)] if cells else []
+
+    def execute(self, move: RotMove) -> bool:
+        self.fresh = self.fresh - move.cells
+        self.rotten = self.rotten | move.cells
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return not self.fresh
+
+    def get_objective(self) -> float:
+        return len(self.fresh)
+
+    def __str__(self) -> str:
+        return "Fresh: " + str(len(self.fresh))
+
+    def __eq__(self, other):
+        return isinstance(other, OrangesState) and self.fresh == other.fresh
+
+    def __hash__(self):
+        return hash(self.fresh)
+
+
+def generate(size: int, seed: int) -> OrangesState:
+    """ Returns a (size x size) grid full of fresh oranges except a single rotten one. """
+    rng = random.Random(seed)
+    cells = {(r, c) for r in range(size) for c in range(size)}
+    rotten = (rng.randrange(size), rng.randrange(size))
+    return OrangesState(frozenset(cells - {rotten}), frozenset([rotten]), Problem(n=size))
@@ -0,0 +1,93 @@
+import random
+from typing import List, Tuple
+
+from explorateur import BaseMove, BaseState
+from benchmarks.domains import Problem
+
+
+class FillMove(BaseMove):
+
+    def __init__(self, cell: int, val: int):
+        self.cell = cell
+        self.val = val
+
+    def __str__(self) -> str:
+        return str(self.cell) + " <- " + str(self.val)
+
+    def __eq__(self, other):
+        return isinstance(other, FillMove) and self.cell == other.cell and self.val == other.val
+
+    def __hash__(self):
+        return hash((self.cell, self.val))
+
+
+class SudokuState(BaseState):
+    """ Sudoku of box size b, over a (b^2 x b^2) board where 0 denotes an empty cell. """
+
+    def __init__(self, cells: Tuple[int, ...], problem: Problem):
+        super().__init__()
+        self.cells = cells
+        self.problem = problem
+
+    def _candidates(self, cell: int) -> List[int]:
+        used = {self.cells[peer] for peer in self.problem.peers[cell]}
+        return [val for val in range(1, self.problem.n + 1) if val not in used]
+
+    def get_moves(self) -> List[FillMove]:
+        # Branch on the empty cell with the fewest candidates
+        best_cell, best_vals = None, None
+        for cell, val in enumerate(self.cells):
+            if val == 0:
+                vals = self._candidates(cell)
+                if best_vals is None or len(vals) < len(best_vals):
+                    best_cell, best_vals = cell, vals
+        if best_cell is None:
+            return []
+        return [FillMove(best_cell, val) for val in best_vals]
+
+    def execute(self, move: FillMove) -> bool:
+        cells = list(self.cells)
+        cells[move.cell] = move.val
+        self.cells = tuple(cells)
+
+        # Fail if some empty cell is left without candidates
+        return all(self._candidates(cell) for cell in self.problem.peers[move.cell] if self.cells[cell] == 0)
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return 0 not in self.cells
+
+    def get_objective(self) -> float:
+        return self.cells.count(0)
+
+    def __str__(self) -> str:
+        return str(self.cells)
+
+    def __eq__(self, other):
+        return isinstance(other, SudokuState) and self.cells == other.cells
+
+    def __hash__(self):
+        return hash(self.cells)
+
+
+def generate(size: int, seed: int) -> SudokuState:
+    """ Returns a sudoku with box size `size` where half of the cells of a shuffled solution are emptied. """
+    rng = random.Random(seed)
+    b, n = size, size * size
+
+    # A valid solution from the pattern (b * (r % b) + r // b + c) % n, with shuffled digits
+    digits = list(range(1, n + 1))
+    rng.shuffle(digits)
+    cells = [digits[(b * (r % b) + r // b + c) % n] for r in range(n) for c in range(n)]
+    for cell in rng.sample(range(n * n), n * n // 2):
+        cells[cell] = 0
+
+    # Peers of each cell share its row, column, or box
+    peers = []
+    for cell in range(n * n):
+        r, c = divmod(cell, n)
+        box = [(r // b * b + i) * n + (c // b * b + j) for i in range(b) for j in range(b)]
+        row = [r * n + j for j in range(n)]
+        col = [i * n + c for i in range(n)]
+        peers.append(tuple(sorted(set(box + row + col) - {cell})))
+
+    return SudokuState(tuple(cells), Problem(n=n, peers=peers))
@@ -0,0 +1,162 @@
+"""
+Benchmarks every exploration and search type combination over scalable search domains.
+Monte Carlo tree search and local search keep no visited states, so they are paired with tree search only.
+
+Usage:
+    python -m benchmarks.run --preset quick --output results.json
+    python -m benchmarks.run --preset quick --baseline benchmarks/baseline.json
+
+Results record nodes per second, peak memory, and time to first solution of every run.
+When a baseline is given, runs that lose their solution, explore more nodes,
+become slower, or use more memory beyond the tolerance are reported as regressions.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from explorateur import Explorateur, __version__
+from explorateur.utils import All_Exploration_Types, All_Search_Types, Constants
+from benchmarks.domains import grid_path, n_puzzle, n_queens, random_graph, rotting_oranges, sudoku
+
+# Domain name -> (generator, size per preset, max depth)
+DOMAINS = {"n_puzzle": (n_puzzle.generate, {"quick": 3, "full": 4}, 60),
+           "n_queens": (n_queens.generate, {"quick": 6, "full": 8}, 20),
+           "grid_path": (grid_path.generate, {"quick": 8, "full": 20}, 100),
+           "sudoku": (sudoku.generate, {"quick": 2, "full": 3}, 100),
+           "random_graph": (random_graph.generate, {"quick": 50, "full": 500}, 100),
+           "rotting_oranges": (rotting_oranges.generate, {"quick": 8, "full": 30}, 100)}
+
+# Every exploration and search type, with its default fields
+EXPLORATION_TYPES = {exploration_type.__name__: exploration_type for exploration_type in All_Exploration_Types.__args__}
+
+SEARCH_TYPES = {search_type.__name__: search_type for search_type in All_Search_Types.__args__}
+
+# Monte Carlo tree search and local search keep no visited states, so they only run with tree search
+STATELESS_EXPLORATION_TYPES = ("MCTS", "HillClimbing", "SimulatedAnnealing", "TabuSearch")
+
+# Maximum number of moves per run, per preset
+MAX_MOVES = {"quick": 2000, "full": 100000}
+
+
+def run_benchmark(domain: str, preset: str, seed: int,
+                  exploration_name: str, search_name: str, is_memory: bool = True) -> Dict:
+    """ Runs a single search and returns its metrics. """
+    generate, sizes, max_depth = DOMAINS[domain]
+
+    def search():
+        explorer = Explorateur()
+        is_solution = explorer.search(generate(sizes[preset], seed),
+                                      exploration_type=EXPLORATION_TYPES[exploration_name](),
+                                      search_type=SEARCH_TYPES[search_name](),
+                                      is_solution_path=False,
+                                      max_depth=max_depth,
+                                      max_moves=MAX_MOVES[preset])
+        return explorer, is_solution
+
+    explorer, is_solution = search()
+    result = {"is_solution": is_solution,
+              "num_decisions": explorer.num_decisions,
+              "num_failed_decisions": explorer.num_failed_decisions,
+              "total_time": explorer.total_time,
+              "nodes_per_second": explorer.num_decisions / explorer.total_time if explorer.total_time else 0.0,
+              "time_to_first_solution": explorer.total_time if is_solution else None,
+              "peak_memory": None}
+
+    # Memory is measured on a separate run, since tracing allocations slows down the search
+    if is_memory:
+        tracemalloc.start()
+        search()
+        result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return result
+
+
+def get_pairs() -> List[Tuple[str, str]]:
+    """ Returns the exploration and search type names of every pair that can run together. """
+    return [(exploration_name, search_name)
+            for exploration_name in EXPLORATION_TYPES for search_name in SEARCH_TYPES
+            if exploration_name not in STATELESS_EXPLORATION_TYPES or search_name == "TreeSearch"]
+
+
+def run_all(preset: str = "quick", seed: int = Constants.default_seed, is_memory: bool = True,
+            domains: Optional[List[str]] = None) -> Dict:
+    """ Runs every exploration and search type pair that can run together on every domain. """
+    results = {}
+    for domain in domains or DOMAINS:
+        for exploration_name, search_name in get_pairs():
+            key = "/".join((domain, exploration_name, search_name))
+            results[key] = run_benchmark(domain, preset, seed, exploration_name, search_name, is_memory)
+
+    return {"meta": {"version": __version__,
+                     "python": platform.python_version(),
+                     "preset": preset,
+                     "seed": seed,
+                     "date": time.strftime("%Y-%m-%d %H:%M:%S")},
+            "results": results}
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float = 0.25) -> List[str]:
+    """ Returns the regressions of the current results with respect to the baseline results. """
+    regressions = []
+    for key, base in baseline["results"].items():
+        result = current["results"].get(key)
+        if result is None:
+            continue
+
+        if base["is_solution"] and not result["is_solution"]:
+            regressions.append(key + ": solution no longer found")
+        if result["num_decisions"] > base["num_decisions"] * (1 + tolerance):
+            regressions.append(key + ": decisions " + str(base["num_decisions"]) +
+                               " -> " + str(result["num_decisions"]))
+        if result["nodes_per_second"] < base["nodes_per_second"] * (1 - tolerance):
+            regressions.append(key + ": nodes/sec " + str(round(base["nodes_per_second"])) +
+                               " -> " + str(round(result["nodes_per_second"])))
+        if base["peak_memory"] and result["peak_memory"] and \
+                result["peak_memory"] > base["peak_memory"] * (1 + tolerance):
+            regressions.append(key + ": peak memory " + str(base["peak_memory"]) +
+                               " -> " + str(result["peak_memory"]))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Explorateur benchmarks")
+    parser.add_argument("--preset", choices=sorted(MAX_MOVES), default="quick")
+    parser.add_argument("--seed", type=int, default=Constants.default_seed)
+    parser.add_argument("--domain", action="append", choices=sorted(DOMAINS),
+                        help="Domain to run, can be repeated. Default, all domains.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory measurement.")
+    parser.add_argument("--output", help="JSON file to save the results.")
+    parser.add_argument("--baseline", help="JSON file of baseline results to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Relative change allowed before reporting a regression. Default, 0.25.")
+    args = parser.parse_args(argv)
+
+    current = run_all(args.preset, args.seed, not args.no_memory, args.domain)
+
+    for key, result in current["results"].items():
+        print("{:<45} solved: {:<5} decisions: {:>7} nodes/sec: {:>9.0f} memory: {}".format(
+            key, str(result["is_solution"]), result["num_decisions"],
+            result["nodes_per_second"], result["peak_memory"]))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance)
+        for regression in regressions:
+            print("REGRESSION", regression)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
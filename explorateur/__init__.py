@@ -1,7 +1,13 @@
 from explorateur._version import __version__
 from explorateur.explorateur import Explorateur
 from explorateur.search.exploration_type import ExplorationType
+from explorateur.search.hook import Hook
+from explorateur.search.memo_cache import MemoCache
+from explorateur.search.move_ordering import MoveOrdering
+from explorateur.search.restart import Restart
+from explorateur.search.search_stats import SearchStats
 from explorateur.search.search_type import SearchType
 from explorateur.state.base_state import BaseState
 from explorateur.state.base_move import BaseMove
+from explorateur.state.persistent import PersistentState
 
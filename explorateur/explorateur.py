@@ -1,18 +1,42 @@
 import copy as cp
+import inspect
+import logging
+import math
+import random
+import sys
 import time
-from typing import Optional, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, List, Tuple, Union
 
 from explorateur._version import __version__
 from explorateur.search.exploration_type import ExplorationType
+from explorateur.search.hook import Hook, ProgressCallback
+from explorateur.search.mcts import MCTSNode, rollout
+from explorateur.search.memo_cache import MemoCache, MemoTable
+from explorateur.search.move_ordering import MoveOrdering
+from explorateur.search.node import Node, SearchTree, NO_PARENT
+from explorateur.search.nogood_store import NogoodStore
+from explorateur.search.restart import Restart, All_Restart_Types, get_cutoff
+from explorateur.search.search_result import SearchResult
+from explorateur.search.search_stats import SearchStats
 from explorateur.search.search_type import SearchType
-from explorateur.search.transition import Transition
+from explorateur.search.solution_path import Solution, SolutionPath
+from explorateur.search.tabu_list import TabuList
+from explorateur.state.base_move import BaseMove
 from explorateur.state.base_state import BaseState
 from explorateur.state.storage.base_storage import BaseStorage
+from explorateur.state.storage.bloom_filter import BloomFilter
+from explorateur.state.storage.bounded_hash import BoundedHashSet
+from explorateur.state.storage.cost_table import CostTable
 from explorateur.state.storage.factory import StorageFactory
+from explorateur.state.storage.transposition_table import TranspositionTable
 from explorateur.utils import check_true, All_Exploration_Types, All_Search_Types, Constants
 
 __version__ = __version__
 
+logger = logging.getLogger("explorateur")
+"""Module logger. Verbose searches log their decisions at DEBUG level."""
+
 
 class Explorateur:
     """
@@ -39,6 +63,10 @@ class Explorateur:
             - DepthFirst in uninformed fashion
             - BestFirst in informed fashion assuming an objective function evaluates the solution quality of a state.
                 By default, best-first search is minimization. To maximize, multiply the objective function by -1.
+            - LimitedDiscrepancy in iterations that allow more deviations from the move order of the state.
+            - MCTS with random rollouts that grows the most promising part of the tree, by the objective function.
+            - HillClimbing, SimulatedAnnealing, and TabuSearch as local search from state to state without a frontier,
+                to find a good state by the objective function fast, in constant memory.
 
         To use Explorateur, you need to define BaseState and BaseMove, as in the quick start template.
     """
@@ -51,29 +79,118 @@ class Explorateur:
 
         # Set verbosity
         self.is_verbose: bool = is_verbose
+        if self.is_verbose:
+            Explorateur._enable_verbose_logging()
 
-        self._log("[Explorateur v." + str(__version__) + "]")
+        # Cached per search, so non-verbose searches skip all diagnostics with a single flag check
+        self._is_debug: bool = self.is_verbose
+
+        self._log("[Explorateur v.%s]", __version__)
 
         # Solution state
         self.solution_state: Optional[BaseState] = None
-        self.solution_path: Optional[List[BaseState]] = None
+        self.solution_path: Optional[SolutionPath] = None
+        self.solution_moves: Optional[List[BaseMove]] = None
+
+        # Best state found by Monte Carlo tree search or local search by the objective function,
+        # its moves, unless local search, and its objective
+        self.best_state: Optional[BaseState] = None
+        self.best_moves: Optional[List[BaseMove]] = None
+        self.best_objective: Optional[float] = None
+
+        # Solutions per goal key, if goal keys, and the tree index of every goal settled so far
+        self.solutions: Dict[Any, Solution] = {}
+        self._goals: Optional[set] = None
+        self._num_goals: int = 0
+        self._settled: Dict[Any, int] = {}
+        self._is_solution_path: bool = True
 
         # State collections open and closed (for graph search only)
         self._open: BaseStorage = None
         self.closed: Optional[BaseStorage] = None
 
+        # Moves known to fail on a state, if nogood learning
+        self.nogoods: Optional[NogoodStore] = None
+
+        # Learned order of moves, if move ordering
+        self._move_ordering: Optional[MoveOrdering] = None
+
+        # Memoized moves, objectives, and heuristics by state key, if memoization
+        self._memo: Optional[MemoCache] = None
+
+        # Whether closed states store their best path cost, if cost-aware graph search
+        self._is_cost: bool = False
+
+        # Whether successors are ranked by the objective delta of their move, if best first search
+        self._is_delta: bool = False
+
+        # Cleared storages by type for reuse, if searching many queries, see search_many()
+        self._storages: Optional[Dict[Tuple[type, Any], Optional[BaseStorage]]] = None
+
+        # Discrepancies allowed in the current iteration, and whether a path was cut by the limit
+        self._discrepancy_limit: int = 0
+        self._is_discrepancy_cut: bool = False
+
+        # Restart strategy, random order of moves, and the number, start, and cutoff of the current run
+        self._restart: Optional[All_Restart_Types] = None
+        self._rng: Optional[random.Random] = None
+        self.num_restarts: int = 0
+        self._run_start_decisions: int = 0
+        self._run_start_failed_decisions: int = 0
+        self._run_start_time: float = 0
+        self._run_cutoff: float = float("inf")
+
+        # Tree of the nodes created during search, and the index of the solution node
+        self._tree: Optional[SearchTree] = None
+        self._solution_index: int = NO_PARENT
+
         # Statistics
         self._start_time: float = 0
         self.total_time: float = 0
         self.num_decisions: int = 0
         self.num_failed_decisions: int = 0
+        self.stats: SearchStats = SearchStats()
+        self._stats: Optional[SearchStats] = None
 
         # Dot graph text representation of search
         self._dot_text: str = ""
         self._dot_filename: str = ""
 
+        # Callbacks per search event, and the cause of stopping if the search is stopped by a callback
+        # Progress callbacks are kept with their own interval, see ProgressCallback
+        self._hooks: Dict[str, List[Callable]] = {event: [] for event in Hook.ALL}
+        self._stop_cause: Optional[str] = None
+
+    def add_hook(self, event: str, callback: Callable,
+                 every_decisions: Optional[int] = None, every_seconds: Optional[float] = None) -> None:
+        """
+        Registers a callback for the given search event. See Hook for the events and callback arguments.
+
+        Arguments:
+            - event (str): One of the search events in Hook, e.g., Hook.ON_EXPAND.
+            - callback (Callable): The function to call, with the explorer as its first argument.
+            - every_decisions Optional(int): For Hook.ON_PROGRESS only, the number of decisions between calls.
+            - every_seconds Optional(float): For Hook.ON_PROGRESS only, the number of seconds between calls.
+        """
+        Explorateur._validate_hook_args(event, callback, every_decisions, every_seconds)
+        if event == Hook.ON_PROGRESS:
+            callback = ProgressCallback(callback, every_decisions, every_seconds)
+        self._hooks[event].append(callback)
+
+    def remove_hook(self, event: str, callback: Callable) -> None:
+        """ Removes a callback registered for the given search event. """
+        check_true(event in self._hooks, ValueError("Unknown search event: " + str(event)))
+        callbacks = self._hooks[event]
+        if event == Hook.ON_PROGRESS:
+            callback = next((progress for progress in callbacks if progress.callback == callback), callback)
+        callbacks.remove(callback)
+
+    def stop(self, cause: str = "Stopped by user") -> None:
+        """ Stops the current search before the next decision. Intended to be called from a callback. """
+        self._stop_cause = cause
+
     def search(self,
-               initial_state: BaseState,
+               initial_state: Union[BaseState, List[BaseState]],
                goal_state: Optional[BaseState] = None,
                exploration_type: All_Exploration_Types = ExplorationType.DepthFirst(),
                search_type: All_Search_Types = SearchType.TreeSearch(),
@@ -81,7 +198,16 @@ class Explorateur:
                max_depth: int = 100,
                max_moves: int = 10000,
                max_runtime: int = None,
-               dot_filename: str = None) -> bool:
+               dot_filename: str = None,
+               stats_level: int = SearchStats.OFF,
+               snapshot_interval: Optional[int] = None,
+               snapshot_cache_size: int = 1000,
+               nogood_cache_size: Optional[int] = None,
+               move_ordering: Optional[MoveOrdering] = None,
+               restart: Optional[All_Restart_Types] = None,
+               goal_keys: Optional[Iterable] = None,
+               num_goals: Optional[int] = None,
+               memo_cache: Optional[MemoCache] = None) -> bool:
         """
         This function performs search from the initial_state until:
             - a solution found, or
@@ -90,14 +216,33 @@ class Explorateur:
 
         Arguments:
             - initial_state (BaseState): The initial state where the search will begin.
+                                         A list of initial states searches from every state in a single run,
+                                         e.g., for multi-source shortest paths.
             - goal_state Optional(BaseState): Optional argument used for graph search to reach termination state.
                                               Default, None.
             - exploration_type Optional(ExplorationType): The exploration method.
+                                                          ExplorationType.MCTS() ignores the search type and
+                                                          keeps the best state by the objective function
+                                                          in self.best_state and self.best_moves.
+                                                          Local search, e.g., ExplorationType.HillClimbing(),
+                                                          ignores the search type and max depth, keeps the
+                                                          best state in self.best_state, and no path or moves.
                                                           Default, ExplorationType.DepthFirst().
             - search_type Optional(SearchType): The search method to decide whether to store visited states.
+                                                SearchType.TranspositionSearch() stores the depth of visited
+                                                states to expand them again when reached at a shallower depth.
+                                                SearchType.BitstateSearch() stores visited states in fixed memory
+                                                and may rarely prune an unvisited state.
+                                                SearchType.BoundedGraphSearch() stores up to a capacity of visited
+                                                states and evicts states to expand them again if reached again.
+                                                SearchType.CostGraphSearch() stores the best path cost of
+                                                visited states, and with ExplorationType.BestFirst(),
+                                                is uniform-cost search, or A* given a heuristic.
                                                 Default, SearchType.TreeSearch().
             - is_solution_path (bool): If True, path starting from solution state back to initial_state is returned.
-                                       If False, solution state is returned.
+                                       If False, solution state is returned,
+                                       and intermediate states of the path are released.
+                                       In both cases, solution_moves lists the moves from the initial_state.
                                        Default, True.
             - max_depth Optional(int): Optional argument for the maximum depth to stop search.
                                        Default, 100.
@@ -109,6 +254,46 @@ class Explorateur:
                                    It uses logging CRITICAL level to log the dot output
                                    Default, None (no dot file saved).
                                    Example dot graph visualizer: https://dreampuf.github.io/GraphvizOnline/
+            - stats_level (int): Detail level of the statistics collected in self.stats.
+                                 SearchStats.LOW counts calls of every search phase and tracks storage sizes,
+                                 depth and branching distributions.
+                                 SearchStats.HIGH additionally times every phase.
+                                 Default, SearchStats.OFF (only total decisions, failures, and time).
+            - snapshot_interval Optional(int): Optional argument to turn on the memory-light replay mode.
+                                               Only the states at every snapshot_interval levels are kept,
+                                               and other states are rebuilt by replaying their moves
+                                               from the nearest snapshot, which requires deterministic execute().
+                                               Default, None (every state needed by open decisions is kept).
+            - snapshot_cache_size (int): Number of rebuilt states cached in replay mode,
+                                         the least recently used state is evicted first.
+                                         Default, 1,000 states.
+            - nogood_cache_size Optional(int): Optional argument to turn on nogood learning.
+                                               Moves that fail to execute are remembered by the key of the state
+                                               and the key of the move, and fail directly on equivalent states
+                                               without a copy. The least recently used nogood is evicted first.
+                                               Default, None (no nogood learning).
+            - move_ordering Optional(MoveOrdering): Optional argument to reorder the moves of every expansion
+                                                    by killer moves and history scores learned during search.
+                                                    The same ordering can be passed to successive searches.
+                                                    Default, None (moves are explored in get_moves() order).
+            - restart Optional(Restart): Optional argument to cut off every run of the search after a number of
+                                         decisions following Restart.Luby() or Restart.Geometric(),
+                                         and restart from the initial state with a new random order of moves.
+                                         Statistics of every run are saved in self.stats.restarts.
+                                         Default, None (no restarts).
+            - goal_keys Optional(Iterable): Optional argument of the keys of goal states, see BaseState.get_key(),
+                                            which replaces is_terminate(). The search goes on after a goal
+                                            is reached, until num_goals goals are reached.
+                                            The state, moves, path, and path cost of every goal reached
+                                            are saved in self.solutions by goal key.
+                                            Default, None (termination by is_terminate()).
+            - num_goals Optional(int): Number of goals to reach before the search stops, e.g., the first k goals.
+                                       Default, None (every goal).
+            - memo_cache Optional(MemoCache): Optional argument to memoize get_moves(), get_objective(),
+                                              and get_heuristic() by state key, so that a state reached again
+                                              is not evaluated again. The same cache can be passed to
+                                              successive searches, which share its heuristics only.
+                                              Default, None (no memoization).
         Returns:
             - If no solution found or the search hits one of the stopping criteria, returns False.
             - if a solution is found and is_solution_path is set to False, returns the solution state.
@@ -116,148 +301,848 @@ class Explorateur:
                 denoting the path from solution state back to the initial_state.
         """
 
+        # Logging can be reconfigured between searches, so check the logger level once per search
+        self._is_debug = self.is_verbose and logger.isEnabledFor(logging.DEBUG)
+
         # Check arguments
         self._log_start(">>> START SEARCH", max_depth, max_moves, max_runtime)
         Explorateur._validate_search_args(initial_state, goal_state,
                                           exploration_type, search_type, is_solution_path,
-                                          max_depth, max_moves, max_runtime, dot_filename)
+                                          max_depth, max_moves, max_runtime, dot_filename, stats_level,
+                                          snapshot_interval, snapshot_cache_size, nogood_cache_size,
+                                          move_ordering, restart, goal_keys, num_goals, memo_cache)
+
+        # Storages are reused only across the queries of search_many()
+        self._storages = None
+        return self._search(initial_state, goal_state, exploration_type, search_type, is_solution_path,
+                            max_depth, max_moves, max_runtime, dot_filename, stats_level,
+                            snapshot_interval, snapshot_cache_size, nogood_cache_size,
+                            move_ordering, restart, goal_keys, num_goals, memo_cache)
+
+    def search_many(self, queries: Iterable, num_workers: int = 1, **kwargs) -> Iterator[SearchResult]:
+        """
+        This function searches every query with the same search arguments,
+        and yields the result of every query as soon as it is found, in the order of the queries.
 
-        # Reset rng, solution_states, collections, dot graph, start time, stats
-        self._reset_search(dot_filename)
+        Many small queries on the same problem, e.g., routing queries between pairs of vertices,
+        share the setup of the search: the arguments are validated once, the storages are cleared and reused,
+        and nogoods and move ordering, if any, are kept across queries.
+        Initial states of queries are copied as in search(), so they are left unchanged.
 
-        # Create storage for open states, and optionally, for closed states in graph search to avoid duplicate visits
-        self._open = StorageFactory.create(exploration_type)
-        self.closed = StorageFactory.create(search_type)
+        Arguments:
+            - queries (Iterable): Every query is an initial state, a list of initial states,
+                                  or a dictionary of search() arguments for this query only,
+                                  e.g., {"initial_state": state, "goal_keys": [target]}.
+            - num_workers (int): Number of processes that search queries in parallel, which requires picklable
+                                 states, moves, and arguments. Hooks are not called in worker processes.
+                                 Default, 1 (no pool).
+            - kwargs: Arguments of search() shared by every query, e.g., exploration_type. See search().
+        Returns:
+            - Iterator of SearchResult, one per query.
+        """
+        check_true(isinstance(num_workers, int) and num_workers > 0,
+                   ValueError("num_workers must be a positive integer. Incorrect: " + str(num_workers)))
+
+        # Arguments of search() shared by every query, with the defaults of search()
+        args = {name: parameter.default for name, parameter in inspect.signature(self.search).parameters.items()
+                if name != "initial_state"}
+        unknown = set(kwargs) - set(args)
+        check_true(not unknown, TypeError("Unknown search arguments: " + str(sorted(unknown))))
+        args.update(kwargs)
+
+        queries_args = (self._get_query_args(args, query, i == 0) for i, query in enumerate(queries))
+        if num_workers > 1:
+            with ProcessPoolExecutor(num_workers) as pool:
+                yield from pool.map(_search_query, queries_args, chunksize=64)
+            return
 
-        # Root node root from the given initial state
-        root = cp.deepcopy(initial_state)
-        root.id = self.num_decisions
+        self._is_debug = self.is_verbose and logger.isEnabledFor(logging.DEBUG)
+        self._storages = {}
+        self.nogoods = None
+        try:
+            for query_args in queries_args:
+                is_solution = self._search(**query_args)
+                yield self._get_result(is_solution, is_path_copied=False)
+        finally:
+            self._storages = None
+
+    def _search(self, initial_state, goal_state, exploration_type, search_type, is_solution_path,
+                max_depth, max_moves, max_runtime, dot_filename, stats_level,
+                snapshot_interval, snapshot_cache_size, nogood_cache_size,
+                move_ordering, restart, goal_keys, num_goals, memo_cache) -> bool:
 
-        # Check termination, else expand current state with possible moves
-        # as open decisions for execution within depth
-        is_terminate, is_solution = self._is_terminate_or_expand(root, goal_state, exploration_type, max_depth)
+        # Reset rng, solution_states, collections, dot graph, start time, stats
+        self._reset_search(dot_filename, stats_level, snapshot_interval, snapshot_cache_size)
+        initial_states = initial_state if isinstance(initial_state, list) else [initial_state]
+
+        # Index of goal keys, for constant-time goal checks, if goal keys
+        self._goals = set(goal_keys) if goal_keys is not None else None
+        check_true(self._goals is None or len(self._goals) > 0, ValueError("goal_keys cannot be empty."))
+        check_true(num_goals is None or num_goals <= len(self._goals),
+                   ValueError("num_goals cannot be more than the number of distinct goal_keys. Incorrect: " +
+                              str(num_goals) + " > " + str(len(self._goals or ()))))
+        self._num_goals = num_goals if num_goals is not None else len(self._goals or ())
+        self._is_solution_path = is_solution_path
+
+        # Monte Carlo tree search runs its own iterations of selection, expansion, rollout, and backpropagation
+        if isinstance(exploration_type, ExplorationType.MCTS):
+            return self._search_mcts(initial_state, goal_state, exploration_type, is_solution_path,
+                                     max_depth, max_moves, max_runtime)
+
+        # Local search moves from state to state, without open and closed states
+        if isinstance(exploration_type, (ExplorationType.HillClimbing, ExplorationType.SimulatedAnnealing,
+                                         ExplorationType.TabuSearch)):
+            return self._search_local(initial_state, goal_state, exploration_type, max_moves, max_runtime)
+
+        # Create storage for nogoods, if nogood learning, which is kept across the queries of search_many()
+        if self._storages is None or self.nogoods is None or self.nogoods.capacity != nogood_cache_size:
+            self.nogoods = NogoodStore(nogood_cache_size) if nogood_cache_size else None
+        self._move_ordering = move_ordering
+
+        # Memoization, which forgets earlier searches unless kept
+        self._memo = memo_cache
+        if memo_cache is not None:
+            memo_cache.reset()
+
+        # Start the first run, if restarts
+        self._restart = restart
+        self._rng = random.Random(restart.seed) if restart else None
+        self._run_cutoff = get_cutoff(restart, 0) if restart else float("inf")
+
+        # Create storage for open states, and optionally, for closed states in graph search to avoid duplicate visits
+        self._open = self._create_storage(exploration_type)
+        self.closed = self._create_storage(search_type)
+        self._is_cost = isinstance(self.closed, CostTable)
+        # Successors are copies of their root, so deltas are used only if every root implements them
+        self._is_delta = (isinstance(exploration_type, ExplorationType.BestFirst) and not self._is_cost and
+                          all(type(initial_state).get_objective_delta is not BaseState.get_objective_delta
+                              for initial_state in initial_states))
+
+        # Statistics are collected only when requested, the clock is a no-op below the HIGH level
+        stats = self._stats
+        clock = self.stats.clock
+
+        # Root nodes from the given initial states, checked for termination, else expanded
+        is_terminate, is_solution = self._expand_roots(initial_states, goal_state, exploration_type, max_depth)
         if is_solution:
-            if is_solution_path:
-                self.solution_path = self._get_solution_path()
+            self._save_solution(is_solution_path)
             return True
         if is_terminate:
             return False
 
         # START SEARCH
-        while not self._open.is_empty():
-            self.num_decisions += 1
-            self._log("\nDecision " + str(self.num_decisions))
-            self._log("Open decisions: " + str(self._open.size()))
-
-            # Pop the copied successor state from open for execution
-            successor = self._open.remove()
-            current = successor._transition.previous_state
-            move = successor._transition.move
-            self._log("Current decision state: " + str(current))
-            self._log("Current decision move: " + str(move))
-
-            # Transition of the current state (there is no transition for initial moves)
-            self._log("Current transition: " + str(current._transition))
-
-            # Execute the move on a copy state
-            if successor.execute(move):
-                self._log("Move is successful.")
+        is_debug = self._is_debug
+        tree = self._tree
+        is_transposition = isinstance(search_type, SearchType.TranspositionSearch)
+        is_closed_depth = is_transposition or isinstance(search_type, SearchType.BoundedGraphSearch)
+        is_cost = self._is_cost
+        is_delta = self._is_delta
+        is_deferred = is_cost and isinstance(exploration_type, ExplorationType.BestFirst)
+        nogoods = self.nogoods
+        move_ordering = self._move_ordering
+        on_generate = self._hooks[Hook.ON_GENERATE]
+        on_execute_fail = self._hooks[Hook.ON_EXECUTE_FAIL]
+        on_progress = self._hooks[Hook.ON_PROGRESS]
+        is_lds = isinstance(exploration_type, ExplorationType.LimitedDiscrepancy)
+        while True:
+            if self._open.is_empty():
+                # Start the next iteration of limited discrepancy search, if any path was cut by the limit
+                if not is_lds or not self._is_discrepancy_cut or \
+                        self._discrepancy_limit >= exploration_type.max_discrepancies:
+                    break
+                self._discrepancy_limit += 1
+                self._is_discrepancy_cut = False
+                self.closed = self._create_storage(search_type)
+                self._log("Discrepancy limit: %d", self._discrepancy_limit)
+
+                is_terminate, is_solution = self._expand_roots(initial_states, goal_state, exploration_type,
+                                                               max_depth)
+                if is_solution:
+                    self._save_solution(is_solution_path)
+                    return True
+                if is_terminate:
+                    return False
+                continue
 
+            self.num_decisions += 1
+            if is_debug:
+                logger.debug("\nDecision %d", self.num_decisions)
+                logger.debug("Open decisions: %d", self._open.size())
+
+            # Pop the next open decision, a move to execute on the state of its parent node
+            if stats:
+                t = clock()
+            node = self._open.remove()
+            if stats:
+                stats.record(SearchStats.OPEN_REMOVE, t)
+            current = tree.states[node.parent]
+            if current is None:  # replay mode, rebuild the state from the nearest snapshot
+                current = tree.get_state(node.parent)
+
+            # Expand a state of cost search in the order of f, unless a cheaper path to it was found since
+            if node.move is None:
+                self.num_decisions -= 1
+                if self.closed.get_cost(current) < current.get_path_cost():
+                    tree.remove_pending(node.parent)
+                    continue
+                tree.num_pending[node.parent] -= 1
+                is_terminate, is_solution = self._is_terminate_or_expand(current, node.parent, goal_state,
+                                                                         exploration_type, max_depth)
+                if is_solution:
+                    self._save_solution(is_solution_path)
+                    return True
+                if is_terminate:
+                    return False
+                continue
+
+            move = node.move
+            if is_debug:
+                logger.debug("Current decision state: %s", current)
+                logger.debug("Current decision move: %s", move)
+                logger.debug("Current node: %s", node)
+
+            # Skip moves already known to fail on an equivalent state, if nogood learning
+            if nogoods is not None and nogoods.contains(current, move):
+                is_success = False
+                if is_debug:
+                    logger.debug("Move is a nogood.")
+            else:
+                # Check the move on the current state first, infeasible moves are failures without a copy
+                if stats:
+                    t = clock()
+                is_success = current.is_feasible(move)
+                if stats:
+                    stats.record(SearchStats.IS_FEASIBLE, t)
+
+                # Execute the move on a copy state, copied only now that the decision is taken
+                if is_success:
+                    if stats:
+                        t = clock()
+                    successor = cp.deepcopy(current)
+                    if stats:
+                        stats.record(SearchStats.COPY, t)
+                        t = clock()
+                    is_success = successor.execute(move)
+                    if stats:
+                        stats.record(SearchStats.EXECUTE, t)
+
+                    # Remember the failure for equivalent states
+                    if not is_success and nogoods is not None:
+                        nogoods.insert(current, move)
+                elif is_debug:
+                    logger.debug("Move is infeasible.")
+
+            # Callbacks can reject a successful successor, which is then counted as a failure
+            if is_success and on_generate:
+                is_success = self._dispatch(on_generate, current, move, successor)
+
+            if is_success:
                 successor.id = self.num_decisions - self.num_failed_decisions
-                self._log("Create next transition: " + str(successor._transition) +
-                          " from ID: " + str(current.id) + " to ID: " + str(successor.id))
+                if is_debug:
+                    logger.debug("Move is successful.")
+                    logger.debug("Create next node: %s from ID: %s to ID: %s", node, current.id, successor.id)
+
+                # Mark the decision as visited, if graph search, cost search marks successors instead
+                if self.closed and not is_cost:
+                    if is_debug:
+                        logger.debug("Insert current decision state as visited in closed decisions: %d",
+                                     self.closed.size())
+                    if stats:
+                        t = clock()
+                    if is_closed_depth:
+                        self.closed.insert(current, node.depth - 1)
+                    else:
+                        self.closed.insert(current)
+                    if stats:
+                        stats.record(SearchStats.CLOSED_INSERT, t)
+                        stats.record_closed_size(self.closed.size())
 
-                # Mark the decision as visited, if graph search
+                # Skip already visited successor, if graph search
                 if self.closed:
-                    self._log("Insert current decision state as visited in closed decisions: " + str(self.closed.size()))
-                    self.closed.insert(current)
+                    if stats:
+                        t = clock()
+                    if is_cost:
+                        cost = successor.get_path_cost()
+                        is_visited = self.closed.contains(successor, cost)
+                    elif is_transposition:
+                        is_visited = self.closed.contains(successor, node.depth)
+                    else:
+                        is_visited = self.closed.contains(successor)
+                    if stats:
+                        stats.record(SearchStats.CLOSED_CONTAINS, t)
+                else:
+                    is_visited = False
 
-                # Skip already visited successor, if graph search
-                if self.closed and self.closed.contains(successor):
-                    self._log("Skip adding successor decision. It is already visited. " + str(successor))
+                if is_visited:
+                    if is_debug:
+                        logger.debug("Skip adding successor decision. It is already visited. %s", successor)
                     self.num_decisions -= 1
+                    tree.remove_pending(node.parent)
                 else:
+                    index = tree.add(successor, node.parent, move, node.depth)
+
+                    # The objective of the successor is the priority of its move, if objective deltas
+                    if is_delta:
+                        tree.objectives[index] = node.objective
+                    if stats:
+                        stats.depth_histogram[node.depth] += 1
+                    if move_ordering:
+                        move_ordering.update_success(move, node.depth)
+
                     # Create dot node transition
                     self._log_dot(current, move, successor, color="")
 
-                    # Check termination, else expand successor state with possible moves for execution within depth
-                    is_terminate, is_solution = self._is_terminate_or_expand(successor, goal_state, exploration_type, max_depth)
-                    if is_solution:
-                        if is_solution_path:
-                            self.solution_path = self._get_solution_path()
-                        return True
-                    if is_terminate:
-                        return False
+                    # Keep the best path cost, if cost search
+                    if is_cost:
+                        self.closed.insert(successor, cost)
+
+                    if is_deferred:
+                        # Defer the termination check and expansion to the order of f, if best first cost search
+                        f = cost + (self._memo.get_heuristic(successor) if self._memo else successor.get_heuristic())
+                        tree.add_pending(index, 1)
+                        self._open.insert(Node(index, None, node.depth, f), f)
+                    else:
+                        # Check termination, else expand successor state with possible moves within depth
+                        is_terminate, is_solution = self._is_terminate_or_expand(successor, index, goal_state,
+                                                                                 exploration_type, max_depth,
+                                                                                 node.discrepancies)
+                        if is_solution:
+                            self._save_solution(is_solution_path)
+                            return True
+                        if is_terminate:
+                            return False
             else:
-                # Skip failed move and infeasible successor, reset failed transition
-                successor._transition = None
+                # Skip failed move and infeasible successor
                 self.num_failed_decisions += 1
-                self._log("Skip infeasible successor. Num fails: " + str(self.num_failed_decisions))
+                if is_debug:
+                    logger.debug("Skip infeasible successor. Num fails: %d", self.num_failed_decisions)
 
                 # Create dot node transition to a failed node
                 self._log_dot(current, move, None, color=Constants.FAIL_NODE_COLOR)
 
+                if on_execute_fail:
+                    self._dispatch(on_execute_fail, current, move)
+
+                successor = None
+                tree.remove_pending(node.parent)
+
+            # Report progress periodically
+            if on_progress:
+                self._dispatch_progress(on_progress)
+
             # Check stopping conditions before next iteration. If hits a limit, color last successor state
             if self._is_search_limit(successor, self._start_time, self.num_decisions, max_runtime, max_moves):
                 return False
 
+            # Restart from the initial state when the run reaches its cutoff, if restarts
+            if self.num_decisions - self._run_start_decisions >= self._run_cutoff:
+                self._start_next_run(exploration_type, search_type)
+                is_terminate, is_solution = self._expand_roots(initial_states, goal_state, exploration_type,
+                                                               max_depth)
+                if is_solution:
+                    self._save_solution(is_solution_path)
+                    return True
+                if is_terminate:
+                    return False
+
         # No more open decisions left or limit reach and search finished, save the dot and return False
         self.total_time = time.perf_counter() - self._start_time
-        self._log_finish("<<< FINISH SEARCH - FAILURE - No solution! ")
+        self._finish_search("<<< FINISH SEARCH - FAILURE - No solution! ")
+        self._log_dot_file()
+        return False
+
+    def _search_mcts(self, initial_state, goal_state, exploration_type, is_solution_path,
+                     max_depth, max_moves, max_runtime) -> bool:
+        rng = random.Random(Constants.default_seed if exploration_type.seed is None else exploration_type.seed)
+        num_workers = exploration_type.num_workers
+        on_progress = self._hooks[Hook.ON_PROGRESS]
+
+        # Root node from the given initial state
+        root = MCTSNode(cp.deepcopy(initial_state))
+        root.state.id = 0
+        if root.state.is_terminate(goal_state):
+            return self._save_mcts_solution(root, [], root.state, is_solution_path)
+
+        # Rollouts of a batch are played in parallel, if more than one worker
+        pool = ProcessPoolExecutor(num_workers) if num_workers > 1 else None
+        try:
+            num_iterations = 0
+            while num_iterations < exploration_type.iterations:
+
+                # Select and expand a batch of leaves, checking new leaves for termination
+                leaves = []
+                for _ in range(min(num_workers, exploration_type.iterations - num_iterations)):
+                    leaf = self._mcts_select_expand(root, exploration_type.exploration_constant, max_depth, rng)
+                    if leaf.num_visits == 0 and leaf.state.is_terminate(goal_state):
+                        return self._save_mcts_solution(leaf, [], leaf.state, is_solution_path)
+                    leaves.append(leaf)
+
+                    if on_progress:
+                        self._dispatch_progress(on_progress)
+                    if self._is_search_limit(leaf.state, self._start_time, self.num_decisions,
+                                             max_runtime, max_moves):
+                        return False
+                num_iterations += len(leaves)
+
+                # Play a rollout from every leaf, within the depth limit
+                args = ([leaf.state for leaf in leaves],
+                        [goal_state] * len(leaves),
+                        [min(exploration_type.rollout_depth, max_depth - leaf.depth) for leaf in leaves],
+                        [exploration_type.rollout_policy] * len(leaves),
+                        [rng.randrange(2 ** 31) for _ in leaves])
+                results = pool.map(rollout, *args) if pool else map(rollout, *args)
+
+                # Backpropagate the reward of every rollout, and keep the best state
+                for leaf, (is_goal, objective, moves, state) in zip(leaves, results):
+                    if is_goal:
+                        return self._save_mcts_solution(leaf, moves, state, is_solution_path)
+                    if objective is not None and (self.best_objective is None or objective < self.best_objective):
+                        self.best_state, self.best_objective = state, objective
+                        self.best_moves = leaf.get_moves() + moves
+                    reward = -objective if objective is not None else 0.0
+                    node = leaf
+                    while node is not None:
+                        node.num_visits += 1
+                        node.total_reward += reward
+                        node = node.parent
+        finally:
+            if pool:
+                pool.shutdown()
+
+        # No termination state found within the iterations, the best state is kept
+        self.total_time = time.perf_counter() - self._start_time
+        self._finish_search("<<< FINISH SEARCH - FAILURE - No solution! ")
+        self._log_dot_file()
+        return False
+
+    def _mcts_select_expand(self, node, exploration_constant, max_depth, rng) -> MCTSNode:
+
+        # Select the child with the highest upper confidence bound until a node with untried moves
+        while True:
+            if node.untried_moves is None:
+                node.untried_moves = list(node.state.get_moves()) if node.depth < max_depth else []
+            if node.untried_moves or not node.children:
+                break
+            node = node.select_child(exploration_constant)
+
+        # Expand a random untried move, failed moves are dropped
+        while node.untried_moves:
+            move = node.untried_moves.pop(rng.randrange(len(node.untried_moves)))
+            self.num_decisions += 1
+            successor = None
+            if node.state.is_feasible(move):
+                successor = cp.deepcopy(node.state)
+                if not successor.execute(move):
+                    successor = None
+            if successor is not None and self._hooks[Hook.ON_GENERATE]:
+                if not self._dispatch(self._hooks[Hook.ON_GENERATE], node.state, move, successor):
+                    successor = None
+
+            if successor is not None:
+                successor.id = self.num_decisions - self.num_failed_decisions
+                child = MCTSNode(successor, node, move)
+                node.children.append(child)
+                self._log_dot(node.state, move, successor, color="")
+                return child
+
+            self.num_failed_decisions += 1
+            self._log_dot(node.state, move, None, color=Constants.FAIL_NODE_COLOR)
+            if self._hooks[Hook.ON_EXECUTE_FAIL]:
+                self._dispatch(self._hooks[Hook.ON_EXECUTE_FAIL], node.state, move)
+
+        # Dead end, or every move failed, so the rollout starts from the node itself
+        return node
+
+    def _save_mcts_solution(self, node, rollout_moves, state, is_solution_path) -> bool:
+
+        # Add the tree path to the search tree, followed by the rollout states rebuilt by replaying its moves
+        path = []
+        while node is not None:
+            path.append(node)
+            node = node.parent
+        path.reverse()
+        tree = self._tree
+        index = NO_PARENT
+        for depth, path_node in enumerate(path):
+            index = tree.add(path_node.state, index, path_node.move, depth)
+        current = path[-1].state
+        for i, move in enumerate(rollout_moves):
+            if is_solution_path and i < len(rollout_moves) - 1:
+                current = cp.deepcopy(current)
+                current.execute(move)
+            else:  # intermediate states are released anyway if the path is not kept
+                current = state
+            index = tree.add(current, index, move, len(path) + i)
+
+        self.solution_state = state
+        self._solution_index = index
+        self.total_time = time.perf_counter() - self._start_time
+        if self._hooks[Hook.ON_SOLUTION]:
+            self._dispatch(self._hooks[Hook.ON_SOLUTION], state)
+        self._log("Successful termination for state: %s", state)
+        self._finish_search("<<< FINISH SEARCH - SUCCESS - Solution Found!")
+        self._log_dot(None, None, state, color=Constants.SUCCESS_NODE_COLOR)
+        self._log_dot_file()
+        self._save_solution(is_solution_path)
+        return True
+
+    def _search_local(self, initial_state, goal_state, exploration_type, max_moves, max_runtime) -> bool:
+        rng = random.Random(Constants.default_seed if exploration_type.seed is None else exploration_type.seed)
+        is_annealing = isinstance(exploration_type, ExplorationType.SimulatedAnnealing)
+        is_first_improvement = getattr(exploration_type, "is_first_improvement", False)
+        tabu = TabuList(exploration_type.tenure) if isinstance(exploration_type, ExplorationType.TabuSearch) else None
+        temperature = exploration_type.initial_temperature if is_annealing else 0
+        on_progress = self._hooks[Hook.ON_PROGRESS]
+
+        # Moves are executed in place and rejected moves are undone, if the state implements undo
+        state = cp.deepcopy(initial_state)
+        is_undo = type(state).undo is not BaseState.undo
+        objective = state.get_objective()
+        self._update_best(state, objective, is_undo)
+
+        while True:
+            if state.is_terminate(goal_state):
+                self.solution_state = state
+                self.total_time = time.perf_counter() - self._start_time
+                if self._hooks[Hook.ON_SOLUTION]:
+                    self._dispatch(self._hooks[Hook.ON_SOLUTION], state)
+                self._log("Successful termination for state: %s", state)
+                self._finish_search("<<< FINISH SEARCH - SUCCESS - Solution Found!")
+                self._log_dot_file()
+                return True
+
+            moves = list(state.get_moves())
+            if not moves:
+                break
+
+            if is_annealing:
+                # Accept a random move if it improves, else with a probability that decreases with the temperature
+                move = rng.choice(moves)
+                successor = self._execute_local(state, move, is_undo)
+                if successor is not None:
+                    successor_objective = successor.get_objective()
+                    delta = successor_objective - objective
+                    if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+                        state, objective = successor, successor_objective
+                        if objective < self.best_objective:
+                            self._update_best(state, objective, is_undo)
+                    elif is_undo:
+                        state.undo(move)
+                temperature *= exploration_type.cooling_rate
+            else:
+                # Move to the best successor, or the first improving one, in random order to break ties
+                rng.shuffle(moves)
+                best_move, best_successor, best_objective = None, None, objective if tabu is None else float("inf")
+                for move in moves:
+                    successor = self._execute_local(state, move, is_undo)
+                    if successor is None:
+                        continue
+                    successor_objective = successor.get_objective()
+                    if is_undo:
+                        state.undo(move)
+
+                    # Tabu moves are allowed only if they improve the best objective
+                    if successor_objective < best_objective and \
+                            (tabu is None or successor_objective < self.best_objective or not tabu.contains(move)):
+                        best_move, best_successor, best_objective = move, successor, successor_objective
+                        if is_first_improvement:
+                            break
+
+                # Local optimum, no move improves the objective
+                if best_move is None:
+                    break
+
+                if is_undo:
+                    state.execute(best_move)
+                else:
+                    state = best_successor
+                objective = best_objective
+                if tabu is not None:
+                    tabu.insert(best_move)
+                if objective < self.best_objective:
+                    self._update_best(state, objective, is_undo)
+
+            if on_progress:
+                self._dispatch_progress(on_progress)
+            if self._is_search_limit(state, self._start_time, self.num_decisions, max_runtime, max_moves):
+                return False
+            if is_annealing and temperature < exploration_type.min_temperature:
+                break
+
+        # Local optimum, no moves, or cold temperature, the best state is kept
+        self.total_time = time.perf_counter() - self._start_time
+        self._finish_search("<<< FINISH SEARCH - FAILURE - No solution! ")
         self._log_dot_file()
         return False
 
-    def _is_terminate_or_expand(self, state, goal_state, exploration_type, max_depth) -> Tuple[bool, bool]:
+    def _execute_local(self, state, move, is_undo) -> Optional[BaseState]:
+        # Returns the successor, which is the state itself if undo, or None if the move fails
+        self.num_decisions += 1
+        successor = None
+        if state.is_feasible(move):
+            successor = state if is_undo else cp.deepcopy(state)
+            if not successor.execute(move):
+                successor = None
+        if successor is None:
+            self.num_failed_decisions += 1
+            if self._hooks[Hook.ON_EXECUTE_FAIL]:
+                self._dispatch(self._hooks[Hook.ON_EXECUTE_FAIL], state, move)
+        return successor
+
+    def _update_best(self, state, objective, is_undo) -> None:
+        # The current state changes in place if undo, so the best state is a copy
+        self.best_state = cp.deepcopy(state) if is_undo else state
+        self.best_objective = objective
+        self._log("New best objective: %s", objective)
+
+    def _expand_roots(self, initial_states, goal_state, exploration_type, max_depth) -> Tuple[bool, bool]:
+        stats = self._stats
+        clock = self.stats.clock
+
+        for initial_state in initial_states:
+            # Root node from a copy of the given initial state, which is left unchanged
+            if stats:
+                t = clock()
+            root = cp.deepcopy(initial_state)
+            if stats:
+                stats.record(SearchStats.COPY, t)
+            root_index = self._tree.add(root, NO_PARENT, None, 0)
+            root.id = root_index
+            if self._is_cost:
+                self.closed.insert(root, root.get_path_cost())
+            if stats:
+                stats.depth_histogram[0] += 1
+
+            # Check termination, else expand current state with possible moves
+            # as open decisions for execution within depth
+            is_terminate, is_solution = self._is_terminate_or_expand(root, root_index, goal_state,
+                                                                     exploration_type, max_depth)
+            if is_terminate:
+                return is_terminate, is_solution
+        return False, False
+
+    def _is_terminate_or_expand(self, state, index, goal_state, exploration_type, max_depth,
+                                discrepancies=0) -> Tuple[bool, bool]:
 
         is_terminate, is_solution = False, False
+        stats = self._stats
+        clock = self.stats.clock
+        tree = self._tree
+        depth = tree.depths[index]
 
         # Check termination condition -- decided by the user state!
-        if state.is_terminate(goal_state):
+        if stats:
+            t = clock()
+        is_goal = state.is_terminate(goal_state) if self._goals is None else self._is_goal(state, index)
+        if stats:
+            stats.record(SearchStats.IS_TERMINATE, t)
+        if is_goal:
             is_terminate, is_solution = True, True
             self.solution_state = state
+            self._solution_index = index
             self.total_time = time.perf_counter() - self._start_time
-            self._log("Successful termination for state: " + str(state))
-            self._log_finish("<<< FINISH SEARCH - SUCCESS - Solution Found!")
-            move = state._transition.move if state._transition else None
-            self._log_dot(None, move, state, color=Constants.SUCCESS_NODE_COLOR)  # mark it green
+            if self._hooks[Hook.ON_SOLUTION]:
+                self._dispatch(self._hooks[Hook.ON_SOLUTION], state)
+            self._log("Successful termination for state: %s", state)
+            self._finish_search("<<< FINISH SEARCH - SUCCESS - Solution Found!")
+            self._log_dot(None, tree.moves[index], state, color=Constants.SUCCESS_NODE_COLOR)  # mark it green
             self._log_dot_file()
             return is_terminate, is_solution
         else:
-            self._log("Successor is not termination, add alternative moves")
+            if self._is_debug:
+                logger.debug("Successor is not termination, add alternative moves")
 
         # If still within max depth bound, insert the successor into open states for exploration
-        # Initial state does not have transition, so skip max depth for initial state
-        if state._transition:
-            if state._transition.depth >= max_depth:
-                # Don't terminate the whole search, but don't generate new open nodes
-                self._log("Max depth reached, not inserting new open node.")
-                self._log_dot(None, state._transition.move, state, color=Constants.LIMIT_NODE_COLOR)
-                return is_terminate, is_solution
+        # Initial state is at depth zero, so max depth, which is positive, never applies to it
+        if depth >= max_depth:
+            # Don't terminate the whole search, but don't generate new open nodes
+            self._log("Max depth reached, not inserting new open node.")
+            self._log_dot(None, tree.moves[index], state, color=Constants.LIMIT_NODE_COLOR)
+            if self._hooks[Hook.ON_LIMIT]:
+                self._dispatch(self._hooks[Hook.ON_LIMIT], state, "Max depth reached " + str(max_depth))
+            tree.release(index)
+            return is_terminate, is_solution
 
         # If no termination, add alternative moves to search -- decided by the user state!
-        moves = state.get_moves()
+        if stats:
+            t = clock()
+        memo = self._memo
+        moves = memo.get_moves(state) if memo else state.get_moves()
+        if stats:
+            stats.record(SearchStats.GET_MOVES, t)
+
+        # Randomize the order of moves, if restarts
+        if self._rng and self._restart.is_randomized:
+            self._rng.shuffle(moves)
+
+        # Callbacks can prune or reorder the moves
+        on_expand = self._hooks[Hook.ON_EXPAND]
+        if on_expand:
+            for callback in on_expand:
+                result = callback(self, state, moves)
+                if result is not None:
+                    moves = list(result)
+
+        # Explore the most promising moves first, if move ordering
+        if self._move_ordering:
+            moves = self._move_ordering.order(moves, depth + 1)
+
+        if stats:
+            stats.branching_histogram[len(moves)] += 1
+
+        # Any move other than the first is a discrepancy, only the first move is left at the discrepancy limit
+        is_lds = isinstance(exploration_type, ExplorationType.LimitedDiscrepancy)
+        if is_lds and discrepancies >= self._discrepancy_limit and len(moves) > 1:
+            moves = moves[:1]
+            self._is_discrepancy_cut = True
+
+        # The state is needed until every move is executed, otherwise it is released right away
+        if not moves:
+            tree.release(index)
+            return is_terminate, is_solution
+        tree.add_pending(index, len(moves))
+
+        # Successors are not executed yet, so they share the objective of the expanded state,
+        # or the objective of the state plus the delta of their move, if objective deltas
+        objective = None
+        is_best_first = isinstance(exploration_type, ExplorationType.BestFirst)
+        if is_best_first:
+            if stats:
+                t = clock()
+            if self._is_cost:
+                objective = state.get_path_cost() + (memo.get_heuristic(state) if memo else state.get_heuristic())
+            elif self._is_delta and tree.objectives[index] is not None:
+                objective = tree.objectives[index]
+            else:
+                objective = memo.get_objective(state) if memo else state.get_objective()
+            if stats:
+                stats.record(SearchStats.GET_OBJECTIVE, t)
+            tree.objectives[index] = objective
 
         # Reverse moves for depth first search, so the exploration follows user move order
-        if isinstance(exploration_type, ExplorationType.DepthFirst):
+        first_move = moves[0]
+        if is_lds or isinstance(exploration_type, ExplorationType.DepthFirst):
             moves.reverse()
 
         # Search for alternatives
+        is_debug = self._is_debug
+        next_depth = depth + 1
         for move in moves:
-            self._log("Decision for move: " + str(move))
-
-            # Create a copy successor with next transition
-            successor_state = cp.deepcopy(state)
-            transition = state._transition
-            next_depth = transition.depth + 1 if transition else 1
-            next_transition = Transition(previous_state=state, move=move, depth=next_depth)
-            successor_state._transition = next_transition
+            if is_debug:
+                logger.debug("Decision for move: %s", move)
+                logger.debug("Add open decision for executing %s on state\n%s", move, state)
+
+            # Push the move to open storage for execution, the successor state is created when it is removed
+            if stats:
+                t = clock()
+            if is_best_first:
+                move_objective = objective + state.get_objective_delta(move) if self._is_delta else objective
+                self._open.insert(Node(index, move, next_depth, move_objective), move_objective)
+            elif is_lds:
+                self._open.insert(Node(index, move, next_depth,
+                                       discrepancies=discrepancies + (move is not first_move)))
+            else:
+                self._open.insert(Node(index, move, next_depth))
+            if stats:
+                stats.record(SearchStats.OPEN_INSERT, t)
 
-            # Push successor to open storage for execution
-            self._log("Add open decision for executing " + str(successor_state._transition.move) + " on state\n" + str(state))
-            self._open.insert(successor_state)
+        if stats:
+            stats.record_open_size(self._open.size())
 
         return is_terminate, is_solution
 
+    def _is_goal(self, state, index) -> bool:
+        # Settle the goal the first time it is reached, and keep its path, until enough goals are reached
+        key = state.get_key()
+        if key in self._goals and key not in self._settled:
+            self._settled[key] = index
+            self._tree.add_pending(index, 1)
+            self._log("Goal %d of %d reached: %s", len(self._settled), self._num_goals, state)
+            if len(self._settled) < self._num_goals and self._hooks[Hook.ON_SOLUTION]:
+                self._dispatch(self._hooks[Hook.ON_SOLUTION], state)
+        return len(self._settled) >= self._num_goals
+
+    def _save_goal_solutions(self) -> None:
+        # Moves and path cost are always saved, while the paths of states are kept only if requested
+        tree = self._tree
+        for key, index in self._settled.items():
+            state = tree.get_state(index)
+            path = SolutionPath(tree, index) if self._is_solution_path else None
+            self.solutions[key] = Solution(state, tree.get_moves(index), path, state.get_path_cost())
+        if self._is_solution_path:
+            tree.retain_paths(self._settled.values())
+        else:
+            tree.clear_states()
+
+    def _create_storage(self, storage_type) -> Optional[BaseStorage]:
+        # Reuse the cleared storage of the same type and fields, if searching many queries
+        if self._storages is None:
+            return StorageFactory.create(storage_type)
+        key = (type(storage_type), storage_type)
+        storage = self._storages.get(key)
+        if storage is None or type(storage).clear is BaseStorage.clear:
+            storage = self._storages[key] = StorageFactory.create(storage_type)
+        else:
+            storage.clear()
+        return storage
+
+    def _get_query_args(self, args, query, is_first) -> Dict[str, Any]:
+        # Plain queries only change the initial state, so the shared arguments are validated with the first query
+        if isinstance(query, dict):
+            query_args = dict(args, **query)
+        else:
+            query_args = dict(args, initial_state=query)
+        if is_first or isinstance(query, dict):
+            Explorateur._validate_search_args(*[query_args[name] for name in
+                                                inspect.signature(Explorateur.search).parameters
+                                                if name != "self"])
+        else:
+            Explorateur._validate_initial_state(query)
+        return query_args
+
+    def _get_result(self, is_solution, is_path_copied) -> SearchResult:
+        # Paths are views of the search tree, copied to lists to leave a worker process
+        path, solutions = self.solution_path, self.solutions
+        if is_path_copied:
+            path = list(path) if path is not None else None
+            solutions = {key: solution._replace(path=list(solution.path) if solution.path is not None else None)
+                         for key, solution in solutions.items()}
+        return SearchResult(is_solution, self.solution_state, self.solution_moves, path, solutions,
+                            self.best_state, self.best_objective,
+                            self.num_decisions, self.num_failed_decisions, self.total_time)
+
+    def _start_next_run(self, exploration_type, search_type) -> None:
+        end_time = time.perf_counter()
+        self._record_run(end_time)
+        self.num_restarts += 1
+        self._log("Restart %d after %d decisions", self.num_restarts, self._run_cutoff)
+
+        # The last run has no cutoff, so that the search stays complete
+        restart = self._restart
+        if restart.max_restarts is not None and self.num_restarts >= restart.max_restarts:
+            self._run_cutoff = float("inf")
+        else:
+            self._run_cutoff = get_cutoff(restart, self.num_restarts)
+        self._run_start_decisions = self.num_decisions
+        self._run_start_failed_decisions = self.num_failed_decisions
+        self._run_start_time = end_time
+
+        # Drop the open decisions and visited states of the run, and optionally, what was learned
+        self._open = self._create_storage(exploration_type)
+        self.closed = self._create_storage(search_type)
+        self._tree.retain_paths(self._settled.values())  # goals reached in earlier runs stay reached
+        if not restart.is_learning_kept:
+            if self.nogoods:
+                self.nogoods.clear()
+            if self._move_ordering:
+                self._move_ordering.reset()
+
+    def _record_run(self, end_time) -> None:
+        self.stats.record_restart(self._run_cutoff,
+                                  self.num_decisions - self._run_start_decisions,
+                                  self.num_failed_decisions - self._run_start_failed_decisions,
+                                  end_time - self._run_start_time)
+
     def _is_search_limit(self, state, start, num_moves, max_runtime, max_moves):
         # Check max_runtime
         stop_cause = None
@@ -269,15 +1154,37 @@ class Explorateur:
         if num_moves >= max_moves:
             stop_cause = "Max number of moves reached " + str(max_moves)
 
+        # Check stop requested by a callback
+        if self._stop_cause:
+            stop_cause = self._stop_cause
+
         # If stopped, log, save dot, and return None solution
         if stop_cause:
             self.total_time = current_time - start
-            self._log_finish("<<< FINISH SEARCH - STOP - No solution! " + stop_cause)
-            self._log_dot(None, state._transition.move, state, color=Constants.LIMIT_NODE_COLOR)  # mark it green
+            self._finish_search("<<< FINISH SEARCH - STOP - No solution! " + stop_cause)
+            if state:  # failed successors are not in the tree to color
+                self._log_dot(None, None, state, color=Constants.LIMIT_NODE_COLOR)
             self._log_dot_file()
+            if self._hooks[Hook.ON_LIMIT]:
+                self._dispatch(self._hooks[Hook.ON_LIMIT], state, stop_cause)
             return True
         return False
 
+    def _save_solution(self, is_solution_path: bool) -> None:
+        # Moves are always saved, while the path of states is kept only if requested
+        self.solution_moves = self._tree.get_moves(self._solution_index)
+        if self._move_ordering:
+            self._move_ordering.update_solution(self.solution_moves)
+        if self._goals is not None:
+            # The paths of every goal are already kept, the last goal reached is the solution
+            if is_solution_path:
+                self.solution_path = SolutionPath(self._tree, self._solution_index)
+        elif is_solution_path:
+            self._tree.retain_path(self._solution_index)
+            self.solution_path = SolutionPath(self._tree, self._solution_index)
+        else:
+            self._tree.clear_states()
+
     def _get_solution_path(self, is_initial_first=False) -> List[BaseState]:
         """
         Returns a list of states representing the order in which the search was performed.
@@ -292,43 +1199,34 @@ class Explorateur:
             List[BaseState]: A list of BaseState objects representing the search path.
 
         """
-        # TODO convert recursion to iteration
-        state_list = []
-
-        # We can only trace a path if a solution state is found
-        if self.solution_state:
-            # Start the path from the solution state, and walk backwards
-            self._get_path_helper(self.solution_state, state_list)
-
-        return state_list.reverse() if is_initial_first else state_list
-
-    def _get_path_helper(self, state: BaseState, state_list: list):
-        """
-        This helper recursion traces back explored states explored in reverse order.
-
-        Parameters:
-            state (_State): The current state being explored.
-            state_list (list): The list to store the explored states.
-
-        Returns:
-            list: The list of explored states in reverse order.
-        """
-        transition = state._transition
-
-        # We reached the initial state, add it and return the path
-        if transition is None:
-            state_list.append(state)
-            return state_list
-
-        # Otherwise, append the base user state to the state list
-        state_list.append(state)
-
-        # Continue recursion from the previous internal state
-        self._get_path_helper(transition.previous_state, state_list)
-
-    def _log(self, text):
-        if self.is_verbose:
-            print(text)
+        # We can only trace a path if a solution path is saved
+        if not self.solution_path:
+            return []
+
+        # Start the path from the solution state, and walk backwards
+        state_list = list(self.solution_path)
+        if is_initial_first:
+            state_list.reverse()
+        return state_list
+
+    def _dispatch(self, callbacks, *args) -> bool:
+        # Call every callback, and return False if any callback returns False
+        is_accepted = True
+        for callback in callbacks:
+            if callback(self, *args) is False:
+                is_accepted = False
+        return is_accepted
+
+    def _dispatch_progress(self, progress_callbacks) -> None:
+        # Call every progress callback that is due by its own interval
+        for progress in progress_callbacks:
+            if progress.is_due(self.num_decisions):
+                progress.callback(self)
+
+    def _log(self, msg, *args):
+        # Arguments are formatted lazily by the logger, only when the message is emitted
+        if self._is_debug:
+            logger.debug(msg, *args)
 
     def _log_dot(self, current, move, successor, color):
         if not self._dot_filename:
@@ -356,50 +1254,153 @@ class Explorateur:
                 dot_file.write(self._dot_text)
 
     def _log_start(self, info, max_depth, max_moves, max_runtime):
-        self._log("\n" + info +
-                  "\nMax Depth: " + str(max_depth) +
-                  "\nMax Moves: " + str(max_moves) +
-                  "\nMax Time: " + str(max_runtime) + "\n")
+        self._log("\n%s\nMax Depth: %s\nMax Moves: %s\nMax Time: %s\n",
+                  info, max_depth, max_moves, max_runtime)
+
+    def _finish_search(self, info) -> None:
+        # Every exit of the search saves the goals reached, the last run, and the statistics, then logs them
+        if self._goals is not None:
+            self._save_goal_solutions()
+        if self._restart:
+            # The last run ends with the search, so that the runs add up to the total time
+            self._record_run(self._start_time + self.total_time)
+        self.stats.finalize(self.num_decisions, self.num_failed_decisions, self.total_time,
+                            self._tree.num_replayed_moves)
+        self._log_finish(info)
 
     def _log_finish(self, info):
-        self._log("\n" + info +
-                  "\nTotal Decisions: " + str(self.num_decisions) +
-                  "\nTotal Failures: " + str(self.num_failed_decisions) +
-                  "\nTotal Time: " + str(round(self.total_time, 3)) + "\n")
-
-    def _reset_search(self, dot_filename):
+        self._log("\n%s\nTotal Decisions: %d\nTotal Failures: %d\nTotal Time: %.3f\n",
+                  info, self.num_decisions, self.num_failed_decisions, self.total_time)
+        if isinstance(self.closed, BloomFilter):
+            self._log("Bitstate Memory: %d bytes\nEstimated Visited: %.0f\nEstimated Coverage: %.6f\n",
+                      self.closed.memory, self.closed.estimated_num_states, self.closed.estimated_coverage)
+        elif isinstance(self.closed, BoundedHashSet):
+            self._log("Closed Evictions: %d\n", self.closed.num_evictions)
+            if self.closed.is_readmission_counted:
+                self._log("Closed Readmissions: %d\n", self.closed.num_readmissions)
+        elif isinstance(self.closed, CostTable):
+            self._log("Dominated Duplicates: %d\nReopened States: %d\n",
+                      self.closed.num_dominated, self.closed.num_reopened)
+        if self._memo:
+            self._log("Memo Hits: %d\nMemo Misses: %d\n", self._memo.num_hits, self._memo.num_misses)
+
+    def _reset_search(self, dot_filename, stats_level=SearchStats.OFF,
+                      snapshot_interval=None, snapshot_cache_size=1000):
 
         # Clean solution states
         self.solution_state = None
         self.solution_path = None
+        self.solution_moves = None
+        self.best_state = None
+        self.best_moves = None
+        self.best_objective = None
+        self.solutions = {}
+        self._settled = {}
 
         # Clean state collections
         self._open = None
         self.closed = None
+        self._tree = SearchTree(snapshot_interval, snapshot_cache_size)
+        self._solution_index = NO_PARENT
+
+        # Restarts start with the first run
+        self.num_restarts = 0
+        self._run_start_decisions = 0
+        self._run_start_failed_decisions = 0
+        self._run_cutoff = float("inf")
+
+        # Limited discrepancy search starts with no discrepancies
+        self._discrepancy_limit = 0
+        self._is_discrepancy_cut = False
 
         # Initialize counters
         self._start_time = time.perf_counter()
+        self._run_start_time = self._start_time
         self.total_time = 0
         self.num_decisions = 0
         self.num_failed_decisions = 0
+        self.stats = SearchStats(stats_level)
+        self._stats = self.stats if stats_level > SearchStats.OFF else None
+
+        # Progress callbacks and stop requests
+        for progress in self._hooks[Hook.ON_PROGRESS]:
+            progress.reset(self._start_time)
+        self._stop_cause = None
 
         # Dot graph text representation of search, used if dot file given
         self._dot_text = "digraph G {\nspline=line;\n"
         self._dot_filename = dot_filename
 
+    @staticmethod
+    def _enable_verbose_logging() -> None:
+        # Respect any handlers configured by the application, otherwise print messages to stdout
+        if not logger.hasHandlers():
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+        if logger.getEffectiveLevel() > logging.DEBUG:
+            logger.setLevel(logging.DEBUG)
+
     @staticmethod
     def _validate_args(is_verbose) -> None:
         check_true(isinstance(is_verbose, bool),
                    TypeError("is_verbose must be boolean " + str(is_verbose)))
 
     @staticmethod
-    def _validate_search_args(initial_state, goal_state,
-                              exploration_type, search_type, is_solution_path,
-                              max_depth, max_moves, max_runtime, dot_file_path) -> None:
+    def _validate_hook_args(event, callback, every_decisions, every_seconds) -> None:
+        check_true(event in Hook.ALL, ValueError("Unknown search event: " + str(event)))
+        check_true(callable(callback), TypeError("Callback must be callable. Incorrect: " + str(callback)))
 
+        if event == Hook.ON_PROGRESS:
+            check_true(every_decisions is not None or every_seconds is not None,
+                       ValueError("Progress callback requires every_decisions or every_seconds."))
+        else:
+            check_true(every_decisions is None and every_seconds is None,
+                       ValueError("every_decisions and every_seconds are only used for " + Hook.ON_PROGRESS))
+
+        if every_decisions is not None:
+            check_true(isinstance(every_decisions, int) and every_decisions > 0,
+                       ValueError("every_decisions must be a positive integer. Incorrect: " + str(every_decisions)))
+        if every_seconds is not None:
+            check_true(isinstance(every_seconds, (int, float)) and every_seconds > 0,
+                       ValueError("every_seconds must be positive. Incorrect: " + str(every_seconds)))
+
+    @staticmethod
+    def _validate_initial_state(initial_state) -> None:
         check_true(initial_state is not None, ValueError("Initial state cannot be none."))
-        check_true(isinstance(initial_state, BaseState),
-                   TypeError("Initial state must be BaseState type. Incorrect type: " + str(type(goal_state))))
+        if isinstance(initial_state, list):
+            check_true(len(initial_state) > 0 and all(isinstance(state, BaseState) for state in initial_state),
+                       TypeError("Initial states must be a non-empty list of BaseState type. Incorrect: " +
+                                 str(initial_state)))
+        else:
+            check_true(isinstance(initial_state, BaseState),
+                       TypeError("Initial state must be BaseState type. Incorrect type: " + str(type(initial_state))))
+
+    @staticmethod
+    def _validate_search_args(initial_state, goal_state,
+                              exploration_type, search_type, is_solution_path,
+                              max_depth, max_moves, max_runtime, dot_file_path, stats_level,
+                              snapshot_interval=None, snapshot_cache_size=1000, nogood_cache_size=None,
+                              move_ordering=None, restart=None, goal_keys=None, num_goals=None,
+                              memo_cache=None) -> None:
+
+        Explorateur._validate_initial_state(initial_state)
+
+        # Monte Carlo tree search and local search start from a single state, and have no goal keys
+        if isinstance(exploration_type, (ExplorationType.MCTS, ExplorationType.HillClimbing,
+                                         ExplorationType.SimulatedAnnealing, ExplorationType.TabuSearch)):
+            check_true(not isinstance(initial_state, list) and goal_keys is None,
+                       ValueError("Multiple initial states and goal keys are not supported by " +
+                                  type(exploration_type).__name__))
+
+        if goal_keys is not None:
+            check_true(not isinstance(goal_keys, (str, bytes)) and isinstance(goal_keys, Iterable),
+                       TypeError("goal_keys must be an iterable of state keys. Incorrect: " + str(goal_keys)))
+        if num_goals is not None:
+            check_true(goal_keys is not None, ValueError("num_goals requires goal_keys."))
+            check_true(isinstance(num_goals, int),
+                       TypeError("num_goals must be integer number of goals. Incorrect: " + str(num_goals)))
+            check_true(num_goals > 0, ValueError("num_goals must be positive. Incorrect: " + str(num_goals)))
 
         if goal_state is not None:
             check_true(isinstance(goal_state, BaseState),
@@ -436,3 +1437,157 @@ class Explorateur:
         if dot_file_path is not None:
             check_true(isinstance(dot_file_path, str),
                        TypeError("dot_file_path must be a string. Incorrect type: " + str(type(dot_file_path))))
+
+        check_true(stats_level in (SearchStats.OFF, SearchStats.LOW, SearchStats.HIGH),
+                   ValueError("stats_level must be SearchStats.OFF, LOW, or HIGH. Incorrect: " + str(stats_level)))
+
+        if isinstance(search_type, SearchType.BitstateSearch):
+            check_true(isinstance(search_type.expected_num_states, int),
+                       TypeError("expected_num_states must be integer number of states. Incorrect: " +
+                                 str(search_type.expected_num_states)))
+            check_true(search_type.expected_num_states > 0,
+                       ValueError("expected_num_states must be positive. Incorrect: " +
+                                  str(search_type.expected_num_states)))
+            check_true(0 < search_type.false_positive_rate < 1,
+                       ValueError("false_positive_rate must be between 0 and 1. Incorrect: " +
+                                  str(search_type.false_positive_rate)))
+
+        if isinstance(exploration_type, ExplorationType.MCTS):
+            for name in ("iterations", "rollout_depth", "num_workers"):
+                value = getattr(exploration_type, name)
+                check_true(isinstance(value, int),
+                           TypeError(name + " must be integer. Incorrect: " + str(value)))
+                check_true(value > 0, ValueError(name + " must be positive. Incorrect: " + str(value)))
+            check_true(exploration_type.exploration_constant >= 0,
+                       ValueError("exploration_constant must be non-negative. Incorrect: " +
+                                  str(exploration_type.exploration_constant)))
+            if exploration_type.rollout_policy is not None:
+                check_true(callable(exploration_type.rollout_policy),
+                           TypeError("rollout_policy must be callable. Incorrect type: " +
+                                     str(type(exploration_type.rollout_policy))))
+
+        if isinstance(exploration_type, ExplorationType.BestFirst):
+            if exploration_type.key_range is not None:
+                check_true(isinstance(exploration_type.key_range, tuple) and len(exploration_type.key_range) == 2 and
+                           all(isinstance(key, int) for key in exploration_type.key_range),
+                           TypeError("key_range must be a tuple of two integers. Incorrect: " +
+                                     str(exploration_type.key_range)))
+                check_true(exploration_type.key_range[0] <= exploration_type.key_range[1],
+                           ValueError("key_range must be (low, high) with low <= high. Incorrect: " +
+                                      str(exploration_type.key_range)))
+            check_true(isinstance(exploration_type.is_lifo, bool),
+                       TypeError("is_lifo must be boolean " + str(exploration_type.is_lifo)))
+
+        if isinstance(exploration_type, ExplorationType.SimulatedAnnealing):
+            check_true(exploration_type.initial_temperature > 0,
+                       ValueError("initial_temperature must be positive. Incorrect: " +
+                                  str(exploration_type.initial_temperature)))
+            check_true(0 < exploration_type.cooling_rate < 1,
+                       ValueError("cooling_rate must be between 0 and 1. Incorrect: " +
+                                  str(exploration_type.cooling_rate)))
+            check_true(exploration_type.min_temperature > 0,
+                       ValueError("min_temperature must be positive. Incorrect: " +
+                                  str(exploration_type.min_temperature)))
+
+        if isinstance(exploration_type, ExplorationType.TabuSearch):
+            check_true(isinstance(exploration_type.tenure, int),
+                       TypeError("tenure must be integer number of moves. Incorrect: " + str(exploration_type.tenure)))
+            check_true(exploration_type.tenure > 0,
+                       ValueError("tenure must be positive. Incorrect: " + str(exploration_type.tenure)))
+
+        if isinstance(exploration_type, ExplorationType.LimitedDiscrepancy):
+            check_true(isinstance(exploration_type.max_discrepancies, int),
+                       TypeError("max_discrepancies must be integer. Incorrect: " +
+                                 str(exploration_type.max_discrepancies)))
+            check_true(exploration_type.max_discrepancies >= 0,
+                       ValueError("max_discrepancies must be non-negative. Incorrect: " +
+                                  str(exploration_type.max_discrepancies)))
+
+        if restart is not None:
+            check_true(isinstance(restart, (Restart.Luby, Restart.Geometric)),
+                       TypeError("restart must be Restart.Luby or Restart.Geometric. Incorrect type: " +
+                                 str(type(restart))))
+            check_true(isinstance(restart.seed, int),
+                       TypeError("seed must be an integer. Incorrect: " + str(restart.seed)))
+            if isinstance(restart, Restart.Luby):
+                check_true(isinstance(restart.scale, int) and restart.scale > 0,
+                           ValueError("scale must be a positive integer. Incorrect: " + str(restart.scale)))
+            else:
+                check_true(isinstance(restart.initial, int) and restart.initial > 0,
+                           ValueError("initial must be a positive integer. Incorrect: " + str(restart.initial)))
+                check_true(restart.factor >= 1,
+                           ValueError("factor must be at least 1. Incorrect: " + str(restart.factor)))
+            if restart.max_restarts is not None:
+                check_true(isinstance(restart.max_restarts, int) and restart.max_restarts >= 0,
+                           ValueError("max_restarts must be a non-negative integer. Incorrect: " +
+                                      str(restart.max_restarts)))
+
+        if isinstance(search_type, SearchType.BoundedGraphSearch):
+            check_true(isinstance(search_type.capacity, int),
+                       TypeError("capacity must be integer number of states. Incorrect: " + str(search_type.capacity)))
+            check_true(search_type.capacity > 0,
+                       ValueError("capacity must be positive. Incorrect: " + str(search_type.capacity)))
+            check_true(search_type.policy in BoundedHashSet.POLICIES,
+                       ValueError("policy must be one of " + str(BoundedHashSet.POLICIES) +
+                                  ". Incorrect: " + str(search_type.policy)))
+            check_true(isinstance(search_type.is_readmission_counted, bool),
+                       TypeError("is_readmission_counted must be boolean. Incorrect: " +
+                                 str(search_type.is_readmission_counted)))
+
+        if isinstance(search_type, SearchType.TranspositionSearch):
+            if search_type.capacity is not None:
+                check_true(isinstance(search_type.capacity, int),
+                           TypeError("capacity must be integer number of entries. Incorrect: " +
+                                     str(search_type.capacity)))
+                check_true(search_type.capacity > 0,
+                           ValueError("capacity must be positive. Incorrect: " + str(search_type.capacity)))
+            check_true(search_type.policy in TranspositionTable.POLICIES,
+                       ValueError("policy must be one of " + str(TranspositionTable.POLICIES) +
+                                  ". Incorrect: " + str(search_type.policy)))
+
+        if snapshot_interval is not None:
+            check_true(isinstance(snapshot_interval, int),
+                       TypeError("snapshot_interval must be integer number of levels. Incorrect: " +
+                                 str(snapshot_interval)))
+            check_true(snapshot_interval > 0,
+                       ValueError("snapshot_interval must be positive. Incorrect: " + str(snapshot_interval)))
+
+        check_true(isinstance(snapshot_cache_size, int),
+                   TypeError("snapshot_cache_size must be integer number of states. Incorrect: " +
+                             str(snapshot_cache_size)))
+        check_true(snapshot_cache_size >= 0,
+                   ValueError("snapshot_cache_size must be non-negative. Incorrect: " + str(snapshot_cache_size)))
+
+        if nogood_cache_size is not None:
+            check_true(isinstance(nogood_cache_size, int),
+                       TypeError("nogood_cache_size must be integer number of nogoods. Incorrect: " +
+                                 str(nogood_cache_size)))
+            check_true(nogood_cache_size > 0,
+                       ValueError("nogood_cache_size must be positive. Incorrect: " + str(nogood_cache_size)))
+
+        if memo_cache is not None:
+            check_true(isinstance(memo_cache, MemoCache),
+                       TypeError("memo_cache must be MemoCache type. Incorrect type: " + str(type(memo_cache))))
+            check_true(isinstance(memo_cache.capacity, int) and memo_cache.capacity > 0,
+                       ValueError("capacity must be a positive integer. Incorrect: " + str(memo_cache.capacity)))
+            check_true(memo_cache.policy in MemoTable.POLICIES,
+                       ValueError("policy must be one of " + str(MemoTable.POLICIES) +
+                                  ". Incorrect: " + str(memo_cache.policy)))
+
+        if move_ordering is not None:
+            check_true(isinstance(move_ordering, MoveOrdering),
+                       TypeError("move_ordering must be MoveOrdering type. Incorrect type: " +
+                                 str(type(move_ordering))))
+
+
+# Explorer of a worker process of search_many(), which reuses its storages across the queries of the process
+_worker_explorer: Optional[Explorateur] = None
+
+
+def _search_query(query_args: Dict[str, Any]) -> SearchResult:
+    global _worker_explorer
+    if _worker_explorer is None:
+        _worker_explorer = Explorateur()
+        _worker_explorer._storages = {}
+    is_solution = _worker_explorer._search(**query_args)
+    return _worker_explorer._get_result(is_solution, is_path_copied=True)
@@ -1,11 +1,26 @@
-from typing import NamedTuple
+from typing import Callable, NamedTuple, Optional, Tuple
 
 
 class ExplorationType(NamedTuple):
 
     class BestFirst(NamedTuple):
+        """
+        Best first search that explores the states with the smallest objective first.
+
+        Integer objectives are kept in a bucket queue, in constant time per state,
+        which falls back to a heap on the first objective that is not an integer, see BucketQueue.
+
+        Attributes:
+            key_range Optional(Tuple[int, int]): Lowest and highest objective, inclusive, if known in advance.
+                                                 Objectives are then discretized to their floor,
+                                                 so that float objectives are kept in buckets too.
+                                                 An objective out of the range falls back to a heap.
+                                                 Default, None (integers, else a heap).
+            is_lifo (bool): Whether ties are explored in reverse order of generation. Default, False.
+        """
         # _storage: _Storage = _Storage.PriorityQueue()
-        pass
+        key_range: Optional[Tuple[int, int]] = None
+        is_lifo: bool = False
 
     class BreadthFirst(NamedTuple):
         # _storage: _Storage = _Storage.Queue()
@@ -14,3 +29,87 @@ class ExplorationType(NamedTuple):
     class DepthFirst(NamedTuple):
         # _storage: _Storage = _Storage.Stack()
         pass
+
+    class LimitedDiscrepancy(NamedTuple):
+        """
+        Depth first search in iterations that allow more discrepancies from the move order of get_moves().
+        Executing any move other than the first move of a state is a discrepancy. The first iteration
+        explores the path of first moves only, and every next iteration allows one more discrepancy per path.
+
+        Attributes:
+            max_discrepancies (int): Maximum number of discrepancies per path in the last iteration. Default, 3.
+        """
+        # _storage: _Storage = _Storage.Stack()
+        max_discrepancies: int = 3
+
+    class MCTS(NamedTuple):
+        """
+        Monte Carlo tree search that grows a tree of states with the upper confidence bound for trees (UCT).
+        Every iteration selects a node, expands one of its moves, plays a rollout from the new state,
+        and backpropagates the reward of the rollout, which is minus the objective of its last state.
+        Rollouts that reach a termination state end the search with a solution.
+
+        Attributes:
+            iterations (int): Number of iterations, i.e., rollouts. Default, 1000.
+            exploration_constant (float): Weight of exploration in UCT, on the scale of the objective.
+                                          Default, 1.41.
+            rollout_depth (int): Maximum number of moves per rollout. Default, 50.
+            rollout_policy Optional(Callable): Function of a state, its moves, and a random.Random,
+                                               that returns the move to play in rollouts.
+                                               Default, None (uniformly random moves).
+            num_workers (int): Number of processes that play a batch of rollouts in parallel,
+                               which requires picklable states, moves, and rollout policy. Default, 1 (no pool).
+            seed Optional(int): Seed of the random choices of expansions and rollouts.
+                                Default, None (Constants.default_seed).
+        """
+        iterations: int = 1000
+        exploration_constant: float = 1.41
+        rollout_depth: int = 50
+        rollout_policy: Optional[Callable] = None
+        num_workers: int = 1
+        seed: Optional[int] = None
+
+    class HillClimbing(NamedTuple):
+        """
+        Local search that moves to the successor with the lowest objective while it improves the objective,
+        and stops at a local optimum. Like the other local searches, it keeps only the current and the best state,
+        not the path, see Explorateur.search().
+
+        Attributes:
+            is_first_improvement (bool): Whether to move to the first improving successor in random order,
+                                         instead of the best successor. Default, False.
+            seed Optional(int): Seed of the random order of moves. Default, None (Constants.default_seed).
+        """
+        is_first_improvement: bool = False
+        seed: Optional[int] = None
+
+    class SimulatedAnnealing(NamedTuple):
+        """
+        Local search that executes a random move of the current state at every step,
+        and accepts a worse objective by delta with probability exp(-delta / temperature).
+        The temperature is multiplied by the cooling rate after every step, until the minimum temperature.
+
+        Attributes:
+            initial_temperature (float): Temperature of the first step, on the scale of the objective. Default, 100.
+            cooling_rate (float): Factor between 0 and 1 of the geometric cooling schedule. Default, 0.995.
+            min_temperature (float): Temperature that stops the search. Default, 0.01.
+            seed Optional(int): Seed of the random moves and acceptances. Default, None (Constants.default_seed).
+        """
+        initial_temperature: float = 100.0
+        cooling_rate: float = 0.995
+        min_temperature: float = 0.01
+        seed: Optional[int] = None
+
+    class TabuSearch(NamedTuple):
+        """
+        Local search that moves to the successor with the lowest objective at every step, even if worse,
+        except by the moves of the tabu list. A tabu move is allowed if it improves the best objective.
+
+        Attributes:
+            tenure (int): Number of recent moves kept in the tabu list by their key, see BaseMove.get_key().
+                          Default, 10.
+            seed Optional(int): Seed of the random order of moves, which breaks ties.
+                                Default, None (Constants.default_seed).
+        """
+        tenure: int = 10
+        seed: Optional[int] = None
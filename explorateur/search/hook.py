@@ -0,0 +1,61 @@
+import time
+from typing import Callable, Optional
+
+
+class Hook:
+    """
+    Search events that accept callbacks registered with Explorateur.add_hook().
+
+    Every callback receives the explorer as its first argument followed by the event arguments:
+        - ON_EXPAND(explorer, state, moves): Before the successors of a state are generated.
+                                             Return a list of moves to prune or reorder the moves, or None to keep them.
+        - ON_GENERATE(explorer, state, move, successor): After a move is successfully executed.
+                                                        Return False to prune the successor, counted as a failure.
+        - ON_EXECUTE_FAIL(explorer, state, move): After a move is infeasible, fails to execute, or is pruned.
+        - ON_SOLUTION(explorer, state): When a termination state is found.
+        - ON_LIMIT(explorer, state, cause): When a depth, move, or runtime limit is reached, or the search is stopped.
+        - ON_PROGRESS(explorer): Periodically, every given number of decisions or seconds.
+
+    Any callback can end the search early with explorer.stop().
+    Events without callbacks cost a single check per occurrence.
+    """
+
+    ON_EXPAND = "on_expand"
+    ON_GENERATE = "on_generate"
+    ON_EXECUTE_FAIL = "on_execute_fail"
+    ON_SOLUTION = "on_solution"
+    ON_LIMIT = "on_limit"
+    ON_PROGRESS = "on_progress"
+
+    ALL = (ON_EXPAND, ON_GENERATE, ON_EXECUTE_FAIL, ON_SOLUTION, ON_LIMIT, ON_PROGRESS)
+
+
+class ProgressCallback:
+    """ Callback of Hook.ON_PROGRESS, with its own interval and the decision and time of its next call. """
+
+    __slots__ = ("callback", "every_decisions", "every_seconds", "next_decision", "next_time")
+
+    def __init__(self, callback: Callable, every_decisions: Optional[int], every_seconds: Optional[float]):
+        self.callback = callback
+        self.every_decisions = every_decisions
+        self.every_seconds = every_seconds
+        self.next_decision: int = 0
+        self.next_time: float = 0
+
+    def reset(self, start_time: float) -> None:
+        """ Schedules the first call one interval after the start of the search. """
+        self.next_decision = self.every_decisions or 0
+        self.next_time = start_time + (self.every_seconds or 0)
+
+    def is_due(self, num_decisions: int) -> bool:
+        """ Returns whether the call is due, either after its number of decisions or its number of seconds. """
+        is_due = False
+        if self.every_decisions and num_decisions >= self.next_decision:
+            self.next_decision = num_decisions + self.every_decisions
+            is_due = True
+        if self.every_seconds:
+            current_time = time.perf_counter()
+            if current_time >= self.next_time:
+                self.next_time = current_time + self.every_seconds
+                is_due = True
+        return is_due
@@ -0,0 +1,95 @@
+import copy as cp
+import math
+import random
+from typing import Callable, List, Optional, Tuple
+
+from explorateur.state.base_move import BaseMove
+from explorateur.state.base_state import BaseState
+
+RolloutPolicy = Callable[[BaseState, List[BaseMove], random.Random], BaseMove]
+"""Rollout policy type is defined as a function that selects one of the moves of a state using the given rng."""
+
+
+class MCTSNode:
+    """
+    Node of the Monte Carlo search tree, holding its state, the moves not tried yet,
+    and the number of visits and total reward of the rollouts through it.
+    Untried moves are generated when the node is first selected.
+    """
+
+    __slots__ = ("state", "parent", "move", "depth", "children", "untried_moves", "num_visits", "total_reward")
+
+    def __init__(self, state: BaseState, parent: Optional["MCTSNode"] = None, move: Optional[BaseMove] = None):
+        self.state = state
+        self.parent = parent
+        self.move = move
+        self.depth: int = parent.depth + 1 if parent else 0
+        self.children: List["MCTSNode"] = []
+        self.untried_moves: Optional[List[BaseMove]] = None
+        self.num_visits: int = 0
+        self.total_reward: float = 0.0
+
+    def select_child(self, exploration_constant: float) -> "MCTSNode":
+        """ Returns the child with the highest upper confidence bound (UCT), unvisited children first. """
+        # Children of a batch can be selected before the rollouts of their parent are backpropagated
+        log_visits = math.log(max(1, self.num_visits))
+
+        def uct(child):
+            if child.num_visits == 0:
+                return float("inf")
+            return (child.total_reward / child.num_visits +
+                    exploration_constant * math.sqrt(log_visits / child.num_visits))
+
+        return max(self.children, key=uct)
+
+    def get_moves(self) -> List[BaseMove]:
+        """ Returns the moves from the root to this node, in execution order. """
+        moves = []
+        node = self
+        while node.parent is not None:
+            moves.append(node.move)
+            node = node.parent
+        moves.reverse()
+        return moves
+
+
+def random_policy(state: BaseState, moves: List[BaseMove], rng: random.Random) -> BaseMove:
+    """ Default rollout policy, selects a move uniformly at random. """
+    return rng.choice(moves)
+
+
+def rollout(state: BaseState, goal_state: Optional[BaseState], rollout_depth: int,
+            rollout_policy: Optional[RolloutPolicy], seed: int) -> Tuple[bool, float, List[BaseMove], BaseState]:
+    """
+    Plays moves selected by the rollout policy from a copy of the state, until termination, no moves left,
+    or the rollout depth.
+
+    Runs in worker processes for batched rollouts, so the arguments must be picklable.
+
+    Returns:
+        Tuple[bool, float, List[BaseMove], BaseState]: Whether a termination state is reached,
+        the objective of the last state, the moves played, and the last state.
+    """
+    rng = random.Random(seed)
+    policy = rollout_policy if rollout_policy else random_policy
+    moves_played = []
+    for _ in range(rollout_depth):
+        if state.is_terminate(goal_state):
+            return True, state.get_objective(), moves_played, state
+
+        # Try moves until one succeeds, a failed move is not tried again from the same state
+        moves = list(state.get_moves())
+        successor = None
+        while moves:
+            move = policy(state, moves, rng)
+            successor = cp.deepcopy(state)
+            if successor.execute(move):
+                moves_played.append(move)
+                break
+            moves.remove(move)
+            successor = None
+        if successor is None:
+            break
+        state = successor
+
+    return state.is_terminate(goal_state), state.get_objective(), moves_played, state
@@ -0,0 +1,175 @@
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List
+
+from explorateur.state.base_move import BaseMove
+from explorateur.state.base_state import BaseState
+
+
+class MemoTable:
+    """
+    Bounded table of values by key, with hit and miss statistics.
+
+    When the table is full, the least recently used entry is evicted first in LRU,
+    or the least frequently used entry, ties by least recently used, in LFU.
+    """
+
+    LRU = "lru"
+    LFU = "lfu"
+    POLICIES = (LRU, LFU)
+
+    def __init__(self, capacity: int, policy: str = LRU):
+        self.capacity: int = capacity
+        self.policy: str = policy
+        self.storage: Dict[Any, Any] = OrderedDict()
+
+        # Use count of every key, and the keys by use count in LRU order, if LFU
+        self._counts: Dict[Any, int] = dict()
+        self._keys_by_count: Dict[int, Dict[Any, None]] = defaultdict(OrderedDict)
+        self._min_count: int = 0
+
+        # Statistics
+        self.num_hits: int = 0
+        self.num_misses: int = 0
+
+    def get(self, key: Any) -> Any:
+        """ Returns the value of the key, or None if the key is not in the table. """
+        value = self.storage.get(key)
+        if value is None:
+            self.num_misses += 1
+            return None
+        self.num_hits += 1
+        if self.policy == MemoTable.LRU:
+            self.storage.move_to_end(key)
+        else:
+            self._use(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """ Inserts the value of the key, and evicts an entry if the table is full. """
+        if key in self.storage:
+            self.storage[key] = value
+            return
+        if len(self.storage) >= self.capacity:
+            self._evict()
+        self.storage[key] = value
+        if self.policy == MemoTable.LFU:
+            self._counts[key] = 1
+            self._keys_by_count[1][key] = None
+            self._min_count = 1
+
+    def size(self) -> int:
+        return len(self.storage)
+
+    def clear(self) -> None:
+        self.storage.clear()
+        self._counts.clear()
+        self._keys_by_count.clear()
+        self._min_count = 0
+
+    def _use(self, key: Any) -> None:
+        # Move the key to the next use count, which raises the minimum if its last key leaves it
+        count = self._counts[key]
+        keys = self._keys_by_count[count]
+        del keys[key]
+        if not keys:
+            del self._keys_by_count[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._keys_by_count[count + 1][key] = None
+
+    def _evict(self) -> None:
+        if self.policy == MemoTable.LRU:
+            self.storage.popitem(last=False)
+            return
+        keys = self._keys_by_count[self._min_count]
+        key, _ = keys.popitem(last=False)
+        if not keys:
+            del self._keys_by_count[self._min_count]
+        del self._counts[key]
+        del self.storage[key]
+
+
+class MemoCache:
+    """
+    Memoization of get_moves(), get_objective(), and get_heuristic() of states by their key,
+    see BaseState.get_key(), so that the same logical state reached again is not evaluated again,
+    e.g., in tree search over a space with many paths to a state, or in repeated queries.
+
+    This assumes that these functions depend only on the key of the state, and that moves are not
+    changed after get_moves() returns them. The path cost, see BaseState.get_path_cost(), is never cached.
+    A compact key keeps lookups cheap, e.g., a tuple of the assignments.
+
+    Moves and objectives are cached within a search, since they can depend on the search, e.g., the goal state.
+    Heuristics are kept between searches given the same cache, unless is_kept is False,
+    which assumes that they depend only on the key of the state.
+    Every table holds up to capacity entries, evicted by the given policy, "lru" or "lfu".
+    """
+
+    def __init__(self, capacity: int = 100000, policy: str = MemoTable.LRU,
+                 is_moves: bool = True, is_objective: bool = True, is_kept: bool = True):
+        self.capacity: int = capacity
+        self.policy: str = policy
+        self.is_moves: bool = is_moves
+        self.is_objective: bool = is_objective
+        self.is_kept: bool = is_kept
+
+        self.moves: MemoTable = MemoTable(capacity, policy)
+        self.objectives: MemoTable = MemoTable(capacity, policy)
+        self.heuristics: MemoTable = MemoTable(capacity, policy)
+
+    def get_moves(self, state: BaseState) -> List[BaseMove]:
+        """ Returns a new list of the moves of the state, computed once per key. """
+        if not self.is_moves:
+            return state.get_moves()
+        key = state.get_key()
+        moves = self.moves.get(key)
+        if moves is None:
+            moves = list(state.get_moves())
+            self.moves.put(key, moves)
+        return list(moves)
+
+    def get_objective(self, state: BaseState) -> float:
+        """ Returns the objective of the state, computed once per key. """
+        return self._get_value(self.objectives, state, state.get_objective)
+
+    def get_heuristic(self, state: BaseState) -> float:
+        """ Returns the heuristic of the state, computed once per key. """
+        return self._get_value(self.heuristics, state, state.get_heuristic)
+
+    def clear(self) -> None:
+        """ Forgets every cached value. """
+        self.moves.clear()
+        self.objectives.clear()
+        self.heuristics.clear()
+
+    def reset(self) -> None:
+        """ Forgets the cached values of the previous search, except the heuristics if kept. """
+        self.moves.clear()
+        self.objectives.clear()
+        if not self.is_kept:
+            self.heuristics.clear()
+
+    @property
+    def num_hits(self) -> int:
+        return self.moves.num_hits + self.objectives.num_hits + self.heuristics.num_hits
+
+    @property
+    def num_misses(self) -> int:
+        return self.moves.num_misses + self.objectives.num_misses + self.heuristics.num_misses
+
+    @property
+    def hit_rate(self) -> float:
+        """ Ratio of lookups that found a cached value. """
+        num_lookups = self.num_hits + self.num_misses
+        return self.num_hits / num_lookups if num_lookups > 0 else 0.0
+
+    def _get_value(self, table, state, function) -> Any:
+        if not self.is_objective:
+            return function()
+        key = state.get_key()
+        value = table.get(key)
+        if value is None:
+            value = function()
+            table.put(key, value)
+        return value
@@ -0,0 +1,64 @@
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from explorateur.state.base_move import BaseMove
+
+
+class MoveOrdering:
+    """
+    Move ordering that learns from earlier subtrees which moves to explore first.
+
+    Moves are identified by their key, see BaseMove.get_key(), and ranked by:
+        - Killer moves: The most recent moves that succeeded at the same depth, tried first.
+        - History scores: Raised by the depth of every successful execution of the move,
+                          and by the solution length for every move on a solution path.
+    Ties keep the order of get_moves().
+
+    The learned scores are kept between searches, so an ordering can be passed to successive searches,
+    e.g., to restarts. Call reset() to forget them.
+    """
+
+    def __init__(self, num_killers: int = 2, is_history: bool = True):
+        self.num_killers: int = num_killers
+        self.is_history: bool = is_history
+
+        # History score of move keys, and killer move keys per depth, most recent first
+        self.history: Dict[Any, int] = defaultdict(int)
+        self.killers: Dict[int, List[Any]] = defaultdict(list)
+
+    def order(self, moves: List[BaseMove], depth: int) -> List[BaseMove]:
+        """ Returns the moves of a state at the given depth, sorted from the most to the least promising. """
+        killers = self.killers.get(depth, [])
+        num_killers = len(killers)
+        history = self.history
+
+        def rank(move):
+            key = move.get_key()
+            killer_rank = killers.index(key) if key in killers else num_killers
+            return killer_rank, -history.get(key, 0)
+
+        return sorted(moves, key=rank)
+
+    def update_success(self, move: BaseMove, depth: int) -> None:
+        """ Rewards the move for a successful execution at the given depth. """
+        key = move.get_key()
+        if self.is_history:
+            self.history[key] += depth
+
+        if self.num_killers > 0:
+            killers = self.killers[depth]
+            if key in killers:
+                killers.remove(key)
+            killers.insert(0, key)
+            del killers[self.num_killers:]
+
+    def update_solution(self, moves: List[BaseMove]) -> None:
+        """ Rewards the moves on the path to a solution. """
+        if self.is_history:
+            for move in moves:
+                self.history[move.get_key()] += len(moves)
+
+    def reset(self) -> None:
+        """ Forgets the learned scores. """
+        self.history.clear()
+        self.killers.clear()
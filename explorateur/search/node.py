@@ -0,0 +1,198 @@
+import copy as cp
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from explorateur.state.base_move import BaseMove
+from explorateur.state.base_state import BaseState
+
+NO_PARENT = -1
+"""Parent index of the root node."""
+
+
+class Node:
+    """
+    Open search node, i.e., a pending move to execute on the state of its parent node.
+
+    Nodes only hold search metadata. The user state of the parent is referenced from the SearchTree.
+    """
+
+    __slots__ = ("parent", "move", "depth", "objective", "discrepancies")
+
+    def __init__(self, parent: int, move: BaseMove, depth: int, objective: Optional[float] = None,
+                 discrepancies: int = 0):
+        self.parent = parent
+        self.move = move
+        self.depth = depth
+        self.objective = objective
+        self.discrepancies = discrepancies
+
+    def __str__(self):
+        return str(self.move) + " depth: " + str(self.depth)
+
+
+class SearchTree:
+    """
+    Array-backed table of the nodes created during search.
+
+    Node i is stored by its parent index, depth, objective and move in the i-th position of each table.
+    User states are referenced separately and released as soon as no open node needs them,
+    while the tables keep the structure of the tree to trace paths and moves back to the root.
+    A node is freed together with its state, and its index is reused by the next node added,
+    so the size of the tables follows the live nodes, i.e., the open nodes and their ancestors.
+
+    In replay mode, given a snapshot interval k, only the states of nodes at every k levels are kept as snapshots.
+    Other states are rebuilt on demand by replaying moves from the nearest snapshot,
+    and the most recently used ones are cached up to the given cache size.
+    This trades re-executing moves for memory, and requires the execution of moves to be deterministic.
+    """
+
+    def __init__(self, snapshot_interval: Optional[int] = None, cache_size: int = 1000):
+        self.parents = array("q")
+        self.depths = array("l")
+        self.objectives: List[Any] = []
+        self.moves: List[Optional[BaseMove]] = []
+        self.states: List[Optional[BaseState]] = []
+
+        # Number of open or alive children per node, a state is released when it drops to zero
+        self.num_pending = array("l")
+
+        # Indices of freed nodes, reused by new nodes
+        self._free: List[int] = []
+
+        # Replay mode, states between snapshots are cached with least recently used eviction
+        self.snapshot_interval: Optional[int] = snapshot_interval
+        self.cache_size: int = cache_size
+        self._cache: Dict[int, BaseState] = OrderedDict()
+        self.num_replayed_moves: int = 0
+
+    def add(self, state: BaseState, parent: int, move: Optional[BaseMove], depth: int) -> int:
+        """ Adds a new node for the given state and returns its index, the index of a freed node if any. """
+        # Keep the state, unless replay mode is on and the node is not at a snapshot level
+        is_snapshot = not self.snapshot_interval or depth % self.snapshot_interval == 0
+        if self._free:
+            index = self._free.pop()
+            self.parents[index] = parent
+            self.depths[index] = depth
+            self.objectives[index] = None
+            self.moves[index] = move
+            self.num_pending[index] = 0
+            self.states[index] = state if is_snapshot else None
+        else:
+            index = len(self.states)
+            self.parents.append(parent)
+            self.depths.append(depth)
+            self.objectives.append(None)
+            self.moves.append(move)
+            self.num_pending.append(0)
+            self.states.append(state if is_snapshot else None)
+        if not is_snapshot:
+            self._cache_state(index, state)
+        return index
+
+    def get_state(self, index: int) -> BaseState:
+        """ Returns the state of the node, rebuilt from the nearest snapshot if it is not kept. """
+        state = self.states[index]
+        if state is not None:
+            return state
+
+        state = self._cache.get(index)
+        if state is not None:
+            self._cache.move_to_end(index)
+            return state
+
+        # Walk up to the nearest ancestor with a known state, ancestors of a pending node are never released
+        moves = []
+        ancestor = index
+        while self.states[ancestor] is None and ancestor not in self._cache:
+            moves.append(self.moves[ancestor])
+            ancestor = self.parents[ancestor]
+
+        # Replay the moves on a copy of the ancestor, these moves are known to succeed
+        state = self.states[ancestor]
+        state = cp.deepcopy(state if state is not None else self._cache[ancestor])
+        for move in reversed(moves):
+            state.execute(move)
+        self.num_replayed_moves += len(moves)
+
+        self._cache_state(index, state)
+        return state
+
+    def size(self) -> int:
+        """ Returns the number of live nodes. """
+        return len(self.states) - len(self._free)
+
+    def add_pending(self, index: int, num_children: int) -> None:
+        """ Marks the given number of children of the node as pending in open. """
+        self.num_pending[index] += num_children
+
+    def remove_pending(self, index: int) -> None:
+        """ Marks a pending child of the node as done, releasing the node if no child is left. """
+        self.num_pending[index] -= 1
+        self.release(index)
+
+    def release(self, index: int) -> None:
+        """ Frees the node if it has no pending children, and so on for its ancestors. """
+        num_pending, parents, states, moves, free = self.num_pending, self.parents, self.states, self.moves, self._free
+        while index != NO_PARENT and num_pending[index] == 0:
+            states[index] = None
+            moves[index] = None
+            if self._cache:
+                self._cache.pop(index, None)
+            free.append(index)
+            index = parents[index]
+            if index != NO_PARENT:
+                num_pending[index] -= 1
+
+    def retain_path(self, index: int) -> None:
+        """ Releases every state except the states on the path from the root to the given node. """
+        self.retain_paths([index])
+
+    def retain_paths(self, indices: Iterable[int]) -> None:
+        """
+        Frees every node except the nodes on the paths from the roots to the given nodes, which keep their states.
+        The given nodes stay pending, and the nodes on the paths count only their children on the paths.
+        """
+        # Rebuild the paths from the roots, so that replay mode starts from the parent of every node
+        indices = list(indices)
+        path = {i: self.get_state(i) for index in indices for i in reversed(self.get_path(index))}
+        self.clear_states()
+        num_pending, parents = self.num_pending, self.parents
+        self._free = [i for i in range(len(self.states)) if i not in path]
+        for i in self._free:
+            self.moves[i] = None
+            num_pending[i] = 0
+        for i in path:
+            num_pending[i] = 0
+        for i, state in path.items():
+            self.states[i] = state
+            if parents[i] != NO_PARENT:
+                num_pending[parents[i]] += 1
+        for index in indices:
+            num_pending[index] += 1
+
+    def clear_states(self) -> None:
+        """ Releases every state. """
+        self.states = [None] * len(self.states)
+        self._cache.clear()
+
+    def get_path(self, index: int) -> List[int]:
+        """ Returns the node indices from the given node back to the root. """
+        path = []
+        parents = self.parents
+        while index != NO_PARENT:
+            path.append(index)
+            index = parents[index]
+        return path
+
+    def get_moves(self, index: int) -> List[BaseMove]:
+        """ Returns the moves from the root to the given node, in execution order. """
+        moves = [self.moves[i] for i in self.get_path(index)]
+        moves.pop()  # the root has no move
+        moves.reverse()
+        return moves
+
+    def _cache_state(self, index: int, state: BaseState) -> None:
+        self._cache[index] = state
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
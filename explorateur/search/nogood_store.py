@@ -0,0 +1,52 @@
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+from explorateur.state.base_move import BaseMove
+from explorateur.state.base_state import BaseState
+
+
+class NogoodStore:
+    """
+    Bounded store of nogoods, i.e., moves that failed to execute on a state.
+
+    A nogood is keyed by the key of the state, see BaseState.get_key(), and the key of the move,
+    see BaseMove.get_key(). The same move on an equivalent state is known to fail without copying and executing it.
+    This assumes that the failure of a move depends only on the key of the state.
+    When the store is full, the least recently used nogood is evicted first.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity: int = capacity
+        self.storage: Dict[Tuple[Any, Any], None] = OrderedDict()
+
+        # Statistics
+        self.num_lookups: int = 0
+        self.num_hits: int = 0
+
+    def insert(self, state: BaseState, move: BaseMove) -> None:
+        """ Inserts the failed move on the given state. """
+        self.storage[(state.get_key(), move.get_key())] = None
+        if len(self.storage) > self.capacity:
+            self.storage.popitem(last=False)
+
+    def contains(self, state: BaseState, move: BaseMove) -> bool:
+        """ Returns True if the move is known to fail on the given state, False otherwise. """
+        key = (state.get_key(), move.get_key())
+        self.num_lookups += 1
+        if key in self.storage:
+            self.num_hits += 1
+            self.storage.move_to_end(key)
+            return True
+        return False
+
+    def size(self) -> int:
+        return len(self.storage)
+
+    def clear(self) -> None:
+        """ Forgets every nogood. """
+        self.storage.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """ Ratio of lookups that found a nogood. """
+        return self.num_hits / self.num_lookups if self.num_lookups > 0 else 0.0
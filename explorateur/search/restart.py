@@ -0,0 +1,59 @@
+from typing import NamedTuple, Optional, Union
+
+from explorateur.utils import Constants
+
+
+class Restart(NamedTuple):
+    """
+    Restart strategies that cut off every run of the search after a budget of decisions,
+    and start again from the initial state with a new random order of moves.
+
+    The budget of run i follows:
+        - Luby: scale * luby(i), i.e., scale times 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ...
+        - Geometric: initial * factor^i
+
+    Common attributes:
+        seed (int): Seed of the random order of moves. Default, Constants.default_seed.
+        max_restarts Optional(int): Maximum number of restarts, after which the last run has no cutoff.
+                                    Default, None (no limit).
+        is_randomized (bool): Whether to shuffle the moves of every expansion, which breaks ties randomly
+                              if a move ordering is given. Default, True.
+        is_learning_kept (bool): Whether nogoods and move ordering scores are kept between runs. Default, True.
+    """
+
+    class Luby(NamedTuple):
+        scale: int = 100
+        seed: int = Constants.default_seed
+        max_restarts: Optional[int] = None
+        is_randomized: bool = True
+        is_learning_kept: bool = True
+
+    class Geometric(NamedTuple):
+        initial: int = 100
+        factor: float = 1.5
+        seed: int = Constants.default_seed
+        max_restarts: Optional[int] = None
+        is_randomized: bool = True
+        is_learning_kept: bool = True
+
+
+All_Restart_Types = Union[Restart.Luby, Restart.Geometric]
+"""All possible restart types"""
+
+
+def luby(i: int) -> int:
+    """ Returns the i-th element, starting from zero, of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ... """
+    # A full subsequence of length 2^k - 1 ends with 2^(k-1), otherwise it starts with the subsequence before it
+    i += 1
+    while True:
+        k = i.bit_length()
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+
+def get_cutoff(restart: All_Restart_Types, i: int) -> int:
+    """ Returns the budget of decisions of the i-th run, starting from zero. """
+    if isinstance(restart, Restart.Luby):
+        return restart.scale * luby(i)
+    return max(1, round(restart.initial * restart.factor ** i))
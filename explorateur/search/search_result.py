@@ -0,0 +1,34 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from explorateur.search.solution_path import Solution
+from explorateur.state.base_move import BaseMove
+from explorateur.state.base_state import BaseState
+
+
+class SearchResult(NamedTuple):
+    """
+    Result of a query of Explorateur.search_many(), with the same meaning as the attributes of the explorer
+    after Explorateur.search().
+
+    Attributes:
+        is_solution (bool): Whether a solution is found.
+        solution_state Optional(BaseState): The solution state.
+        solution_moves Optional(List[BaseMove]): The moves from the initial state to the solution state.
+        solution_path Optional(Sequence[BaseState]): The path from the solution state back to the initial state.
+        solutions (Dict[Any, Solution]): The solution of every goal reached by goal key, if goal keys.
+        best_state Optional(BaseState): The best state, if Monte Carlo tree search or local search.
+        best_objective Optional(float): The objective of the best state.
+        num_decisions (int): Number of decisions.
+        num_failed_decisions (int): Number of failed decisions.
+        total_time (float): Search time in seconds.
+    """
+    is_solution: bool
+    solution_state: Optional[BaseState]
+    solution_moves: Optional[List[BaseMove]]
+    solution_path: Optional[Sequence[BaseState]]
+    solutions: Dict[Any, Solution]
+    best_state: Optional[BaseState]
+    best_objective: Optional[float]
+    num_decisions: int
+    num_failed_decisions: int
+    total_time: float
@@ -0,0 +1,159 @@
+import time
+from collections import Counter
+from typing import Dict, List
+
+
+class SearchStats:
+    """
+    Per-phase counters and timers collected during a search.
+
+    The detail level controls the overhead of collection:
+        - OFF: Only the overall number of decisions, failures, and total time are reported.
+        - LOW: Call counts of every phase, peak open/closed sizes, and the depth and branching distributions.
+        - HIGH: LOW statistics together with the cumulative time spent in every phase.
+
+    Phases separate the time spent in the user model (get_moves, is_feasible, execute, is_terminate, get_objective)
+    from the time spent in the engine (state copy, open and closed storage operations).
+    """
+
+    # Detail levels
+    OFF = 0
+    LOW = 1
+    HIGH = 2
+
+    # User model phases
+    GET_MOVES = "get_moves"
+    IS_FEASIBLE = "is_feasible"
+    EXECUTE = "execute"
+    IS_TERMINATE = "is_terminate"
+    GET_OBJECTIVE = "get_objective"
+
+    # Engine phases
+    COPY = "copy"
+    OPEN_INSERT = "open_insert"
+    OPEN_REMOVE = "open_remove"
+    CLOSED_INSERT = "closed_insert"
+    CLOSED_CONTAINS = "closed_contains"
+
+    USER_PHASES = (GET_MOVES, IS_FEASIBLE, EXECUTE, IS_TERMINATE, GET_OBJECTIVE)
+    ENGINE_PHASES = (COPY, OPEN_INSERT, OPEN_REMOVE, CLOSED_INSERT, CLOSED_CONTAINS)
+    PHASES = USER_PHASES + ENGINE_PHASES
+
+    def __init__(self, level: int = OFF):
+        self.level: int = level
+
+        # Clock used to time phases, only consulted at HIGH detail
+        self.clock = time.perf_counter if level >= SearchStats.HIGH else SearchStats._no_clock
+
+        # Phase counters and timers
+        self.call_counts: Dict[str, int] = dict.fromkeys(SearchStats.PHASES, 0)
+        self.call_times: Dict[str, float] = dict.fromkeys(SearchStats.PHASES, 0.0)
+
+        # Storage sizes
+        self.peak_open_size: int = 0
+        self.peak_closed_size: int = 0
+
+        # Distribution of the depth of created nodes and the number of moves per expansion
+        self.depth_histogram: Dict[int, int] = Counter()
+        self.branching_histogram: Dict[int, int] = Counter()
+
+        # Overall search summary
+        self.num_decisions: int = 0
+        self.num_failed_decisions: int = 0
+        self.total_time: float = 0
+
+        # Moves re-executed to rebuild states in replay mode
+        self.num_replayed_moves: int = 0
+
+        # Summary of every run, if restarts
+        self.restarts: List[dict] = []
+
+    def record(self, phase: str, start: float) -> None:
+        """ Counts a call of the given phase, and at HIGH detail, adds the time elapsed since start. """
+        self.call_counts[phase] += 1
+        if self.level >= SearchStats.HIGH:
+            self.call_times[phase] += time.perf_counter() - start
+
+    def record_open_size(self, size: int) -> None:
+        if size > self.peak_open_size:
+            self.peak_open_size = size
+
+    def record_closed_size(self, size: int) -> None:
+        if size > self.peak_closed_size:
+            self.peak_closed_size = size
+
+    def record_restart(self, cutoff: float, num_decisions: int, num_failed_decisions: int, run_time: float) -> None:
+        """ Saves the summary of a finished run of the search. """
+        self.restarts.append({"cutoff": cutoff,
+                              "num_decisions": num_decisions,
+                              "num_failed_decisions": num_failed_decisions,
+                              "run_time": run_time})
+
+    def finalize(self, num_decisions: int, num_failed_decisions: int, total_time: float,
+                 num_replayed_moves: int = 0) -> None:
+        """ Saves the overall summary of the search. """
+        self.num_decisions = num_decisions
+        self.num_failed_decisions = num_failed_decisions
+        self.total_time = total_time
+        self.num_replayed_moves = num_replayed_moves
+
+    @property
+    def nodes_per_second(self) -> float:
+        """ Number of decisions per second of search. """
+        return self.num_decisions / self.total_time if self.total_time > 0 else 0.0
+
+    @property
+    def user_time(self) -> float:
+        """ Cumulative time spent in the user model. Available at HIGH detail. """
+        return sum(self.call_times[phase] for phase in SearchStats.USER_PHASES)
+
+    @property
+    def engine_time(self) -> float:
+        """ Cumulative time spent in copy and storage operations. Available at HIGH detail. """
+        return sum(self.call_times[phase] for phase in SearchStats.ENGINE_PHASES)
+
+    @property
+    def mean_branching_factor(self) -> float:
+        """ Average number of moves per expanded state. """
+        num_expansions = sum(self.branching_histogram.values())
+        if num_expansions == 0:
+            return 0.0
+        return sum(b * count for b, count in self.branching_histogram.items()) / num_expansions
+
+    def to_dict(self) -> dict:
+        """ Returns the statistics as a dictionary, e.g., to save as JSON. """
+        return {"level": self.level,
+                "num_decisions": self.num_decisions,
+                "num_failed_decisions": self.num_failed_decisions,
+                "total_time": self.total_time,
+                "nodes_per_second": self.nodes_per_second,
+                "num_replayed_moves": self.num_replayed_moves,
+                "restarts": list(self.restarts),
+                "call_counts": dict(self.call_counts),
+                "call_times": dict(self.call_times),
+                "peak_open_size": self.peak_open_size,
+                "peak_closed_size": self.peak_closed_size,
+                "depth_histogram": dict(sorted(self.depth_histogram.items())),
+                "branching_histogram": dict(sorted(self.branching_histogram.items()))}
+
+    def __str__(self) -> str:
+        text = "Total Decisions: " + str(self.num_decisions) + "\n"
+        text += "Total Failures: " + str(self.num_failed_decisions) + "\n"
+        text += "Total Time: " + str(round(self.total_time, 3)) + "\n"
+        text += "Nodes/sec: " + str(round(self.nodes_per_second, 1))
+        if self.restarts:
+            text += "\nRuns: " + str(len(self.restarts))
+        if self.level >= SearchStats.LOW:
+            text += "\nPeak Open: " + str(self.peak_open_size)
+            text += "\nPeak Closed: " + str(self.peak_closed_size)
+            text += "\nMean Branching: " + str(round(self.mean_branching_factor, 2))
+            text += "\nReplayed Moves: " + str(self.num_replayed_moves)
+            for phase in SearchStats.PHASES:
+                text += "\n" + phase + ": " + str(self.call_counts[phase]) + " calls"
+                if self.level >= SearchStats.HIGH:
+                    text += ", " + str(round(self.call_times[phase], 6)) + " sec"
+        return text
+
+    @staticmethod
+    def _no_clock() -> float:
+        return 0.0
@@ -1,4 +1,4 @@
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 
 class SearchType(NamedTuple):
@@ -8,3 +8,60 @@ class SearchType(NamedTuple):
 
     class TreeSearch(NamedTuple):
         pass
+
+    class TranspositionSearch(NamedTuple):
+        """
+        Graph search that stores the shallowest depth of visited state keys, see BaseState.get_key().
+        A state is expanded again when reached at a shallower depth, so depth-first search with max_depth
+        does not prune states first reached close to the depth limit.
+
+        Attributes:
+            capacity Optional(int): Maximum number of stored entries. Default, None (no limit).
+            policy (str): Replacement policy when the capacity is reached,
+                          "depth_preferred", "always_replace", or "two_tier". Default, "depth_preferred".
+        """
+        capacity: Optional[int] = None
+        policy: str = "depth_preferred"
+
+    class BitstateSearch(NamedTuple):
+        """
+        Graph search that stores visited state keys in a fixed-size bloom filter, see BaseState.get_key().
+        Memory does not grow with the number of visited states, at the cost of rarely pruning
+        an unvisited state as visited.
+
+        Attributes:
+            expected_num_states (int): Number of states the filter is sized for. Default, 1,000,000.
+            false_positive_rate (float): Target rate of unvisited states pruned as visited,
+                                         when the expected number of states is visited. Default, 0.001.
+        """
+        expected_num_states: int = 1000000
+        false_positive_rate: float = 0.001
+
+    class BoundedGraphSearch(NamedTuple):
+        """
+        Graph search that stores up to a fixed capacity of visited state keys, see BaseState.get_key().
+        When full, a state is evicted and expanded again if it is reached again.
+
+        Attributes:
+            capacity (int): Maximum number of visited states. Default, 1,000,000.
+            policy (str): Eviction policy, "lru" for the least recently used state,
+                          "depth" for the state visited at the lowest depth,
+                          or "objective" for the state with the worst objective. Default, "lru".
+            is_readmission_counted (bool): Whether to count evicted states that are visited again, approximately,
+                                           with a bloom filter of evicted keys sized to the capacity. Default, False.
+        """
+        capacity: int = 1000000
+        policy: str = "lru"
+        is_readmission_counted: bool = False
+
+    class CostGraphSearch(NamedTuple):
+        """
+        Graph search that stores the best path cost of visited state keys, see BaseState.get_path_cost().
+        A state reached again is skipped unless its new path is cheaper, in which case it is expanded again.
+
+        With ExplorationType.BestFirst(), states are expanded in the order of path cost plus heuristic,
+        see BaseState.get_heuristic(), and checked for termination when expanded, not when generated.
+        This is uniform-cost search, i.e., Dijkstra's algorithm, or A* search given a heuristic,
+        which finds the cheapest solution when the heuristic never overestimates the remaining cost.
+        Expansions of a state made obsolete by a cheaper path are skipped.
+        """
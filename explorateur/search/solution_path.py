@@ -0,0 +1,71 @@
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Union
+
+from explorateur.search.node import SearchTree, NO_PARENT
+from explorateur.state.base_move import BaseMove
+from explorateur.state.base_state import BaseState
+
+
+class SolutionPath(Sequence):
+    """
+    Lazy view of the solution path, from the solution state back to the initial state.
+
+    States are reached by walking the parent links of the search tree on demand, iteratively,
+    so paths of any depth are supported without recursion limits.
+    The node indices of the path are listed once, on the first index or reverse, so lookups are constant time.
+    """
+
+    def __init__(self, tree: SearchTree, index: int):
+        self._tree = tree
+        self._index = index
+        self._path: Optional[List[int]] = None
+
+    def __iter__(self) -> Iterator[BaseState]:
+        index, parents, states = self._index, self._tree.parents, self._tree.states
+        while index != NO_PARENT:
+            yield states[index]
+            index = parents[index]
+
+    def __len__(self) -> int:
+        # Every move adds a level of depth, so the path has one more state than the solution depth
+        return self._tree.depths[self._index] + 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[BaseState, List[BaseState]]:
+        states = self._tree.states
+        if isinstance(index, slice):
+            return [states[i] for i in self._get_path()[index]]
+        try:
+            return states[self._get_path()[index]]
+        except IndexError:
+            raise IndexError("solution path index out of range") from None
+
+    def __reversed__(self) -> Iterator[BaseState]:
+        states = self._tree.states
+        return (states[i] for i in reversed(self._get_path()))
+
+    def __repr__(self) -> str:
+        return "SolutionPath(length=" + str(len(self)) + ")"
+
+    def get_moves(self) -> List[BaseMove]:
+        """ Returns the moves of the path in execution order, from the initial state to the solution state. """
+        return self._tree.get_moves(self._index)
+
+    def _get_path(self) -> List[int]:
+        if self._path is None:
+            self._path = self._tree.get_path(self._index)
+        return self._path
+
+
+class Solution(NamedTuple):
+    """
+    Solution of a goal reached by a search with goal keys, see Explorateur.search().
+
+    Attributes:
+        state (BaseState): The goal state.
+        moves (List[BaseMove]): The moves from the initial state to the goal state.
+        path Optional(SolutionPath): The path from the goal state back to the initial state, if kept.
+        cost (float): The path cost of the goal state, see BaseState.get_path_cost().
+    """
+    state: BaseState
+    moves: List[BaseMove]
+    path: Optional[SolutionPath]
+    cost: float
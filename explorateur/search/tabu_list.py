@@ -0,0 +1,36 @@
+from collections import Counter, deque
+from typing import Any, Deque
+
+from explorateur.state.base_move import BaseMove
+
+
+class TabuList:
+    """
+    Tabu list of the most recent moves of local search, see ExplorationType.TabuSearch.
+
+    Moves are identified by their key, see BaseMove.get_key().
+    A move is tabu while its key is among the last tenure moves inserted.
+    """
+
+    def __init__(self, tenure: int):
+        self.tenure: int = tenure
+        self.keys: Deque[Any] = deque()
+        self.counts: Counter = Counter()
+
+    def insert(self, move: BaseMove) -> None:
+        """ Makes the move tabu, and frees the oldest move if the list is full. """
+        key = move.get_key()
+        self.keys.append(key)
+        self.counts[key] += 1
+        if len(self.keys) > self.tenure:
+            oldest = self.keys.popleft()
+            self.counts[oldest] -= 1
+            if self.counts[oldest] == 0:
+                del self.counts[oldest]
+
+    def contains(self, move: BaseMove) -> bool:
+        """ Returns True if the move is tabu, False otherwise. """
+        return move.get_key() in self.counts
+
+    def size(self) -> int:
+        return len(self.keys)
@@ -32,3 +32,14 @@ class BaseMove(metaclass=abc.ABCMeta):
                str: A string label to display in dot graph.
         """
         return str(self)
+
+    def get_key(self):
+        """
+        Return the key that identifies the move in the nogoods of the search.
+
+        By default, the move is its own key, which requires __eq__ and __hash__.
+
+        Returns:
+            Hashable: The key of the move.
+        """
+        return self
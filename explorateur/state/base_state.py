@@ -1,6 +1,5 @@
 import abc
-from typing import List, Union, Optional
-from explorateur.search.transition import Transition
+from typing import List, Union
 from explorateur.state.base_move import BaseMove
 
 
@@ -17,7 +16,6 @@ class BaseState(metaclass=abc.ABCMeta):
             For example, this can store variable and value assignments in the current state.
         """
         self.id: int = -1
-        self._transition: Optional[Transition] = None
 
     @abc.abstractmethod
     def execute(self, move: BaseMove) -> bool:
@@ -31,6 +29,35 @@ class BaseState(metaclass=abc.ABCMeta):
             bool: True if the execution was successful (valid), False otherwise.
         """
 
+    def is_feasible(self, move: BaseMove) -> bool:
+        """
+        Check whether the given move can be executed on the state, before the state is copied to execute it.
+
+        A cheap check here saves the copy of the state for moves that are known to fail.
+        Infeasible moves are counted as failed decisions, the same as moves whose execution fails.
+        By default, every move is feasible and the decision is left to execute().
+
+        Parameters:
+            move (BaseMove): The move to be checked on the state.
+
+        Returns:
+            bool: True if the move should be executed, False otherwise.
+        """
+        return True
+
+    def undo(self, move: BaseMove) -> None:
+        """
+        Revert the given move, the last move successfully executed on the state.
+
+        Optional. If implemented, local search executes moves in place and undoes the rejected moves,
+        instead of executing every move on a copy of the state.
+        In that case, execute() that returns False must leave the state unchanged.
+
+        Parameters:
+            move (BaseMove): The move to be reverted on the state.
+        """
+        raise NotImplementedError("undo() is not implemented")
+
     @abc.abstractmethod
     def get_moves(self) -> List[BaseMove]:
         """
@@ -73,6 +100,21 @@ class BaseState(metaclass=abc.ABCMeta):
         """
         return str(self)
 
+    def get_key(self):
+        """
+        Return the key that identifies the state in the visited states of graph search.
+
+        By default, the state is its own key, which requires __eq__ and __hash__.
+        Override to return a compact hashable key, e.g., a tuple of the assignments,
+        to save memory and hashing time in the visited states.
+        States with symmetries can return a canonical key, see explorateur.state.symmetry,
+        so that only one state of every symmetry class is visited.
+
+        Returns:
+            Hashable: The key of the state.
+        """
+        return self
+
     def get_objective(self) -> float:
         """
         Return the objective value of the state.
@@ -81,9 +123,51 @@ class BaseState(metaclass=abc.ABCMeta):
         By default, Best-First Search is set to minimization.
         To maximize, multiply your objective by -1.  
 
-        Note, if this function returns the same value for two states
-        there will be an error because there is no comparator between abstract Base States.
+        States with the same objective value are explored in the order they are generated.
 
         Returns:
             float: The objective function value for the state.
         """
+
+    def get_path_cost(self) -> float:
+        """
+        Return the cost of the path from the initial state to this state, known as g.
+
+        Cost-aware graph search, see SearchType.CostGraphSearch, keeps the best path cost of every state
+        and explores states by their path cost plus heuristic, known as f = g + h.
+        By default, the path cost is the objective, see get_objective().
+
+        Returns:
+            float: The path cost of the state.
+        """
+        return self.get_objective()
+
+    def get_objective_delta(self, move: BaseMove) -> float:
+        """
+        Return the change in the objective value of the state when the given move is executed.
+
+        Optional. If implemented, Best-First Search ranks every move by the objective of the state plus its delta,
+        before the successor is created, and the objective of the successor is not evaluated again.
+        Otherwise, every move is ranked by the objective of the state, see get_objective().
+        This makes ranking cheap when a move changes a few terms of an objective that is costly to evaluate.
+
+        Parameters:
+            move (BaseMove): The move to be evaluated on the state.
+
+        Returns:
+            float: The objective value of the successor minus the objective value of the state.
+        """
+        raise NotImplementedError("get_objective_delta() is not implemented")
+
+    def get_heuristic(self) -> float:
+        """
+        Return an estimate of the remaining cost from this state to a termination state, known as h.
+
+        Best-First Search with SearchType.CostGraphSearch is A* search with this heuristic.
+        The solution is the cheapest when the heuristic never overestimates the remaining cost.
+        By default, the heuristic is zero, which is uniform-cost search, i.e., Dijkstra's algorithm.
+
+        Returns:
+            float: The heuristic estimate of the state.
+        """
+        return 0
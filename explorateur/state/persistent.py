@@ -0,0 +1,453 @@
+from typing import Any, Hashable, Iterable, Iterator, Optional, Tuple
+
+from explorateur.state.base_state import BaseState
+
+# Every level of the tries branches on 5 bits, i.e., 32 children per node
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+# Hashes are taken as unsigned 64 bits, keys with the same 64 bits are kept in a collision node
+_HASH_MASK = (1 << 64) - 1
+_MAX_SHIFT = 64
+
+_MISSING = object()
+
+
+def _popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+class _CollisionNode:
+    """ Leaves of keys with the same hash, searched linearly. """
+
+    __slots__ = ("leaves",)
+
+    def __init__(self, leaves: Tuple[Tuple[int, Any, Any], ...]):
+        self.leaves = leaves
+
+    def find(self, h, shift, key):
+        for leaf in self.leaves:
+            if leaf[1] == key:
+                return leaf[2]
+        return _MISSING
+
+    def assoc(self, h, shift, key, value):
+        for i, leaf in enumerate(self.leaves):
+            if leaf[1] == key:
+                if leaf[2] is value:
+                    return self, False
+                return _CollisionNode(self.leaves[:i] + ((h, key, value),) + self.leaves[i + 1:]), False
+        return _CollisionNode(self.leaves + ((h, key, value),)), True
+
+    def without(self, h, shift, key):
+        for i, leaf in enumerate(self.leaves):
+            if leaf[1] == key:
+                leaves = self.leaves[:i] + self.leaves[i + 1:]
+                return _CollisionNode(leaves) if leaves else None
+        return self
+
+    def iter_leaves(self):
+        return iter(self.leaves)
+
+
+class _BitmapNode:
+    """
+    Node of the hash array mapped trie. The bitmap marks which of the 32 children are present,
+    and entries holds only the present ones, each either a leaf (hash, key, value) or a child node.
+    """
+
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: tuple):
+        self.bitmap = bitmap
+        self.entries = entries
+
+    def find(self, h, shift, key):
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return _MISSING
+        entry = self.entries[_popcount(self.bitmap & (bit - 1))]
+        if isinstance(entry, tuple):
+            return entry[2] if entry[0] == h and entry[1] == key else _MISSING
+        return entry.find(h, shift + _BITS, key)
+
+    def assoc(self, h, shift, key, value):
+        # Returns the new node, which is this node if nothing changes, and whether a key is added
+        bit = 1 << ((h >> shift) & _MASK)
+        index = _popcount(self.bitmap & (bit - 1))
+        entries = self.entries
+        if not self.bitmap & bit:
+            return _BitmapNode(self.bitmap | bit, entries[:index] + ((h, key, value),) + entries[index:]), True
+
+        entry = entries[index]
+        if isinstance(entry, tuple):
+            if entry[0] == h and entry[1] == key:
+                if entry[2] is value:
+                    return self, False
+                node, is_added = (h, key, value), False
+            else:
+                node, is_added = _merge(entry, (h, key, value), shift + _BITS), True
+        else:
+            node, is_added = entry.assoc(h, shift + _BITS, key, value)
+            if node is entry:
+                return self, False
+        return _BitmapNode(self.bitmap, entries[:index] + (node,) + entries[index + 1:]), is_added
+
+    def without(self, h, shift, key):
+        # Returns the new node, which is this node if the key is not found, or None if the node is empty
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self
+        index = _popcount(self.bitmap & (bit - 1))
+        entries = self.entries
+        entry = entries[index]
+        if isinstance(entry, tuple):
+            if entry[0] != h or entry[1] != key:
+                return self
+            node = None
+        else:
+            node = entry.without(h, shift + _BITS, key)
+            if node is entry:
+                return self
+
+        if node is None:
+            if len(entries) == 1:
+                return None
+            return _BitmapNode(self.bitmap ^ bit, entries[:index] + entries[index + 1:])
+
+        # A child left with a single leaf is replaced by the leaf, so lookups stay short
+        if isinstance(node, _BitmapNode) and len(node.entries) == 1 and isinstance(node.entries[0], tuple):
+            node = node.entries[0]
+        elif isinstance(node, _CollisionNode) and len(node.leaves) == 1:
+            node = node.leaves[0]
+        return _BitmapNode(self.bitmap, entries[:index] + (node,) + entries[index + 1:])
+
+    def iter_leaves(self):
+        for entry in self.entries:
+            if isinstance(entry, tuple):
+                yield entry
+            else:
+                yield from entry.iter_leaves()
+
+
+def _merge(leaf, other, shift):
+    # Node holding two leaves whose hashes are the same up to the given shift
+    if shift >= _MAX_SHIFT:
+        return _CollisionNode((leaf, other))
+    index = (leaf[0] >> shift) & _MASK
+    other_index = (other[0] >> shift) & _MASK
+    if index == other_index:
+        return _BitmapNode(1 << index, (_merge(leaf, other, shift + _BITS),))
+    entries = (leaf, other) if index < other_index else (other, leaf)
+    return _BitmapNode((1 << index) | (1 << other_index), entries)
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+class PersistentMap:
+    """
+    Immutable map, implemented as a hash array mapped trie (HAMT).
+
+    Updates return a new map in O(log n) that shares all but the changed path with this map,
+    so earlier versions stay valid and cost no copy. Keys must be hashable.
+    """
+
+    __slots__ = ("_root", "_size", "_hash")
+
+    def __init__(self, items: Optional[Any] = None):
+        self._root = _EMPTY_NODE
+        self._size = 0
+        self._hash = None
+        if items:
+            for key, value in (items.items() if hasattr(items, "items") else items):
+                self._root, is_added = self._root.assoc(hash(key) & _HASH_MASK, 0, key, value)
+                self._size += is_added
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._root.find(hash(key) & _HASH_MASK, 0, key)
+        return default if value is _MISSING else value
+
+    def set(self, key: Hashable, value: Any) -> "PersistentMap":
+        """ Returns a new map where the key has the given value. """
+        root, is_added = self._root.assoc(hash(key) & _HASH_MASK, 0, key, value)
+        if root is self._root:
+            return self
+        return PersistentMap._make(root, self._size + is_added)
+
+    def delete(self, key: Hashable) -> "PersistentMap":
+        """ Returns a new map without the key, raises KeyError if the key is not in the map. """
+        root = self._root.without(hash(key) & _HASH_MASK, 0, key)
+        if root is self._root:
+            raise KeyError(key)
+        return PersistentMap._make(root if root is not None else _EMPTY_NODE, self._size - 1)
+
+    def keys(self) -> Iterator[Hashable]:
+        return (leaf[1] for leaf in self._root.iter_leaves())
+
+    def values(self) -> Iterator[Any]:
+        return (leaf[2] for leaf in self._root.iter_leaves())
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        return ((leaf[1], leaf[2]) for leaf in self._root.iter_leaves())
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self._root.find(hash(key) & _HASH_MASK, 0, key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._root.find(hash(key) & _HASH_MASK, 0, key) is not _MISSING
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return self.keys()
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PersistentMap):
+            return NotImplemented
+        if self._size != len(other):
+            return False
+        return all(other.get(key, _MISSING) == value for key, value in self.items())
+
+    def __hash__(self) -> int:
+        # Values must be hashable too, the hash is computed once since the map never changes
+        if self._hash is None:
+            self._hash = hash(frozenset(self.items()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "PersistentMap(" + str(dict(self.items())) + ")"
+
+    @staticmethod
+    def _make(root, size) -> "PersistentMap":
+        persistent_map = PersistentMap()
+        persistent_map._root = root
+        persistent_map._size = size
+        return persistent_map
+
+
+class PersistentVector:
+    """
+    Immutable sequence, implemented as a trie of 32-way nodes.
+
+    Lookup, set, append, and pop of the last item are O(log n), with n the number of items,
+    and return a new vector that shares all but the changed path with this vector.
+    """
+
+    __slots__ = ("_root", "_shift", "_size", "_hash")
+
+    def __init__(self, items: Iterable[Any] = ()):
+        # Leaves hold the items, internal nodes hold up to 32 children, filled from the left
+        items = tuple(items)
+        self._size = len(items)
+        self._hash = None
+        if self._size <= _WIDTH:
+            self._root, self._shift = items, 0
+        else:
+            level = [items[i:i + _WIDTH] for i in range(0, self._size, _WIDTH)]
+            self._shift = _BITS
+            while len(level) > _WIDTH:
+                level = [tuple(level[i:i + _WIDTH]) for i in range(0, len(level), _WIDTH)]
+                self._shift += _BITS
+            self._root = tuple(level)
+
+    def set(self, index: int, value: Any) -> "PersistentVector":
+        """ Returns a new vector where the item at the index is the given value. """
+        index = self._check_index(index)
+        return PersistentVector._make(_assoc(self._root, self._shift, index, value), self._shift, self._size)
+
+    def append(self, value: Any) -> "PersistentVector":
+        """ Returns a new vector with the value added at the end. """
+        # A full trie grows one level, with the current root as the first child
+        if self._size == 1 << (self._shift + _BITS):
+            return PersistentVector._make((self._root, _new_path(self._shift, value)),
+                                          self._shift + _BITS, self._size + 1)
+        return PersistentVector._make(_push(self._root, self._shift, self._size, value), self._shift, self._size + 1)
+
+    def pop(self) -> "PersistentVector":
+        """ Returns a new vector without the last item, raises IndexError if the vector is empty. """
+        if self._size == 0:
+            raise IndexError("pop from empty vector")
+        root, shift = _pop(self._root, self._shift, self._size - 1), self._shift
+
+        # A root left with a single child shrinks one level
+        while shift > 0 and len(root) == 1:
+            root, shift = root[0], shift - _BITS
+        return PersistentVector._make(root, shift, self._size - 1)
+
+    def __getitem__(self, index: int) -> Any:
+        index = self._check_index(index)
+        node = self._root
+        shift = self._shift
+        while shift > 0:
+            node = node[(index >> shift) & _MASK]
+            shift -= _BITS
+        return node[index & _MASK]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        return _iter_items(self._root, self._shift)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PersistentVector):
+            return NotImplemented
+        return self._size == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "PersistentVector(" + str(list(self)) + ")"
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("vector index out of range")
+        return index
+
+    @staticmethod
+    def _make(root, shift, size) -> "PersistentVector":
+        vector = PersistentVector()
+        vector._root = root
+        vector._shift = shift
+        vector._size = size
+        return vector
+
+
+def _assoc(node, shift, index, value):
+    position = (index >> shift) & _MASK
+    child = value if shift == 0 else _assoc(node[position], shift - _BITS, index, value)
+    return node[:position] + (child,) + node[position + 1:]
+
+
+def _push(node, shift, index, value):
+    # Adds the value at the index, the next free position of the trie rooted at node
+    if shift == 0:
+        return node + (value,)
+    position = (index >> shift) & _MASK
+    if position < len(node):
+        return node[:position] + (_push(node[position], shift - _BITS, index, value),)
+    return node + (_new_path(shift - _BITS, value),)
+
+
+def _new_path(shift, value):
+    # Branch of single children down to a leaf holding the value
+    node = (value,)
+    while shift > 0:
+        node = (node,)
+        shift -= _BITS
+    return node
+
+
+def _pop(node, shift, index):
+    # Removes the item at the index, the last position of the trie rooted at node, and empty branches
+    if shift == 0:
+        return node[:-1]
+    position = (index >> shift) & _MASK
+    child = _pop(node[position], shift - _BITS, index)
+    return node[:position] + (child,) if child else node[:position]
+
+
+def _iter_items(node, shift):
+    if shift == 0:
+        yield from node
+    else:
+        for child in node:
+            yield from _iter_items(child, shift - _BITS)
+
+
+class BitsetDomain:
+    """
+    Immutable domain of non-negative integer values, stored as the bits of an integer.
+
+    Membership is O(1), and removing or assigning a value returns a new domain without copying a list.
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, values: Iterable[int] = ()):
+        bits = 0
+        for value in values:
+            bits |= 1 << value
+        self.bits: int = bits
+
+    def remove(self, value: int) -> "BitsetDomain":
+        """ Returns a new domain without the value. """
+        return BitsetDomain._make(self.bits & ~(1 << value))
+
+    def assign(self, value: int) -> "BitsetDomain":
+        """ Returns a new domain of only the value, or an empty domain if the value is not in this domain. """
+        return BitsetDomain._make(self.bits & (1 << value))
+
+    def intersect(self, other: "BitsetDomain") -> "BitsetDomain":
+        """ Returns a new domain of the values in both domains. """
+        return BitsetDomain._make(self.bits & other.bits)
+
+    def min(self) -> int:
+        """ Returns the smallest value, raises ValueError if the domain is empty. """
+        if not self.bits:
+            raise ValueError("min of empty domain")
+        return (self.bits & -self.bits).bit_length() - 1
+
+    def __contains__(self, value: int) -> bool:
+        return value >= 0 and (self.bits >> value) & 1 == 1
+
+    def __len__(self) -> int:
+        return _popcount(self.bits)
+
+    def __iter__(self) -> Iterator[int]:
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BitsetDomain):
+            return NotImplemented
+        return self.bits == other.bits
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __repr__(self) -> str:
+        return "BitsetDomain(" + str(list(self)) + ")"
+
+    @staticmethod
+    def _make(bits) -> "BitsetDomain":
+        domain = BitsetDomain()
+        domain.bits = bits
+        return domain
+
+
+class PersistentState(BaseState):
+    """
+    Abstract class for states whose attributes are immutable, e.g., PersistentMap, PersistentVector,
+    BitsetDomain, tuples, numbers, and strings.
+
+    The search copies a state before every move is executed. A persistent state is copied in O(1),
+    by a new object that refers to the same attributes, instead of a deep copy of every container.
+    For this to be safe, execute() must replace attributes with updated versions, e.g.,
+    self.var_to_val = self.var_to_val.set(var, val), and never change an attribute in place.
+    States of the search tree then share the parts of their containers that they have in common.
+    """
+
+    def __copy__(self) -> "PersistentState":
+        state = type(self).__new__(type(self))
+        state.__dict__.update(self.__dict__)
+        return state
+
+    def __deepcopy__(self, memo) -> "PersistentState":
+        state = self.__copy__()
+        memo[id(self)] = state
+        return state
@@ -29,6 +29,13 @@ class BaseStorage(metaclass=abc.ABCMeta):
     def size(self) -> int:
         """Returns the number of elements in the storage."""
 
+    def clear(self) -> None:
+        """
+        Removes every element, so that the storage can be reused by another search.
+        Optional, a storage that does not implement it is created anew for every query of search_many().
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def contains(self, state: BaseState) -> Optional[BaseState]:
         """ Returns the state if it is in the storage, None otherwise."""
@@ -0,0 +1,108 @@
+import math
+from typing import Optional
+
+from explorateur.state.storage.base_storage import BaseStorage
+from explorateur.state.base_state import BaseState
+
+_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def _mix(value: int) -> int:
+    # SplitMix64 finalizer, spreads the bits of small or sequential hashes over 64 bits
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+class BloomFilter(BaseStorage):
+    """
+    Class representing a probabilistic set of visited states, in the style of bitstate hashing.
+
+    Each state key, see BaseState.get_key(), sets a few bits in a fixed bit array.
+    A state is visited when all its bits are set, which can wrongly prune an unvisited state, a false positive,
+    but never misses a visited state. The bit array is sized from the expected number of states
+    and the target false positive rate, and its memory does not grow with the number of visited states.
+    """
+
+    def __init__(self, expected_num_states: int = 1000000, false_positive_rate: float = 0.001):
+        super().__init__()
+        self.expected_num_states: int = expected_num_states
+        self.target_false_positive_rate: float = false_positive_rate
+
+        # Optimal number of bits and hash functions for the expected number of states
+        self.num_bits: int = max(8, math.ceil(-expected_num_states * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes: int = max(1, round(self.num_bits / expected_num_states * math.log(2)))
+        self.storage: bytearray = bytearray((self.num_bits + 7) // 8)
+
+        # Number of inserted states that were not reported as visited, and number of set bits
+        self._size: int = 0
+        self.num_set_bits: int = 0
+
+    def insert(self, state: BaseState):
+        self.insert_key(state.get_key())
+
+    def insert_key(self, key) -> None:
+        """ Inserts the given state key. """
+        is_new = False
+        for bit in self._get_bits(key):
+            byte, mask = bit >> 3, 1 << (bit & 7)
+            if not self.storage[byte] & mask:
+                self.storage[byte] |= mask
+                self.num_set_bits += 1
+                is_new = True
+        if is_new:
+            self._size += 1
+
+    def remove(self) -> BaseState:
+        raise NotImplementedError("States cannot be removed from a bloom filter.")
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def size(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        self.storage[:] = bytes(len(self.storage))
+        self._size = 0
+        self.num_set_bits = 0
+
+    def contains(self, state: BaseState) -> Optional[BaseState]:
+        """ Returns the state if it is possibly in the filter, None if it is certainly not."""
+        return state if self.contains_key(state.get_key()) else None
+
+    def contains_key(self, key) -> bool:
+        """ Returns True if the state key is possibly in the filter, False if it is certainly not."""
+        for bit in self._get_bits(key):
+            if not self.storage[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+
+    @property
+    def memory(self) -> int:
+        """ Number of bytes of the bit array. """
+        return len(self.storage)
+
+    @property
+    def false_positive_rate(self) -> float:
+        """ Current probability that an unvisited state is reported as visited. """
+        return (self.num_set_bits / self.num_bits) ** self.num_hashes
+
+    @property
+    def estimated_num_states(self) -> float:
+        """ Estimated number of distinct states inserted, from the ratio of set bits. """
+        if self.num_set_bits >= self.num_bits:
+            return float("inf")
+        return -self.num_bits / self.num_hashes * math.log(1 - self.num_set_bits / self.num_bits)
+
+    @property
+    def estimated_coverage(self) -> float:
+        """ Estimated ratio of states not wrongly pruned, a lower bound from the final false positive rate. """
+        return 1 - self.false_positive_rate
+
+    def _get_bits(self, key):
+        # Double hashing derives the bits of every hash function from two independent 32-bit hashes
+        value = _mix(hash(key) & _MASK)
+        first, second = value & 0xFFFFFFFF, (value >> 32) | 1
+        return [(first + i * second) % self.num_bits for i in range(self.num_hashes)]
@@ -0,0 +1,102 @@
+import heapq
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+
+from explorateur.state.storage.base_storage import BaseStorage
+from explorateur.state.storage.bloom_filter import BloomFilter
+from explorateur.state.base_state import BaseState
+
+
+class BoundedHashSet(BaseStorage):
+    """
+    Class representing a set of visited states with a fixed capacity.
+
+    Stores state keys, see BaseState.get_key(). When the set is full, an entry is evicted by the policy:
+        - LRU: The least recently inserted or found entry.
+        - DEPTH: The entry inserted at the lowest depth.
+        - OBJECTIVE: The entry with the worst, i.e., highest, objective value.
+    An evicted state is no longer visited, and is expanded again when it is reached again.
+    Optionally, re-admissions of evicted states are counted approximately with a bloom filter of the evicted keys,
+    sized for as many evictions as the capacity.
+    """
+
+    LRU = "lru"
+    DEPTH = "depth"
+    OBJECTIVE = "objective"
+
+    POLICIES = (LRU, DEPTH, OBJECTIVE)
+
+    def __init__(self, capacity: int = 1000000, policy: str = LRU, is_readmission_counted: bool = False):
+        super().__init__()
+        self.capacity: int = capacity
+        self.policy: str = policy
+        self.is_readmission_counted: bool = is_readmission_counted
+
+        # Keys in recency order for LRU, otherwise a heap of keys by eviction priority finds the lowest
+        self.storage: Dict[Any, None] = OrderedDict()
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter = count()
+
+        # Statistics
+        self.num_evictions: int = 0
+        self.num_readmissions: int = 0
+        self._evicted: Optional[BloomFilter] = BloomFilter(capacity, 0.01) if is_readmission_counted else None
+
+    def insert(self, state: BaseState, depth: int = 0):
+        key = state.get_key()
+        if key in self.storage:
+            if self.policy == BoundedHashSet.LRU:
+                self.storage.move_to_end(key)
+            return
+
+        if self._evicted and self._evicted.size() > 0 and self._evicted.contains_key(key):
+            self.num_readmissions += 1
+
+        self.storage[key] = None
+        if self.policy != BoundedHashSet.LRU:
+            # Lowest priority is evicted first, so the worst objective is negated
+            priority = depth if self.policy == BoundedHashSet.DEPTH else -state.get_objective()
+            heapq.heappush(self._heap, (priority, next(self._counter), key))
+
+        if len(self.storage) > self.capacity:
+            self._evict()
+
+    def remove(self) -> BaseState:
+        """ Removes the next key to evict from the set."""
+        return self._evict()
+
+    def is_empty(self) -> bool:
+        return len(self.storage) == 0
+
+    def size(self) -> int:
+        return len(self.storage)
+
+    def clear(self) -> None:
+        self.storage.clear()
+        self._heap.clear()
+        self.num_evictions = 0
+        self.num_readmissions = 0
+        if self._evicted:
+            self._evicted.clear()
+
+    def contains(self, state: BaseState) -> Optional[BaseState]:
+        """ Returns the state if it is in the set, None otherwise."""
+        key = state.get_key()
+        if key not in self.storage:
+            return None
+        if self.policy == BoundedHashSet.LRU:
+            self.storage.move_to_end(key)
+        return state
+
+    def _evict(self) -> Any:
+        if self.policy == BoundedHashSet.LRU:
+            key = self.storage.popitem(last=False)[0]
+        else:
+            key = heapq.heappop(self._heap)[2]
+            del self.storage[key]
+
+        self.num_evictions += 1
+        if self._evicted:
+            self._evicted.insert_key(key)
+        return key
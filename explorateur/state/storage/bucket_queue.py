@@ -0,0 +1,134 @@
+import math
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from explorateur.state.storage.base_storage import BaseStorage
+from explorateur.state.storage.priority_queue import PriorityQueue
+from explorateur.state.base_state import BaseState
+
+
+class BucketQueue(BaseStorage):
+    """
+    Class representing a priority queue with a bucket of states per integer objective.
+    Insert and remove take constant amortized time, instead of the logarithmic time of a heap.
+    Ties are removed in insertion order, or in reverse insertion order if LIFO.
+
+    Without a key range, objectives must be integers, e.g., path costs or conflict counts.
+    On the first objective that is not an integer, or spreads the buckets too wide,
+    the queue falls back to a heap, see PriorityQueue.
+    With a key range, objectives are discretized to the bucket of their floor.
+    On the first objective out of the range, the queue falls back to a heap of the discretized objectives.
+    """
+
+    # Largest number of buckets without a key range, before falling back to a heap
+    MAX_BUCKETS = 1 << 16
+
+    def __init__(self, key_range: Optional[Tuple[int, int]] = None, is_lifo: bool = False):
+        super().__init__()
+        self.key_range: Optional[Tuple[int, int]] = key_range
+        self.is_lifo: bool = is_lifo
+
+        # Bucket i holds the states with objective low + i, buckets are created on first use
+        self.low: int = key_range[0] if key_range else 0
+        self.buckets: List[Optional[Deque[BaseState]]] = [None] * (key_range[1] - key_range[0] + 1 if key_range else 0)
+        self._cursor: int = 0  # every bucket before the cursor is empty
+        self._size: int = 0
+
+        # Heap after falling back, if any
+        self.heap: Optional[PriorityQueue] = None
+
+    def insert(self, state: BaseState, objective: Optional[float] = None):
+        """ Inserts a state with the given objective, or when not given, with the objective of the state. """
+        if objective is None:
+            objective = state.get_objective()
+        if self.key_range and type(objective) is not int:
+            objective = math.floor(objective)
+        if self.heap is not None:
+            self.heap.insert(state, objective)
+            return
+
+        if type(objective) is not int:
+            if isinstance(objective, float) and objective.is_integer():
+                objective = int(objective)
+            else:
+                self._fall_back(state, objective)
+                return
+
+        # Grow the buckets down or up to the objective, if no key range
+        i = objective - self.low
+        if i < 0 or i >= len(self.buckets):
+            if self.key_range:
+                self._fall_back(state, objective)
+                return
+            if not self.buckets:
+                self.low, i = objective, 0
+            elif max(len(self.buckets) - i, i + 1) > BucketQueue.MAX_BUCKETS:
+                self._fall_back(state, objective)
+                return
+            elif i < 0:
+                self.buckets[:0] = [None] * -i
+                self._cursor -= i
+                self.low, i = objective, 0
+            if i >= len(self.buckets):
+                self.buckets.extend([None] * (i + 1 - len(self.buckets)))
+
+        bucket = self.buckets[i]
+        if bucket is None:
+            bucket = self.buckets[i] = deque()
+        bucket.append(state)
+        if i < self._cursor:
+            self._cursor = i
+        self._size += 1
+
+    def remove(self) -> BaseState:
+        """ Removes a state with the smallest objective. """
+        if self.heap is not None:
+            return self.heap.remove()
+
+        buckets = self.buckets
+        cursor = self._cursor
+        while not buckets[cursor]:
+            cursor += 1
+        self._cursor = cursor
+        self._size -= 1
+        return buckets[cursor].pop() if self.is_lifo else buckets[cursor].popleft()
+
+    def is_empty(self) -> bool:
+        return self.size() == 0
+
+    def size(self) -> int:
+        return self.heap.size() if self.heap is not None else self._size
+
+    def clear(self) -> None:
+        # Buckets are kept for reuse, and a heap goes back to buckets
+        for bucket in self.buckets:
+            if bucket:
+                bucket.clear()
+        self._cursor = 0
+        self._size = 0
+        self.heap = None
+
+    def contains(self, state: BaseState) -> Optional[BaseState]:
+        """ Returns the state if it is in the bucket queue, None otherwise."""
+        if self.heap is not None:
+            return self.heap.contains(state)
+        for bucket in self.buckets:
+            if bucket and state in bucket:
+                return state
+        return None
+
+    @property
+    def is_heap(self) -> bool:
+        """ Whether the queue fell back to a heap. """
+        return self.heap is not None
+
+    def _fall_back(self, state: BaseState, objective: float) -> None:
+        # Move the states to a heap in insertion order per bucket, which keeps the order of ties
+        self.heap = PriorityQueue(self.is_lifo)
+        for i, bucket in enumerate(self.buckets):
+            if bucket:
+                for item in bucket:
+                    self.heap.insert(item, self.low + i)
+        self.buckets = []
+        self._size = 0
+        self.heap.insert(state, objective)
@@ -0,0 +1,55 @@
+from typing import Any, Dict, Optional
+
+from explorateur.state.storage.base_storage import BaseStorage
+from explorateur.state.base_state import BaseState
+
+
+class CostTable(BaseStorage):
+    """
+    Class representing the best path cost of visited states, see BaseState.get_path_cost().
+
+    States are keyed by their key, see BaseState.get_key().
+    A state reached again is a dominated duplicate unless its path is cheaper,
+    in which case the state is visited again, i.e., reopened.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.storage: Dict[Any, float] = dict()
+
+        # Statistics
+        self.num_dominated: int = 0
+        self.num_reopened: int = 0
+
+    def insert(self, state: BaseState, cost: float = 0):
+        """ Inserts the state with the cost of its path, which replaces any costlier path. """
+        key = state.get_key()
+        if key in self.storage:
+            self.num_reopened += 1
+        self.storage[key] = cost
+
+    def remove(self) -> Any:
+        return self.storage.popitem()[0]
+
+    def is_empty(self) -> bool:
+        return len(self.storage) == 0
+
+    def size(self) -> int:
+        return len(self.storage)
+
+    def clear(self) -> None:
+        self.storage.clear()
+        self.num_dominated = 0
+        self.num_reopened = 0
+
+    def contains(self, state: BaseState, cost: float = float("inf")) -> Optional[BaseState]:
+        """ Returns the state if it is visited with a path no costlier than the given cost, None otherwise. """
+        best_cost = self.storage.get(state.get_key())
+        if best_cost is not None and best_cost <= cost:
+            self.num_dominated += 1
+            return state
+        return None
+
+    def get_cost(self, state: BaseState) -> Optional[float]:
+        """ Returns the best path cost of the state, or None if the state is not visited. """
+        return self.storage.get(state.get_key())
@@ -1,7 +1,11 @@
 from explorateur.state.storage.queue import Queue
 from explorateur.state.storage.stack import Stack
-from explorateur.state.storage.priority_queue import PriorityQueue
+from explorateur.state.storage.bucket_queue import BucketQueue
 from explorateur.state.storage.hash import HashSet
+from explorateur.state.storage.bloom_filter import BloomFilter
+from explorateur.state.storage.bounded_hash import BoundedHashSet
+from explorateur.state.storage.cost_table import CostTable
+from explorateur.state.storage.transposition_table import TranspositionTable
 from explorateur.state.storage.base_storage import BaseStorage
 from explorateur.search.exploration_type import ExplorationType
 from explorateur.search.search_type import SearchType
@@ -12,16 +16,25 @@ from typing import Union, Optional
 class StorageFactory:
     """ A factory class for creating different types of storage objects."""
 
-    factory = {ExplorationType.BestFirst: PriorityQueue,
+    factory = {ExplorationType.BestFirst: BucketQueue,
                ExplorationType.BreadthFirst: Queue,
                ExplorationType.DepthFirst: Stack,
-               SearchType.GraphSearch: HashSet}
+               ExplorationType.LimitedDiscrepancy: Stack,
+               SearchType.GraphSearch: HashSet,
+               SearchType.TranspositionSearch: TranspositionTable,
+               SearchType.BitstateSearch: BloomFilter,
+               SearchType.BoundedGraphSearch: BoundedHashSet,
+               SearchType.CostGraphSearch: CostTable}
+
+    # Best first search passes its fields to its storage, like the search types
+    exploration_types = (ExplorationType.BreadthFirst, ExplorationType.DepthFirst, ExplorationType.LimitedDiscrepancy)
 
     @staticmethod
     def create(storage_type: Union[All_Exploration_Types, SearchType.GraphSearch]) -> Optional[BaseStorage]:
         """
         Create a storage object based on the given storage type.
         If storage type does not exist, returns None.
+        The fields of a search type are passed as arguments to its storage.
 
         Args:
             storage_type (Union[All_Exploration_Types, SearchType.GraphSearch]): The type of storage to create.
@@ -31,4 +44,8 @@ class StorageFactory:
 
         """
         storage = StorageFactory.factory.get(type(storage_type))
-        return storage() if storage else None
+        if storage is None:
+            return None
+
+        # Other exploration types configure the search, not their storage
+        return storage() if type(storage_type) in StorageFactory.exploration_types else storage(*storage_type)
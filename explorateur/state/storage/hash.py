@@ -12,7 +12,7 @@ class HashSet(BaseStorage):
         self.storage: Set[BaseState] = set()
 
     def insert(self, state: BaseState):
-        self.storage.add(state)
+        self.storage.add(state.get_key())
 
     def remove(self) -> BaseState:
         return self.storage.pop()
@@ -23,6 +23,9 @@ class HashSet(BaseStorage):
     def size(self) -> int:
         return len(self.storage)
 
+    def clear(self) -> None:
+        self.storage.clear()
+
     def contains(self, state: BaseState) -> Optional[BaseState]:
         """ Returns the state if it is in the hashset, None otherwise."""
-        return state if state in self.storage else None
+        return state if state.get_key() in self.storage else None
@@ -1,5 +1,6 @@
 import heapq
-from typing import List, Optional
+from itertools import count
+from typing import List, Optional, Tuple
 
 from explorateur.state.storage.base_storage import BaseStorage
 from explorateur.state.base_state import BaseState
@@ -8,18 +9,27 @@ from explorateur.state.base_state import BaseState
 # Alternatively, we can use queue.PriorityQueue which is thread-safe
 # For single-thread applications, heapq is more efficient
 class PriorityQueue(BaseStorage):
-    """  Class representing a priority queue. Root is the smallest element. """
+    """
+    Class representing a priority queue. Root is the smallest element.
+    Ties are removed in insertion order, or in reverse insertion order if LIFO.
+    """
 
-    def __init__(self):
+    def __init__(self, is_lifo: bool = False):
         super().__init__()
-        self.storage: List[BaseState] = list()
+        self.storage: List[Tuple[float, int, BaseState]] = list()
 
-    def insert(self, state: BaseState):
-        heapq.heappush(self.storage, (state.get_objective(), state))
+        # Insertion counter breaks ties between equal objectives without comparing states
+        self._counter = count(0, -1) if is_lifo else count()
+
+    def insert(self, state: BaseState, objective: Optional[float] = None):
+        """ Inserts a state with the given objective, or when not given, with the objective of the state. """
+        if objective is None:
+            objective = state.get_objective()
+        heapq.heappush(self.storage, (objective, next(self._counter), state))
 
     def remove(self) -> BaseState:
         """ Removes a state from the priority queue."""
-        return heapq.heappop(self.storage)[1]  # the first item is the key
+        return heapq.heappop(self.storage)[2]  # the first items are the key and the tie breaker
 
     def is_empty(self) -> bool:
         return len(self.storage) == 0
@@ -27,9 +37,12 @@ class PriorityQueue(BaseStorage):
     def size(self) -> int:
         return len(self.storage)
 
+    def clear(self) -> None:
+        self.storage.clear()
+
     def contains(self, state: BaseState) -> Optional[BaseState]:
         """ Returns the state if it is in the priority queue, None otherwise."""
-        try:
-            return self.storage[self.storage.index(state)]
-        except ValueError:
-            return None
+        for _, _, item in self.storage:
+            if item == state:
+                return item
+        return None
@@ -23,6 +23,9 @@ class Stack(BaseStorage):
     def size(self) -> int:
         return len(self.storage)
 
+    def clear(self) -> None:
+        self.storage.clear()
+
     def contains(self, state: BaseState) -> Optional[BaseState]:
         """ Returns the state if it is in the stack, None otherwise."""
         try:
@@ -0,0 +1,115 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from explorateur.state.storage.base_storage import BaseStorage
+from explorateur.state.base_state import BaseState
+
+
+class TranspositionTable(BaseStorage):
+    """
+    Class representing a depth-aware transposition table.
+
+    Stores the shallowest depth at which each state key was expanded.
+    A state reached again at the same or a deeper depth is visited, since its subtree was already explored
+    with at least as much depth left. A state reached at a shallower depth is not, and is expanded again.
+
+    Without a capacity, every key is kept. With a capacity, keys are hashed into a fixed number of slots
+    and collisions are resolved by the replacement policy:
+        - DEPTH_PREFERRED: Replace the entry only if the new entry is as shallow or shallower.
+        - ALWAYS_REPLACE: Always replace the entry with the new entry.
+        - TWO_TIER: Keep a depth-preferred slot together with an always-replace slot.
+    """
+
+    DEPTH_PREFERRED = "depth_preferred"
+    ALWAYS_REPLACE = "always_replace"
+    TWO_TIER = "two_tier"
+
+    POLICIES = (DEPTH_PREFERRED, ALWAYS_REPLACE, TWO_TIER)
+
+    def __init__(self, capacity: Optional[int] = None, policy: str = DEPTH_PREFERRED):
+        super().__init__()
+        self.capacity: Optional[int] = capacity
+        self.policy: str = policy
+
+        # Unbounded table from key to depth, or fixed slots of (key, depth) entries
+        # In two-tier, the first half of the slots is depth-preferred and the second half is always-replace
+        if capacity is None:
+            self.storage: Dict[Any, int] = dict()
+        else:
+            num_slots = 2 * capacity if policy == TranspositionTable.TWO_TIER else capacity
+            self.storage: List[Optional[Tuple[Any, int]]] = [None] * num_slots
+        self._size: int = 0
+
+    def insert(self, state: BaseState, depth: int = 0):
+        """ Inserts the state key with the depth it is expanded at, keeping the shallowest depth of the key. """
+        key = state.get_key()
+        if self.capacity is None:
+            stored = self.storage.get(key)
+            if stored is None or depth < stored:
+                self.storage[key] = depth
+            return
+
+        slot = hash(key) % self.capacity
+        if self.policy == TranspositionTable.ALWAYS_REPLACE:
+            self._replace(slot, key, depth)
+        elif self.policy == TranspositionTable.DEPTH_PREFERRED:
+            self._replace_if_shallower(slot, key, depth)
+        elif not self._replace_if_shallower(slot, key, depth):
+            self._replace(self.capacity + slot, key, depth)
+
+    def remove(self) -> BaseState:
+        """ Removes a key from the table."""
+        if self.capacity is None:
+            return self.storage.popitem()[0]
+        for slot, entry in enumerate(self.storage):
+            if entry is not None:
+                self.storage[slot] = None
+                self._size -= 1
+                return entry[0]
+        raise KeyError("remove from an empty transposition table")
+
+    def is_empty(self) -> bool:
+        return self.size() == 0
+
+    def size(self) -> int:
+        return len(self.storage) if self.capacity is None else self._size
+
+    def clear(self) -> None:
+        if self.capacity is None:
+            self.storage.clear()
+        else:
+            self.storage[:] = [None] * len(self.storage)
+        self._size = 0
+
+    def contains(self, state: BaseState, depth: int = 0) -> Optional[BaseState]:
+        """ Returns the state if its key is stored at the same or a shallower depth, None otherwise."""
+        stored = self.get_depth(state)
+        return state if stored is not None and stored <= depth else None
+
+    def get_depth(self, state: BaseState) -> Optional[int]:
+        """ Returns the shallowest depth stored for the state key, None if the key is not stored."""
+        key = state.get_key()
+        if self.capacity is None:
+            return self.storage.get(key)
+
+        slot = hash(key) % self.capacity
+        depth = None
+        for slot in range(slot, len(self.storage), self.capacity):
+            entry = self.storage[slot]
+            if entry is not None and entry[0] == key and (depth is None or entry[1] < depth):
+                depth = entry[1]
+        return depth
+
+    def _replace(self, slot: int, key: Any, depth: int) -> None:
+        entry = self.storage[slot]
+        if entry is None:
+            self._size += 1
+        elif entry[0] == key and entry[1] <= depth:
+            return
+        self.storage[slot] = (key, depth)
+
+    def _replace_if_shallower(self, slot: int, key: Any, depth: int) -> bool:
+        entry = self.storage[slot]
+        if entry is None or entry[0] == key or depth <= entry[1]:
+            self._replace(slot, key, depth)
+            return True
+        return False
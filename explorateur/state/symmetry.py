@@ -0,0 +1,57 @@
+from typing import Any, Dict, Hashable, Iterator, Sequence, Tuple
+
+Grid = Tuple[Tuple[Any, ...], ...]
+"""Grid type is defined as a tuple of rows."""
+
+
+def dihedral_transforms(grid: Sequence[Sequence[Any]]) -> Iterator[Grid]:
+    """
+    Yields the eight symmetries of the 2D grid, i.e., the four rotations of the grid and of its mirror.
+
+    Arguments:
+        - grid (Sequence[Sequence[Any]]): The grid as a sequence of rows.
+
+    Returns:
+        Iterator[Grid]: The transformed grids as tuples of rows, starting with the grid itself.
+    """
+    current = tuple(tuple(row) for row in grid)
+    for _ in range(2):
+        for _ in range(4):
+            yield current
+            # Rotate clockwise, the first column from the bottom becomes the first row
+            current = tuple(zip(*reversed(current)))
+        current = tuple(tuple(reversed(row)) for row in current)
+
+
+def dihedral_key(grid: Sequence[Sequence[Any]]) -> Grid:
+    """
+    Returns the canonical key of the 2D grid under rotations and reflections.
+
+    Grids that are rotations or reflections of each other have the same key.
+    Use it in BaseState.get_key() so that graph search visits one state of every symmetry class.
+    Grid values must be comparable with each other.
+
+    Arguments:
+        - grid (Sequence[Sequence[Any]]): The grid as a sequence of rows.
+
+    Returns:
+        Grid: The smallest of the eight symmetries of the grid.
+    """
+    return min(dihedral_transforms(grid))
+
+
+def value_permutation_key(values: Sequence[Hashable]) -> Tuple[int, ...]:
+    """
+    Returns the canonical key of the values under any permutation of the values, e.g., interchangeable colors.
+
+    Values are renamed in the order they first appear, so sequences that are the same up to a renaming
+    of the values have the same key. For example, "aab" and "bba" both become (0, 0, 1).
+
+    Arguments:
+        - values (Sequence[Hashable]): The values of the state variables, in a fixed order of variables.
+
+    Returns:
+        Tuple[int, ...]: The values renamed by the order of their first appearance.
+    """
+    names: Dict[Hashable, int] = {}
+    return tuple(names.setdefault(value, len(names)) for value in values)
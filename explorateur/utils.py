@@ -7,10 +7,14 @@ from explorateur.search.search_type import SearchType
 Num = Union[int, float]
 """Num type is defined as integer or float."""
 
-All_Exploration_Types = Union[ExplorationType.BestFirst, ExplorationType.BreadthFirst, ExplorationType.DepthFirst]
+All_Exploration_Types = Union[ExplorationType.BestFirst, ExplorationType.BreadthFirst, ExplorationType.DepthFirst,
+                              ExplorationType.LimitedDiscrepancy, ExplorationType.MCTS,
+                              ExplorationType.HillClimbing, ExplorationType.SimulatedAnnealing,
+                              ExplorationType.TabuSearch]
 """All possible exploration types"""
 
-All_Search_Types = Union[SearchType.GraphSearch, SearchType.TreeSearch]
+All_Search_Types = Union[SearchType.GraphSearch, SearchType.TreeSearch, SearchType.TranspositionSearch,
+                         SearchType.BitstateSearch, SearchType.BoundedGraphSearch, SearchType.CostGraphSearch]
 """All possible search types"""
 
 
@@ -21,7 +21,7 @@ setuptools.setup(
     author="xxx",
     url="https://github.com/skadio/explorateur",
     packages=setuptools.find_packages(
-        exclude=["*.tests", "*.tests.*", "tests.*", "tests", "notebooks"]),
+        exclude=["*.tests", "*.tests.*", "tests.*", "tests", "benchmarks", "benchmarks.*", "notebooks"]),
     install_requires=required,
     include_package_data=True,
     classifiers=[
@@ -0,0 +1,29 @@
+import copy as cp
+
+from benchmarks.run import compare, run_benchmark, DOMAINS
+from tests.test_base import BaseTest
+
+
+class BenchmarksTest(BaseTest):
+
+    def test_domains_solvable(self):
+        for domain in DOMAINS:
+            result = run_benchmark(domain, "quick", 123456, "BestFirst", "GraphSearch", is_memory=False)
+            self.assertTrue(result["is_solution"], domain)
+            self.assertEqual(result["time_to_first_solution"], result["total_time"])
+
+    def test_memory(self):
+        result = run_benchmark("n_queens", "quick", 123456, "DepthFirst", "TreeSearch", is_memory=True)
+        self.assertGreater(result["peak_memory"], 0)
+
+    def test_compare(self):
+        result = run_benchmark("n_queens", "quick", 123456, "DepthFirst", "TreeSearch", is_memory=False)
+        baseline = {"results": {"n_queens/DepthFirst/TreeSearch": result}}
+        self.assertEqual(compare(baseline, baseline), [])
+
+        # More decisions, fewer nodes per second, and no solution are regressions
+        current = cp.deepcopy(baseline)
+        current["results"]["n_queens/DepthFirst/TreeSearch"].update(is_solution=False,
+                                                                    num_decisions=result["num_decisions"] * 2,
+                                                                    nodes_per_second=0)
+        self.assertEqual(len(compare(current, baseline)), 3)
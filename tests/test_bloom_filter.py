@@ -0,0 +1,48 @@
+from explorateur import Explorateur, ExplorationType, SearchType
+from explorateur.state.storage.bloom_filter import BloomFilter
+from tests.test_base import BaseTest
+from tests.test_symmetry import MarkState
+from tests.test_transposition import NodeState
+
+
+class BloomFilterTest(BaseTest):
+
+    def test_sizing(self):
+        bloom = BloomFilter(1000, 0.01)
+        self.assertEqual(bloom.num_bits, 9586)
+        self.assertEqual(bloom.num_hashes, 7)
+        self.assertEqual(bloom.memory, 1199)
+        self.assertTrue(bloom.is_empty())
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000, 0.01)
+        for node in range(1000):
+            bloom.insert(NodeState(node))
+
+        for node in range(1000):
+            self.assertTrue(bloom.contains(NodeState(node)))
+
+        # Unvisited states are rarely reported as visited, close to the target rate
+        num_false_positives = sum(bloom.contains(NodeState(node)) is not None for node in range(1000, 11000))
+        self.assertLess(num_false_positives, 300)
+        self.assertAlmostEqual(bloom.false_positive_rate, 0.01, delta=0.005)
+        self.assertAlmostEqual(bloom.estimated_num_states, 1000, delta=50)
+        self.assertGreater(bloom.estimated_coverage, 0.98)
+
+    def test_bitstate_search(self):
+        num_decisions = []
+        for search_type in [SearchType.GraphSearch(), SearchType.BitstateSearch(1000, 0.0001)]:
+            explorer = Explorateur()
+            explorer.search(MarkState(is_symmetric=False),
+                            exploration_type=ExplorationType.DepthFirst(),
+                            search_type=search_type)
+            num_decisions.append(explorer.num_decisions)
+
+        # Without false positives, bitstate search visits the same states as exact graph search
+        self.assertEqual(num_decisions[0], num_decisions[1])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Explorateur().search(NodeState(), search_type=SearchType.BitstateSearch(false_positive_rate=1.5))
+        with self.assertRaises(NotImplementedError):
+            BloomFilter(10).remove()
@@ -0,0 +1,80 @@
+from explorateur import Explorateur, ExplorationType, SearchType
+from explorateur.state.storage.bounded_hash import BoundedHashSet
+from tests.test_base import BaseTest
+from tests.test_symmetry import MarkState
+from tests.test_transposition import NodeState
+
+
+class ObjectiveState(NodeState):
+
+    def get_objective(self) -> float:
+        return self.node
+
+
+class BoundedHashTest(BaseTest):
+
+    def test_lru(self):
+        closed = BoundedHashSet(2, BoundedHashSet.LRU, is_readmission_counted=True)
+        closed.insert(NodeState(1))
+        closed.insert(NodeState(2))
+        self.assertTrue(closed.contains(NodeState(1)))
+
+        # State 2 is the least recently used
+        closed.insert(NodeState(3))
+        self.assertFalse(closed.contains(NodeState(2)))
+        self.assertTrue(closed.contains(NodeState(1)))
+        self.assertEqual(closed.size(), 2)
+        self.assertEqual(closed.num_evictions, 1)
+
+        # State 2 is admitted again after its eviction
+        closed.insert(NodeState(2))
+        self.assertEqual(closed.num_readmissions, 1)
+
+    def test_depth(self):
+        closed = BoundedHashSet(2, BoundedHashSet.DEPTH)
+        closed.insert(NodeState(1), 3)
+        closed.insert(NodeState(2), 1)
+        closed.insert(NodeState(3), 2)
+        self.assertFalse(closed.contains(NodeState(2)))
+        self.assertTrue(closed.contains(NodeState(1)))
+        self.assertTrue(closed.contains(NodeState(3)))
+
+    def test_objective(self):
+        closed = BoundedHashSet(2, BoundedHashSet.OBJECTIVE)
+        closed.insert(ObjectiveState(1))
+        closed.insert(ObjectiveState(5))
+        closed.insert(ObjectiveState(3))
+        self.assertFalse(closed.contains(ObjectiveState(5)))
+        self.assertEqual(closed.remove(), 3)
+
+    def test_bounded_graph_search(self):
+        num_decisions = []
+        for search_type in [SearchType.GraphSearch(), SearchType.BoundedGraphSearch(100),
+                            SearchType.BoundedGraphSearch(2, is_readmission_counted=True)]:
+            explorer = Explorateur()
+            explorer.search(MarkState(is_symmetric=True),
+                            exploration_type=ExplorationType.DepthFirst(),
+                            search_type=search_type)
+            num_decisions.append(explorer.num_decisions)
+
+        # Within capacity, the same states are visited as exact graph search
+        # Otherwise, evicted states are expanded again
+        self.assertEqual(num_decisions[1], num_decisions[0])
+        self.assertGreater(num_decisions[2], num_decisions[0])
+        self.assertGreater(explorer.closed.num_evictions, 0)
+        self.assertGreater(explorer.closed.num_readmissions, 0)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Explorateur().search(NodeState(), search_type=SearchType.BoundedGraphSearch(policy="random"))
+        with self.assertRaises(TypeError):
+            Explorateur().search(NodeState(), search_type=SearchType.BoundedGraphSearch(is_readmission_counted=1))
+
+    def test_readmissions_opt_in(self):
+        # Without counting re-admissions, no bloom filter is allocated
+        closed = BoundedHashSet(2)
+        self.assertIsNone(closed._evicted)
+        for node in [1, 2, 3, 1]:
+            closed.insert(NodeState(node))
+        self.assertEqual(closed.num_evictions, 2)
+        self.assertEqual(closed.num_readmissions, 0)
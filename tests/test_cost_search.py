@@ -0,0 +1,119 @@
+from typing import List
+
+from explorateur import Explorateur, BaseMove, BaseState, ExplorationType, SearchType
+from tests.test_base import BaseTest
+
+# https://neetcode.io/problems/network-delay-time, the direct edge to 4 is costlier than the path through 2 and 3
+NETWORK = {1: {4: 4, 2: 1}, 2: {3: 1}, 3: {4: 1}, 4: {}}
+
+
+class EdgeMove(BaseMove):
+
+    def __init__(self, u):
+        self.u = u
+
+    def __str__(self) -> str:
+        return "Move to: " + str(self.u)
+
+
+class VertexState(BaseState):
+
+    # Plain state without __eq__ or __hash__, the key is the vertex and the path cost is separate
+    def __init__(self, graph, v, target):
+        super().__init__()
+        self.graph = graph
+        self.v = v
+        self.target = target
+        self.cost = 0
+
+    def get_moves(self) -> List[EdgeMove]:
+        return [EdgeMove(u) for u in self.graph[self.v]]
+
+    def execute(self, move: EdgeMove) -> bool:
+        self.cost += self.graph[self.v][move.u]
+        self.v = move.u
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return self.v == self.target
+
+    def get_key(self):
+        return self.v
+
+    def get_path_cost(self) -> float:
+        return self.cost
+
+    def get_objective(self) -> float:
+        return self.cost
+
+    def __str__(self) -> str:
+        return str(self.v) + " at " + str(self.cost)
+
+
+class GridState(VertexState):
+
+    # Walks an open grid with unit moves from the corner to the target, Manhattan distance is the heuristic
+    def __init__(self, size, target, is_heuristic):
+        super().__init__(None, (0, 0), target)
+        self.size = size
+        self.is_heuristic = is_heuristic
+
+    def get_moves(self) -> List[EdgeMove]:
+        x, y = self.v
+        return [EdgeMove((x + dx, y + dy)) for dx, dy in ((1, 0), (0, 1), (-1, 0), (0, -1))
+                if 0 <= x + dx < self.size and 0 <= y + dy < self.size]
+
+    def execute(self, move: EdgeMove) -> bool:
+        self.cost += 1
+        self.v = move.u
+        return True
+
+    def get_heuristic(self) -> float:
+        if not self.is_heuristic:
+            return 0
+        return abs(self.target[0] - self.v[0]) + abs(self.target[1] - self.v[1])
+
+
+class CostSearchTest(BaseTest):
+
+    def search(self, state, exploration_type=ExplorationType.BestFirst()):
+        explorer = Explorateur()
+        is_solution = explorer.search(state,
+                                      exploration_type=exploration_type,
+                                      search_type=SearchType.CostGraphSearch(),
+                                      max_moves=100000)
+        return explorer, is_solution
+
+    def test_uniform_cost(self):
+        explorer, is_solution = self.search(VertexState(NETWORK, 1, 4))
+        self.assertTrue(is_solution)
+        self.assertEqual(explorer.solution_state.cost, 3)
+        self.assertEqual([move.u for move in explorer.solution_moves], [2, 3, 4])
+
+        # Graph search finds the direct edge first, which is generated first
+        explorer = Explorateur()
+        explorer.search(VertexState(NETWORK, 1, 4),
+                        exploration_type=ExplorationType.BestFirst(), search_type=SearchType.GraphSearch())
+        self.assertEqual(explorer.solution_state.cost, 4)
+
+    def test_reopening(self):
+        # Without a target, depth first search reaches 4 again by a cheaper path and visits it again
+        explorer, is_solution = self.search(VertexState(NETWORK, 1, None), ExplorationType.DepthFirst())
+        self.assertFalse(is_solution)
+        self.assertEqual(explorer.closed.get_cost(VertexState(NETWORK, 4, None)), 3)
+        self.assertEqual(explorer.closed.num_reopened, 1)
+
+    def test_a_star(self):
+        explorer, is_solution = self.search(GridState(8, (7, 3), is_heuristic=False))
+        self.assertTrue(is_solution)
+        self.assertEqual(explorer.solution_state.cost, 10)
+
+        # The heuristic finds the same cheapest path with fewer decisions
+        a_star_explorer, is_solution = self.search(GridState(8, (7, 3), is_heuristic=True))
+        self.assertTrue(is_solution)
+        self.assertEqual(a_star_explorer.solution_state.cost, 10)
+        self.assertLess(a_star_explorer.num_decisions, explorer.num_decisions)
+
+        # Dominated duplicates are skipped, every cell is stored once
+        self.assertGreater(explorer.closed.num_dominated, 0)
+        self.assertLessEqual(explorer.closed.size(), 64)
@@ -0,0 +1,50 @@
+import os
+import tempfile
+
+from explorateur import Explorateur, ExplorationType, Hook, SearchStats, SearchType
+from tests.test_base import BaseTest, MyState, MyMove
+
+
+class FeasibleState(MyState):
+
+    # Reject the fake fails before the state is copied
+    def is_feasible(self, move: MyMove) -> bool:
+        return move not in self.fake_fails
+
+
+class FeasibleTest(BaseTest):
+
+    def search_dot(self, initial_state):
+        explorer = Explorateur()
+        fails = []
+        explorer.add_hook(Hook.ON_EXECUTE_FAIL, lambda explorer, state, move: fails.append(str(move)))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dot_filename = os.path.join(temp_dir, "search.dot")
+            explorer.search(initial_state,
+                            exploration_type=ExplorationType.DepthFirst(),
+                            search_type=SearchType.TreeSearch(),
+                            dot_filename=dot_filename,
+                            stats_level=SearchStats.LOW)
+            with open(dot_filename) as dot_file:
+                return explorer, fails, dot_file.read()
+
+    def test_feasible_same_as_fails(self):
+        fake_fails = [MyMove("y", "==", 10), MyMove("z", "!=", 100)]
+        explorer, fails, dot = self.search_dot(MyState({"x": [1, 2], "y": [10, 20], "z": [100, 200]},
+                                                       fake_fails=fake_fails))
+        feasible_explorer, feasible_fails, feasible_dot = self.search_dot(
+            FeasibleState({"x": [1, 2], "y": [10, 20], "z": [100, 200]}, fake_fails=fake_fails))
+
+        # Infeasible moves are counted, hooked, and drawn the same as failed executions
+        self.assertEqual(feasible_explorer.num_decisions, explorer.num_decisions)
+        self.assertEqual(feasible_explorer.num_failed_decisions, explorer.num_failed_decisions)
+        self.assertEqual(feasible_fails, fails)
+        self.assertEqual(feasible_dot, dot)
+
+        # But they are never copied or executed
+        num_fails = explorer.num_failed_decisions
+        self.assertGreater(num_fails, 0)
+        stats, feasible_stats = explorer.stats, feasible_explorer.stats
+        self.assertEqual(feasible_stats.call_counts[SearchStats.COPY], stats.call_counts[SearchStats.COPY] - num_fails)
+        self.assertEqual(feasible_stats.call_counts[SearchStats.EXECUTE],
+                         stats.call_counts[SearchStats.EXECUTE] - num_fails)
@@ -0,0 +1,118 @@
+from explorateur import Explorateur, ExplorationType, SearchType, Hook
+from tests.test_base import BaseTest, MyState, MyMove
+
+
+class HookTest(BaseTest):
+
+    def setUp(self):
+        self.explorer = Explorateur()
+        self.initial_state = MyState({"x": [1, 2], "y": [10, 20], "z": [100, 200]})
+
+    def search(self, **kwargs):
+        return self.explorer.search(self.initial_state,
+                                    exploration_type=ExplorationType.DepthFirst(),
+                                    search_type=SearchType.TreeSearch(),
+                                    max_moves=100,
+                                    **kwargs)
+
+    def test_no_hooks(self):
+        self.search()
+        self.assertEqual(self.explorer.num_decisions, 14)
+
+    def test_on_expand_prunes_moves(self):
+        # Keep only the equality moves, a single path down the tree
+        self.explorer.add_hook(Hook.ON_EXPAND,
+                               lambda explorer, state, moves: [m for m in moves if m.constraint == "=="])
+        self.search()
+        self.assertEqual(self.explorer.num_decisions, 3)
+        self.assertEqual(self.explorer.num_failed_decisions, 0)
+
+    def test_on_generate_and_fail(self):
+        generated, failed = [], []
+
+        def on_generate(explorer, state, move, successor):
+            generated.append(move)
+            return move != MyMove("x", "!=", 1)
+
+        self.explorer.add_hook(Hook.ON_GENERATE, on_generate)
+        self.explorer.add_hook(Hook.ON_EXECUTE_FAIL, lambda explorer, state, move: failed.append(move))
+        self.search()
+
+        # The subtree of x != 1 is pruned
+        self.assertEqual(self.explorer.num_decisions, 8)
+        self.assertEqual(self.explorer.num_failed_decisions, 1)
+        self.assertEqual(len(generated), 8)
+        self.assertEqual(failed, [MyMove("x", "!=", 1)])
+
+    def test_on_solution(self):
+        solutions = []
+        self.explorer.add_hook(Hook.ON_SOLUTION, lambda explorer, state: solutions.append(state))
+        self.initial_state.is_exhaustive_search = False
+        self.assertTrue(self.search())
+        self.assertEqual(solutions, [self.explorer.solution_state])
+
+    def test_on_progress_and_stop(self):
+        progress = []
+
+        def on_progress(explorer):
+            progress.append(explorer.num_decisions)
+            if explorer.num_decisions >= 6:
+                explorer.stop("Enough progress")
+
+        limits = []
+        self.explorer.add_hook(Hook.ON_PROGRESS, on_progress, every_decisions=3)
+        self.explorer.add_hook(Hook.ON_LIMIT, lambda explorer, state, cause: limits.append(cause))
+        self.assertFalse(self.search())
+
+        self.assertEqual(progress, [3, 6])
+        self.assertEqual(self.explorer.num_decisions, 6)
+        self.assertEqual(limits, ["Enough progress"])
+
+    def test_on_progress_intervals(self):
+        # Every progress callback keeps its own interval
+        every_two, every_five = [], []
+
+        def on_two(explorer):
+            every_two.append(explorer.num_decisions)
+
+        def on_five(explorer):
+            every_five.append(explorer.num_decisions)
+
+        self.explorer.add_hook(Hook.ON_PROGRESS, on_two, every_decisions=2)
+        self.explorer.add_hook(Hook.ON_PROGRESS, on_five, every_decisions=5)
+        self.search()
+        self.assertEqual(every_two, list(range(2, 15, 2)))
+        self.assertEqual(every_five, [5, 10])
+
+        # A removed progress callback is not called, and the others keep their interval
+        self.explorer.remove_hook(Hook.ON_PROGRESS, on_two)
+        every_two.clear()
+        every_five.clear()
+        self.search()
+        self.assertEqual(every_two, [])
+        self.assertEqual(every_five, [5, 10])
+
+    def test_on_limit_max_depth(self):
+        limits = []
+        self.explorer.add_hook(Hook.ON_LIMIT, lambda explorer, state, cause: limits.append(cause))
+        self.search(max_depth=1)
+        self.assertEqual(len(limits), 2)
+
+    def test_remove_hook(self):
+        def prune_all(explorer, state, moves):
+            return []
+
+        self.explorer.add_hook(Hook.ON_EXPAND, prune_all)
+        self.explorer.remove_hook(Hook.ON_EXPAND, prune_all)
+        self.search()
+        self.assertEqual(self.explorer.num_decisions, 14)
+
+    def test_invalid_hook(self):
+        with self.assertRaises(ValueError):
+            self.explorer.add_hook("on_nothing", print)
+        with self.assertRaises(TypeError):
+            self.explorer.add_hook(Hook.ON_EXPAND, None)
+        with self.assertRaises(ValueError):
+            self.explorer.add_hook(Hook.ON_PROGRESS, print)
+        with self.assertRaises(ValueError):
+            self.explorer.add_hook(Hook.ON_SOLUTION, print, every_decisions=10)
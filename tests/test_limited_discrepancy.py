@@ -0,0 +1,68 @@
+from typing import List
+
+from explorateur import Explorateur, BaseState, ExplorationType, SearchType
+from tests.test_base import BaseTest
+from tests.test_move_ordering import ValueMove
+
+
+class BinaryState(BaseState):
+
+    # Assigns binary variables to reach the target, the heuristic order tries 0 first
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+        self.vals = []
+
+    def get_moves(self) -> List[ValueMove]:
+        if len(self.vals) == len(self.target):
+            return []
+        return [ValueMove(0), ValueMove(1)]
+
+    def execute(self, move: ValueMove) -> bool:
+        self.vals.append(move.val)
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return self.vals == self.target
+
+    def __str__(self) -> str:
+        return str(self.vals)
+
+
+class LimitedDiscrepancyTest(BaseTest):
+
+    def search(self, target, exploration_type):
+        explorer = Explorateur()
+        is_solution = explorer.search(BinaryState(target),
+                                      exploration_type=exploration_type,
+                                      search_type=SearchType.TreeSearch(),
+                                      max_moves=100000)
+        return explorer, is_solution
+
+    def test_early_mistake(self):
+        # The heuristic is wrong only for the first variable
+        target = [1] + [0] * 11
+
+        explorer, is_solution = self.search(target, ExplorationType.DepthFirst())
+        self.assertTrue(is_solution)
+        self.assertEqual(explorer.num_decisions, 4107)
+
+        # Iteration 0 follows the first moves, iteration 1 tries every single discrepancy
+        explorer, is_solution = self.search(target, ExplorationType.LimitedDiscrepancy(1))
+        self.assertTrue(is_solution)
+        self.assertEqual(explorer.num_decisions, 12 + 90)
+        self.assertEqual(explorer.solution_state.vals, target)
+        self.assertEqual(len(explorer.solution_path), 13)
+
+    def test_max_discrepancies(self):
+        target = [1, 0, 1, 0]
+
+        explorer, is_solution = self.search(target, ExplorationType.LimitedDiscrepancy(1))
+        self.assertFalse(is_solution)
+
+        explorer, is_solution = self.search(target, ExplorationType.LimitedDiscrepancy(2))
+        self.assertTrue(is_solution)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.search([1], ExplorationType.LimitedDiscrepancy(-1))
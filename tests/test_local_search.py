@@ -0,0 +1,141 @@
+from typing import List
+
+from explorateur import Explorateur, BaseMove, BaseState, ExplorationType
+from explorateur.utils import Constants
+from tests.test_base import BaseTest
+
+# Objective by position, with a local optimum at position 1 and the global optimum at position 5
+LANDSCAPE = [5, 3, 4, 6, 2, 0, 7]
+
+
+class PositionMove(BaseMove):
+
+    def __init__(self, position):
+        self.position = position
+
+    def get_key(self):
+        return self.position
+
+    def __str__(self) -> str:
+        return "to " + str(self.position)
+
+
+class LineState(BaseState):
+
+    # Walks along the landscape to a neighbor position
+    def __init__(self):
+        super().__init__()
+        self.position = 0
+        self.previous = []
+
+    def get_moves(self) -> List[PositionMove]:
+        return [PositionMove(p) for p in (self.position - 1, self.position + 1) if 0 <= p < len(LANDSCAPE)]
+
+    def execute(self, move: PositionMove) -> bool:
+        self.previous.append(self.position)
+        self.position = move.position
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return False
+
+    def get_objective(self) -> float:
+        return LANDSCAPE[self.position]
+
+    def __str__(self) -> str:
+        return str(self.position)
+
+
+class UndoLineState(LineState):
+
+    def undo(self, move: PositionMove) -> None:
+        self.position = self.previous.pop()
+
+
+class BitState(BaseState):
+
+    # Flips bits to reach all ones, the objective is the number of zeros
+    def __init__(self, size):
+        super().__init__()
+        self.bits = [0] * size
+
+    def get_moves(self) -> List[PositionMove]:
+        return [PositionMove(i) for i in range(len(self.bits))]
+
+    def execute(self, move: PositionMove) -> bool:
+        self.bits[move.position] = 1 - self.bits[move.position]
+        return True
+
+    def undo(self, move: PositionMove) -> None:
+        self.execute(move)
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return all(self.bits)
+
+    def get_objective(self) -> float:
+        return len(self.bits) - sum(self.bits)
+
+    def __str__(self) -> str:
+        return str(self.bits)
+
+
+class LocalSearchTest(BaseTest):
+
+    def search(self, state, exploration_type, max_moves=1000):
+        explorer = Explorateur()
+        is_solution = explorer.search(state, exploration_type=exploration_type, max_moves=max_moves)
+        return explorer, is_solution
+
+    def test_hill_climbing(self):
+        explorer, is_solution = self.search(BitState(20), ExplorationType.HillClimbing())
+        self.assertTrue(is_solution)
+        self.assertTrue(all(explorer.solution_state.bits))
+        self.assertIsNone(explorer.solution_path)
+
+        # Steepest ascent evaluates every move, first improvement stops at the first improving move
+        first_explorer, is_solution = self.search(BitState(20), ExplorationType.HillClimbing(True))
+        self.assertTrue(is_solution)
+        self.assertLess(first_explorer.num_decisions, explorer.num_decisions)
+
+        # Stops at the local optimum
+        explorer, is_solution = self.search(LineState(), ExplorationType.HillClimbing())
+        self.assertFalse(is_solution)
+        self.assertEqual(explorer.best_objective, 3)
+        self.assertEqual(explorer.best_state.position, 1)
+
+    def test_tabu_search(self):
+        # Visited positions are tabu, which escapes the local optimum
+        for state in (LineState(), UndoLineState()):
+            explorer, is_solution = self.search(state, ExplorationType.TabuSearch(tenure=3), max_moves=50)
+            self.assertFalse(is_solution)
+            self.assertEqual(explorer.best_objective, 0)
+            self.assertEqual(explorer.best_state.position, 5)
+
+    def test_simulated_annealing(self):
+        explorer, is_solution = self.search(LineState(), ExplorationType.SimulatedAnnealing(10, 0.99, 0.1))
+        self.assertFalse(is_solution)
+        self.assertEqual(explorer.best_objective, 0)
+
+    def test_seed(self):
+        # The default seed is the one of the other random searches
+        explorer, _ = self.search(LineState(), ExplorationType.SimulatedAnnealing(10, 0.99, 0.1))
+        seed_explorer, _ = self.search(LineState(), ExplorationType.SimulatedAnnealing(10, 0.99, 0.1,
+                                                                                      Constants.default_seed))
+        self.assertEqual(seed_explorer.num_decisions, explorer.num_decisions)
+        self.assertEqual(seed_explorer.best_state.position, explorer.best_state.position)
+
+    def test_undo(self):
+        # Undo executes the same moves in place, without copies
+        explorer, _ = self.search(LineState(), ExplorationType.SimulatedAnnealing(10, 0.99, 0.1))
+        undo_explorer, _ = self.search(UndoLineState(), ExplorationType.SimulatedAnnealing(10, 0.99, 0.1))
+        self.assertEqual(undo_explorer.num_decisions, explorer.num_decisions)
+        self.assertEqual(undo_explorer.best_state.position, explorer.best_state.position)
+
+        # The best state is a copy that is not changed by later moves
+        self.assertEqual(undo_explorer.best_objective, undo_explorer.best_state.get_objective())
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.search(LineState(), ExplorationType.SimulatedAnnealing(cooling_rate=1.5))
+        with self.assertRaises(TypeError):
+            self.search(LineState(), ExplorationType.TabuSearch(tenure=2.5))
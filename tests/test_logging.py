@@ -0,0 +1,41 @@
+from explorateur import Explorateur, ExplorationType, SearchType
+from tests.test_base import BaseTest, MyState
+
+
+class CountingState(MyState):
+
+    # Count string conversions to detect eager log formatting
+    num_str_calls = 0
+
+    def __str__(self) -> str:
+        CountingState.num_str_calls += 1
+        return super().__str__()
+
+
+class LoggingTest(BaseTest):
+
+    def test_non_verbose_skips_formatting(self):
+        CountingState.num_str_calls = 0
+
+        explorer = Explorateur(is_verbose=False)
+        initial_state = CountingState({"x": [1, 2], "y": [10, 20], "z": [100, 200]})
+        explorer.search(initial_state,
+                        exploration_type=ExplorationType.DepthFirst(),
+                        search_type=SearchType.TreeSearch(),
+                        max_moves=100)
+
+        self.assertEqual(explorer.num_decisions, 14)
+        self.assertEqual(CountingState.num_str_calls, 0)
+
+    def test_verbose_logs_decisions(self):
+        explorer = Explorateur(is_verbose=True)
+        initial_state = MyState({"x": [1, 2], "y": [10, 20], "z": [100, 200]})
+
+        with self.assertLogs("explorateur", level="DEBUG") as logs:
+            explorer.search(initial_state,
+                            exploration_type=ExplorationType.BreadthFirst(),
+                            search_type=SearchType.TreeSearch(),
+                            max_moves=3)
+
+        self.assertTrue(any("Decision 3" in line for line in logs.output))
+        self.assertTrue(any("FINISH SEARCH" in line for line in logs.output))
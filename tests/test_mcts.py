@@ -0,0 +1,91 @@
+import random
+from typing import List
+
+from explorateur import Explorateur, BaseState, ExplorationType
+from explorateur.utils import Constants
+from tests.test_base import BaseTest
+from tests.test_move_ordering import ValueMove
+
+
+class SubsetSumState(BaseState):
+
+    # Picks values one at a time, the objective is the distance of the sum to the target
+    def __init__(self, values, target):
+        super().__init__()
+        self.values = values
+        self.target = target
+        self.picked = []
+
+    def get_moves(self) -> List[ValueMove]:
+        total = sum(self.picked)
+        return [ValueMove(v) for v in self.values if v not in self.picked and total + v <= self.target]
+
+    def execute(self, move: ValueMove) -> bool:
+        self.picked.append(move.val)
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return sum(self.picked) == self.target
+
+    def get_objective(self) -> float:
+        return self.target - sum(self.picked)
+
+    def __str__(self) -> str:
+        return str(self.picked)
+
+
+def largest_first(state, moves, rng):
+    return max(moves, key=lambda move: move.val)
+
+
+class MCTSTest(BaseTest):
+
+    def search(self, state, exploration_type, **kwargs):
+        explorer = Explorateur()
+        is_solution = explorer.search(state, exploration_type=exploration_type, max_moves=100000, **kwargs)
+        return explorer, is_solution
+
+    def test_solution(self):
+        explorer, is_solution = self.search(SubsetSumState([3, 5, 7, 11, 13], 31),
+                                            ExplorationType.MCTS(iterations=500))
+        self.assertTrue(is_solution)
+        self.assertEqual(sum(explorer.solution_state.picked), 31)
+
+        # Moves of the tree and of the rollout lead from the initial state to the solution
+        self.assertEqual([move.val for move in explorer.solution_moves], explorer.solution_state.picked)
+        path = explorer._get_solution_path(is_initial_first=True)
+        self.assertEqual(len(path), len(explorer.solution_moves) + 1)
+        self.assertEqual([sum(state.picked) for state in path][-1], 31)
+
+        # The same seed gives the same search, the default seed included
+        same_explorer, _ = self.search(SubsetSumState([3, 5, 7, 11, 13], 31),
+                                       ExplorationType.MCTS(iterations=500, seed=Constants.default_seed))
+        self.assertEqual(same_explorer.num_decisions, explorer.num_decisions)
+
+    def test_best_state(self):
+        # Odd target with even values, no solution, the best state is one away
+        explorer, is_solution = self.search(SubsetSumState([2, 4, 6, 8], 13), ExplorationType.MCTS(iterations=200))
+        self.assertFalse(is_solution)
+        self.assertEqual(explorer.best_objective, 1)
+        self.assertEqual(sum(explorer.best_state.picked), 12)
+        self.assertEqual([move.val for move in explorer.best_moves], explorer.best_state.picked)
+
+    def test_rollout_policy(self):
+        values = list(range(1, 40))
+        random.Random(7).shuffle(values)
+        explorer, is_solution = self.search(SubsetSumState(values, 100),
+                                            ExplorationType.MCTS(iterations=1, rollout_policy=largest_first))
+        self.assertTrue(is_solution)
+        self.assertEqual(explorer.num_decisions, 1)
+
+    def test_process_pool(self):
+        explorer, is_solution = self.search(SubsetSumState([3, 5, 7, 11, 13], 31),
+                                            ExplorationType.MCTS(iterations=500, num_workers=2))
+        self.assertTrue(is_solution)
+        self.assertEqual(sum(explorer.solution_state.picked), 31)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.search(SubsetSumState([1], 1), ExplorationType.MCTS(iterations=0))
+        with self.assertRaises(TypeError):
+            self.search(SubsetSumState([1], 1), ExplorationType.MCTS(rollout_policy="random"))
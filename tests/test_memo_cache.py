@@ -0,0 +1,172 @@
+from typing import List
+
+from explorateur import Explorateur, BaseMove, BaseState, ExplorationType, MemoCache, SearchType
+from explorateur.search.memo_cache import MemoTable
+from tests.test_base import BaseTest
+
+
+class StepMove(BaseMove):
+
+    def __init__(self, dx, dy):
+        self.dx = dx
+        self.dy = dy
+
+    def __str__(self) -> str:
+        return "Step: " + str((self.dx, self.dy))
+
+
+class LatticeState(BaseState):
+
+    # Right and down steps reach every cell by many paths, so tree search evaluates the same cells again
+    num_evaluations = 0
+
+    def __init__(self, size):
+        super().__init__()
+        self.size = size
+        self.x = 0
+        self.y = 0
+
+    def get_moves(self) -> List[StepMove]:
+        LatticeState.num_evaluations += 1
+        moves = []
+        if self.x < self.size:
+            moves.append(StepMove(1, 0))
+        if self.y < self.size:
+            moves.append(StepMove(0, 1))
+        return moves
+
+    def execute(self, move: StepMove) -> bool:
+        self.x += move.dx
+        self.y += move.dy
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return False
+
+    def get_key(self):
+        return self.x, self.y
+
+    def get_objective(self) -> float:
+        LatticeState.num_evaluations += 1
+        return (self.x - self.y) ** 2
+
+    def __str__(self) -> str:
+        return str((self.x, self.y))
+
+
+class HeuristicLatticeState(LatticeState):
+
+    # Unit steps to the opposite corner, with the number of steps left as heuristic
+    num_heuristics = 0
+
+    def get_path_cost(self) -> float:
+        return self.x + self.y
+
+    def get_heuristic(self) -> float:
+        HeuristicLatticeState.num_heuristics += 1
+        return 2 * self.size - self.x - self.y
+
+
+class MemoCacheTest(BaseTest):
+
+    def search(self, memo_cache, exploration_type=ExplorationType.DepthFirst()):
+        LatticeState.num_evaluations = 0
+        explorer = Explorateur()
+        explorer.search(LatticeState(6),
+                        exploration_type=exploration_type,
+                        search_type=SearchType.TreeSearch(),
+                        memo_cache=memo_cache)
+        return explorer
+
+    def search_cost(self, memo_cache):
+        LatticeState.num_evaluations = 0
+        HeuristicLatticeState.num_heuristics = 0
+        Explorateur().search(HeuristicLatticeState(6),
+                             exploration_type=ExplorationType.BestFirst(),
+                             search_type=SearchType.CostGraphSearch(),
+                             memo_cache=memo_cache)
+
+    def test_lru(self):
+        table = MemoTable(2, "lru")
+        table.put("a", 1)
+        table.put("b", 2)
+        self.assertEqual(table.get("a"), 1)
+        table.put("c", 3)
+
+        # The least recently used key is evicted
+        self.assertIsNone(table.get("b"))
+        self.assertEqual(table.get("a"), 1)
+        self.assertEqual(table.get("c"), 3)
+        self.assertEqual(table.size(), 2)
+        self.assertEqual((table.num_hits, table.num_misses), (3, 1))
+
+    def test_lfu(self):
+        table = MemoTable(2, "lfu")
+        table.put("a", 1)
+        table.put("b", 2)
+        table.get("a")
+        table.get("a")
+        table.get("b")
+        table.put("c", 3)
+
+        # The least frequently used key is evicted, even when used more recently
+        self.assertIsNone(table.get("b"))
+        self.assertEqual(table.get("a"), 1)
+        self.assertEqual(table.get("c"), 3)
+
+        # Ties are broken by the least recently used key
+        table.put("d", 4)
+        self.assertIsNone(table.get("c"))
+        self.assertEqual(table.get("d"), 4)
+
+    def test_tree_search(self):
+        explorer = self.search(None)
+        num_evaluations = LatticeState.num_evaluations
+
+        # Every cell is evaluated once, and the search is the same
+        memo_cache = MemoCache()
+        memo_explorer = self.search(memo_cache)
+        self.assertEqual(memo_explorer.num_decisions, explorer.num_decisions)
+        self.assertEqual(LatticeState.num_evaluations, 7 * 7)
+        self.assertLess(LatticeState.num_evaluations, num_evaluations)
+        self.assertGreater(memo_cache.hit_rate, 0.9)
+
+        # Objectives are cached for best first search
+        LatticeState.num_evaluations = 0
+        self.search(None, ExplorationType.BestFirst())
+        num_evaluations = LatticeState.num_evaluations
+        self.search(MemoCache(), ExplorationType.BestFirst())
+        self.assertLessEqual(LatticeState.num_evaluations, 2 * 7 * 7)
+        self.assertLess(LatticeState.num_evaluations, num_evaluations)
+
+    def test_kept(self):
+        memo_cache = MemoCache()
+        self.search_cost(memo_cache)
+        num_heuristics = HeuristicLatticeState.num_heuristics
+        self.assertEqual(num_heuristics, 7 * 7)
+
+        # The next search evaluates moves again, while heuristics are answered from the cache
+        self.search_cost(memo_cache)
+        self.assertEqual(LatticeState.num_evaluations, 7 * 7)
+        self.assertEqual(HeuristicLatticeState.num_heuristics, 0)
+        self.assertEqual(memo_cache.heuristics.size(), num_heuristics)
+
+        # Otherwise, heuristics are evaluated again too
+        memo_cache = MemoCache(is_kept=False)
+        self.search_cost(memo_cache)
+        self.search_cost(memo_cache)
+        self.assertEqual(HeuristicLatticeState.num_heuristics, 7 * 7)
+
+    def test_capacity(self):
+        memo_cache = MemoCache(capacity=4, policy="lfu")
+        explorer = self.search(memo_cache)
+        self.assertEqual(explorer.num_decisions, self.search(None).num_decisions)
+        self.assertLessEqual(memo_cache.moves.size(), 4)
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            self.search("lru")
+        with self.assertRaises(ValueError):
+            self.search(MemoCache(capacity=0))
+        with self.assertRaises(ValueError):
+            self.search(MemoCache(policy="fifo"))
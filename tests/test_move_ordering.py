@@ -0,0 +1,85 @@
+from typing import List
+
+from explorateur import Explorateur, BaseMove, BaseState, ExplorationType, MoveOrdering, SearchType
+from tests.test_base import BaseTest
+
+
+class ValueMove(BaseMove):
+
+    def __init__(self, val):
+        self.val = val
+
+    def get_key(self):
+        return self.val
+
+    def __str__(self) -> str:
+        return "= " + str(self.val)
+
+
+class LastValueState(BaseState):
+
+    # Assigns every variable, where only the last value of the domain is feasible
+    def __init__(self, num_vars, num_vals):
+        super().__init__()
+        self.num_vars = num_vars
+        self.num_vals = num_vals
+        self.vals = []
+
+    def get_moves(self) -> List[ValueMove]:
+        return [ValueMove(val) for val in range(self.num_vals)]
+
+    def execute(self, move: ValueMove) -> bool:
+        self.vals.append(move.val)
+        return move.val == self.num_vals - 1
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return len(self.vals) == self.num_vars
+
+    def __str__(self) -> str:
+        return str(self.vals)
+
+
+class MoveOrderingTest(BaseTest):
+
+    def search(self, move_ordering):
+        explorer = Explorateur()
+        explorer.search(LastValueState(10, 4),
+                        exploration_type=ExplorationType.DepthFirst(),
+                        search_type=SearchType.TreeSearch(),
+                        move_ordering=move_ordering)
+        return explorer
+
+    def test_history(self):
+        explorer = self.search(None)
+        self.assertEqual(explorer.num_decisions, 40)
+        self.assertEqual(explorer.num_failed_decisions, 30)
+
+        # After the first variable, the feasible value is tried first
+        move_ordering = MoveOrdering(num_killers=0)
+        explorer = self.search(move_ordering)
+        self.assertEqual(explorer.num_decisions, 13)
+        self.assertEqual(explorer.num_failed_decisions, 3)
+        self.assertEqual(explorer.solution_path[0].vals, [3] * 10)
+
+        # Learned scores are kept for the next search
+        explorer = self.search(move_ordering)
+        self.assertEqual(explorer.num_failed_decisions, 0)
+
+        move_ordering.reset()
+        explorer = self.search(move_ordering)
+        self.assertEqual(explorer.num_failed_decisions, 3)
+
+    def test_killers(self):
+        move_ordering = MoveOrdering(num_killers=2, is_history=False)
+        moves = [ValueMove(val) for val in range(4)]
+        move_ordering.update_success(moves[2], 1)
+        move_ordering.update_success(moves[3], 1)
+        move_ordering.update_success(moves[1], 1)
+
+        # The most recent killers at the same depth go first, other depths keep the given order
+        self.assertEqual([move.val for move in move_ordering.order(moves, 1)], [1, 3, 0, 2])
+        self.assertEqual([move.val for move in move_ordering.order(moves, 2)], [0, 1, 2, 3])
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            Explorateur().search(LastValueState(1, 1), move_ordering="history")
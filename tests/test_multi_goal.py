@@ -0,0 +1,71 @@
+from explorateur import Explorateur, ExplorationType, SearchType, Hook
+from tests.test_base import BaseTest
+from tests.test_cost_search import VertexState
+
+# Two sources, 1 and 5, and the cheapest vertex of every target depends on the source
+NETWORK = {1: {2: 1, 4: 4}, 2: {3: 1}, 3: {4: 1}, 4: {}, 5: {3: 5, 6: 1}, 6: {}}
+
+
+class MultiGoalTest(BaseTest):
+
+    def search(self, initial_state, **kwargs):
+        explorer = Explorateur()
+        is_solution = explorer.search(initial_state,
+                                      exploration_type=ExplorationType.BestFirst(),
+                                      search_type=SearchType.CostGraphSearch(),
+                                      **kwargs)
+        return explorer, is_solution
+
+    def test_single_source_all_targets(self):
+        # Network delay: the cheapest path to every vertex in a single search
+        explorer, is_solution = self.search(VertexState(NETWORK, 1, None), goal_keys=[1, 2, 3, 4])
+        self.assertTrue(is_solution)
+        self.assertEqual({key: solution.cost for key, solution in explorer.solutions.items()},
+                         {1: 0, 2: 1, 3: 2, 4: 3})
+        self.assertEqual([move.u for move in explorer.solutions[4].moves], [2, 3, 4])
+        self.assertEqual([state.v for state in explorer.solutions[4].path], [4, 3, 2, 1])
+        self.assertEqual(explorer.solutions[3].state.v, 3)
+
+        # The search stops at the last goal, the slowest vertex
+        self.assertEqual(explorer.solution_state.v, 4)
+
+    def test_multi_source(self):
+        explorer, is_solution = self.search([VertexState(NETWORK, 1, None), VertexState(NETWORK, 5, None)],
+                                            goal_keys=[3, 6])
+        self.assertTrue(is_solution)
+        self.assertEqual(explorer.solutions[3].cost, 2)
+        self.assertEqual(explorer.solutions[3].path[-1].v, 1)
+        self.assertEqual(explorer.solutions[6].cost, 1)
+        self.assertEqual(explorer.solutions[6].path[-1].v, 5)
+
+    def test_first_goals(self):
+        solved = []
+        explorer = Explorateur()
+        explorer.add_hook(Hook.ON_SOLUTION, lambda explorer, state: solved.append(state.v))
+        is_solution = explorer.search(VertexState(NETWORK, 1, None),
+                                      exploration_type=ExplorationType.BestFirst(),
+                                      search_type=SearchType.CostGraphSearch(),
+                                      is_solution_path=False,
+                                      goal_keys={2, 3, 4}, num_goals=2)
+        self.assertTrue(is_solution)
+        self.assertEqual(solved, [2, 3])
+        self.assertEqual(set(explorer.solutions), {2, 3})
+        self.assertIsNone(explorer.solutions[3].path)
+        self.assertEqual(len(explorer.solutions[3].moves), 2)
+
+    def test_unreachable_goal(self):
+        # Goals reached before the search space is exhausted are still saved
+        explorer, is_solution = self.search(VertexState(NETWORK, 1, None), goal_keys=[4, 6])
+        self.assertFalse(is_solution)
+        self.assertEqual(list(explorer.solutions), [4])
+        self.assertEqual([state.v for state in explorer.solutions[4].path], [4, 3, 2, 1])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.search(VertexState(NETWORK, 1, None), goal_keys=[])
+        with self.assertRaises(ValueError):
+            self.search(VertexState(NETWORK, 1, None), num_goals=1)
+        with self.assertRaises(ValueError):
+            self.search(VertexState(NETWORK, 1, None), goal_keys=[2, 3, 2], num_goals=3)
+        with self.assertRaises(TypeError):
+            self.search([VertexState(NETWORK, 1, None), 5])
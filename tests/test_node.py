@@ -0,0 +1,118 @@
+from typing import List
+
+from explorateur import Explorateur, BaseMove, BaseState, ExplorationType, Restart, SearchType
+from explorateur.search.node import SearchTree, NO_PARENT
+from tests.test_base import BaseTest, MyState
+
+
+class IncrementMove(BaseMove):
+
+    def __init__(self, step):
+        self.step = step
+
+    def __str__(self) -> str:
+        return "+" + str(self.step)
+
+
+class CounterState(BaseState):
+
+    # Three moves everywhere and no termination, the tree is as large as the search runs
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def get_moves(self) -> List[IncrementMove]:
+        return [IncrementMove(step) for step in range(3)]
+
+    def execute(self, move: IncrementMove) -> bool:
+        self.count += move.step
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return False
+
+    def __str__(self) -> str:
+        return str(self.count)
+
+
+class LexicographicState(MyState):
+
+    # Objectives compare as tuples, the number of unassigned variables first
+    def get_objective(self):
+        return len(self.unassigned), super().get_objective()
+
+
+class NodeTest(BaseTest):
+
+    def test_tree_release(self):
+        tree = SearchTree()
+        root = tree.add("root", NO_PARENT, None, 0)
+        tree.add_pending(root, 2)
+        left = tree.add("left", root, "l", 1)
+        tree.add_pending(left, 1)
+
+        # Root is needed until both children are done
+        tree.remove_pending(root)
+        self.assertEqual(tree.states, ["root", "left"])
+
+        # Done with the only child of left, releasing left and then root
+        tree.remove_pending(left)
+        self.assertEqual(tree.states, [None, None])
+        self.assertEqual(tree.size(), 0)
+
+        # Freed indices are reused by new nodes
+        self.assertIn(tree.add("next", NO_PARENT, None, 0), (root, left))
+        self.assertEqual(len(tree.states), 2)
+
+    def test_tree_moves(self):
+        tree = SearchTree()
+        root = tree.add("root", NO_PARENT, None, 0)
+        a = tree.add("a", root, "x", 1)
+        b = tree.add("b", a, "y", 2)
+        tree.add("c", root, "z", 1)
+
+        self.assertEqual(tree.get_path(b), [b, a, root])
+        self.assertEqual(tree.get_moves(b), ["x", "y"])
+        self.assertEqual(tree.get_moves(root), [])
+
+        tree.retain_path(b)
+        self.assertEqual(tree.states, ["root", "a", "b", None])
+
+    def test_search_releases_states(self):
+        explorer = Explorateur()
+        initial_state = MyState({"x": [1, 2], "y": [10, 20], "z": [100, 200]},
+                                is_exhaustive_search=False)
+        explorer.search(initial_state,
+                        exploration_type=ExplorationType.BreadthFirst(),
+                        search_type=SearchType.TreeSearch(),
+                        is_solution_path=True)
+
+        # Only the states on the solution path are kept after search
+        path = explorer._get_solution_path()
+        self.assertEqual(len(path), 4)
+        self.assertEqual(sum(state is not None for state in explorer._tree.states), len(path))
+        self.assertEqual(explorer.solution_moves, explorer.solution_path.get_moves())
+
+    def test_tuple_objectives(self):
+        explorer = Explorateur()
+        initial_state = LexicographicState({"x": [1, 2], "y": [10, 20]}, is_exhaustive_search=False)
+        is_solution = explorer.search(initial_state,
+                                      exploration_type=ExplorationType.BestFirst(),
+                                      search_type=SearchType.TreeSearch())
+        self.assertTrue(is_solution)
+        self.assertEqual(explorer.solution_state.unassigned, [])
+
+    def test_memory_follows_frontier(self):
+        # Depth first search keeps the open moves and their ancestors, not every node generated
+        for exploration_type, restart in [(ExplorationType.DepthFirst(), None),
+                                          (ExplorationType.LimitedDiscrepancy(max_discrepancies=5), None),
+                                          (ExplorationType.DepthFirst(), Restart.Luby(100))]:
+            explorer = Explorateur()
+            explorer.search(CounterState(),
+                            exploration_type=exploration_type,
+                            search_type=SearchType.TreeSearch(),
+                            max_depth=30,
+                            max_moves=20000,
+                            restart=restart)
+            self.assertEqual(explorer.num_decisions, 20000)
+            self.assertLessEqual(len(explorer._tree.states), 30 * 3 + 1)
@@ -0,0 +1,72 @@
+from explorateur import Explorateur, ExplorationType, SearchStats, SearchType
+from explorateur.search.nogood_store import NogoodStore
+from tests.test_base import BaseTest
+from tests.test_replay import SumState
+from tests.test_solution_path import IncrementMove
+
+
+class StepMove(IncrementMove):
+
+    def get_key(self):
+        return self.step
+
+
+class ExhaustiveSumState(SumState):
+
+    # Sums are reached through many orders of steps, and never terminate
+    def get_key(self):
+        return self.val
+
+    def get_moves(self):
+        return [StepMove(1), StepMove(2)]
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return False
+
+
+class NogoodTest(BaseTest):
+
+    def search(self, nogood_cache_size):
+        explorer = Explorateur()
+        explorer.search(ExhaustiveSumState(6),
+                        exploration_type=ExplorationType.DepthFirst(),
+                        search_type=SearchType.TreeSearch(),
+                        max_moves=1000,
+                        stats_level=SearchStats.LOW,
+                        nogood_cache_size=nogood_cache_size)
+        return explorer
+
+    def test_nogoods(self):
+        explorer = self.search(None)
+        learner = self.search(100)
+
+        # Nogoods fail the same decisions, without copying and executing them again
+        self.assertIsNone(explorer.nogoods)
+        self.assertEqual(learner.num_decisions, explorer.num_decisions)
+        self.assertEqual(learner.num_failed_decisions, explorer.num_failed_decisions)
+
+        # Only sums 5 and 6 can fail, each with its own moves
+        self.assertEqual(learner.nogoods.size(), 3)
+        num_hits = learner.nogoods.num_hits
+        self.assertEqual(num_hits, explorer.num_failed_decisions - 3)
+        self.assertEqual(learner.stats.call_counts[SearchStats.EXECUTE],
+                         explorer.stats.call_counts[SearchStats.EXECUTE] - num_hits)
+        self.assertAlmostEqual(learner.nogoods.hit_rate, num_hits / learner.nogoods.num_lookups)
+
+    def test_store_lru(self):
+        store = NogoodStore(2)
+        state = ExhaustiveSumState(6)
+        store.insert(state, StepMove(1))
+        store.insert(state, StepMove(2))
+        self.assertTrue(store.contains(state, StepMove(1)))
+
+        # Move 2 is the least recently used
+        store.insert(state, StepMove(3))
+        self.assertFalse(store.contains(state, StepMove(2)))
+        self.assertTrue(store.contains(state, StepMove(1)))
+        self.assertEqual(store.size(), 2)
+        self.assertEqual(store.hit_rate, 2 / 3)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Explorateur().search(ExhaustiveSumState(3), nogood_cache_size=0)
@@ -0,0 +1,92 @@
+from typing import List
+
+from explorateur import Explorateur, BaseMove, BaseState, ExplorationType, SearchType
+from tests.test_base import BaseTest
+
+# Preferred start time of every job, a schedule is penalized by the squared distance to it
+PREFERRED = [2, 0, 1, 2, 0, 1]
+
+
+class StartMove(BaseMove):
+
+    def __init__(self, start):
+        self.start = start
+
+    def __str__(self) -> str:
+        return "Start at: " + str(self.start)
+
+
+class ScheduleState(BaseState):
+
+    # Assigns a start time to the next job, the objective sums over every assigned job
+    num_evaluations = 0
+
+    def __init__(self):
+        super().__init__()
+        self.starts = []
+
+    def get_moves(self) -> List[StartMove]:
+        return [StartMove(start) for start in range(3)]
+
+    def execute(self, move: StartMove) -> bool:
+        self.starts.append(move.start)
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return len(self.starts) == len(PREFERRED)
+
+    def get_objective(self) -> float:
+        ScheduleState.num_evaluations += 1
+        return sum((start - PREFERRED[job]) ** 2 for job, start in enumerate(self.starts))
+
+    def __str__(self) -> str:
+        return str(self.starts)
+
+
+class DeltaScheduleState(ScheduleState):
+
+    # Only the next job changes the objective
+    def get_objective_delta(self, move: StartMove) -> float:
+        return (move.start - PREFERRED[len(self.starts)]) ** 2
+
+
+class ObjectiveDeltaTest(BaseTest):
+
+    def search(self, state, search_type=SearchType.TreeSearch()):
+        ScheduleState.num_evaluations = 0
+        explorer = Explorateur()
+        is_solution = explorer.search(state,
+                                      exploration_type=ExplorationType.BestFirst(),
+                                      search_type=search_type)
+        self.assertTrue(is_solution)
+        return explorer
+
+    def test_delta(self):
+        explorer = self.search(ScheduleState())
+        num_decisions = explorer.num_decisions
+        num_evaluations = ScheduleState.num_evaluations
+
+        # Moves are ranked by their own objective, so the best move is taken first at every level
+        explorer = self.search(DeltaScheduleState())
+        self.assertEqual(explorer.solution_state.starts, PREFERRED)
+        self.assertEqual(explorer.num_decisions, len(PREFERRED))
+        self.assertLess(explorer.num_decisions, num_decisions)
+
+        # Only the initial state is evaluated
+        self.assertEqual(ScheduleState.num_evaluations, 1)
+        self.assertLess(ScheduleState.num_evaluations, num_evaluations)
+
+    def test_cost_search(self):
+        # Cost search ranks by path cost plus heuristic, so deltas are not used
+        self.search(DeltaScheduleState(), SearchType.CostGraphSearch())
+        self.assertGreater(ScheduleState.num_evaluations, 1)
+
+    def test_mixed_roots(self):
+        # A root without deltas turns them off for every root, instead of failing on its moves
+        ScheduleState.num_evaluations = 0
+        explorer = Explorateur()
+        is_solution = explorer.search([DeltaScheduleState(), ScheduleState()],
+                                      exploration_type=ExplorationType.BestFirst(),
+                                      search_type=SearchType.TreeSearch())
+        self.assertTrue(is_solution)
+        self.assertGreater(ScheduleState.num_evaluations, 2)
@@ -0,0 +1,194 @@
+import copy as cp
+import random
+from typing import List
+
+from explorateur import Explorateur, BaseMove, BaseState, ExplorationType, PersistentState, SearchType
+from explorateur.state.persistent import BitsetDomain, PersistentMap, PersistentVector
+from tests.test_base import BaseTest
+
+
+class CollidingKey:
+
+    # Every key has the same hash, so keys are told apart only by equality
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.name == other.name
+
+    def __hash__(self):
+        return 42
+
+
+class AssignMove(BaseMove):
+
+    def __init__(self, var, is_equal, val):
+        self.var = var
+        self.is_equal = is_equal
+        self.val = val
+
+    def __str__(self) -> str:
+        return self.var + (" == " if self.is_equal else " != ") + str(self.val)
+
+
+class DomainState(BaseState):
+
+    # Binary branching over variable domains, as in the backtrack tree search example
+    def __init__(self, var_to_domain):
+        super().__init__()
+        self.var_to_domain = {var: list(domain) for var, domain in var_to_domain.items()}
+        self.var_to_val = {}
+        self.unassigned = list(var_to_domain)
+
+    def get_moves(self) -> List[AssignMove]:
+        if not self.unassigned:
+            return []
+        var = self.unassigned[0]
+        val = self.var_to_domain[var][0]
+        return [AssignMove(var, True, val), AssignMove(var, False, val)]
+
+    def execute(self, move: AssignMove) -> bool:
+        domain = [move.val] if move.is_equal else [val for val in self.var_to_domain[move.var] if val != move.val]
+        if not domain:
+            return False
+        self.var_to_domain[move.var] = domain
+        if len(domain) == 1:
+            self.var_to_val[move.var] = domain[0]
+            self.unassigned.remove(move.var)
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return False
+
+    def __str__(self) -> str:
+        return str(self.var_to_val)
+
+
+class PersistentDomainState(PersistentState):
+
+    # The same state with persistent containers, execute() replaces them instead of changing them
+    def __init__(self, var_to_domain):
+        super().__init__()
+        self.var_to_domain = PersistentMap((var, BitsetDomain(domain)) for var, domain in var_to_domain.items())
+        self.var_to_val = PersistentMap()
+        self.unassigned = tuple(var_to_domain)
+
+    def get_moves(self) -> List[AssignMove]:
+        if not self.unassigned:
+            return []
+        var = self.unassigned[0]
+        val = self.var_to_domain[var].min()
+        return [AssignMove(var, True, val), AssignMove(var, False, val)]
+
+    def execute(self, move: AssignMove) -> bool:
+        domain = self.var_to_domain[move.var]
+        domain = domain.assign(move.val) if move.is_equal else domain.remove(move.val)
+        if not domain:
+            return False
+        self.var_to_domain = self.var_to_domain.set(move.var, domain)
+        if len(domain) == 1:
+            self.var_to_val = self.var_to_val.set(move.var, domain.min())
+            self.unassigned = tuple(var for var in self.unassigned if var != move.var)
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return False
+
+    def __str__(self) -> str:
+        return str(dict(self.var_to_val.items()))
+
+
+class PersistentTest(BaseTest):
+
+    def test_map(self):
+        rng = random.Random(123)
+        expected = {}
+        persistent_map = PersistentMap()
+        versions = []
+        for _ in range(2000):
+            key = rng.randrange(500)
+            if key in expected and rng.random() < 0.4:
+                del expected[key]
+                persistent_map = persistent_map.delete(key)
+            else:
+                expected[key] = rng.random()
+                persistent_map = persistent_map.set(key, expected[key])
+            versions.append((dict(expected), persistent_map))
+
+        # Every version keeps its own items
+        for items, version in versions[::100]:
+            self.assertEqual(len(version), len(items))
+            self.assertEqual(dict(version.items()), items)
+            self.assertEqual(version, PersistentMap(items))
+            self.assertEqual(hash(version), hash(PersistentMap(items)))
+
+        with self.assertRaises(KeyError):
+            PersistentMap().delete(1)
+        self.assertIsNone(PersistentMap({1: 2}).get(3))
+
+    def test_map_collisions(self):
+        keys = [CollidingKey(name) for name in "abcd"]
+        persistent_map = PersistentMap((key, i) for i, key in enumerate(keys))
+        self.assertEqual([persistent_map[key] for key in keys], [0, 1, 2, 3])
+
+        smaller = persistent_map.delete(keys[1]).delete(keys[2]).delete(keys[3])
+        self.assertEqual(list(smaller.items()), [(keys[0], 0)])
+        self.assertNotIn(keys[1], smaller)
+        self.assertIn(keys[1], persistent_map)
+
+    def test_vector(self):
+        items = list(range(1100))
+        vector = PersistentVector(items)
+        self.assertEqual(list(vector), items)
+        self.assertEqual(vector[-1], 1099)
+
+        # Appends and pops across the levels of the trie agree with a list
+        grown = PersistentVector()
+        for item in items:
+            grown = grown.append(item)
+        self.assertEqual(grown, vector)
+        shrunk = grown
+        for _ in range(1090):
+            shrunk = shrunk.pop()
+        self.assertEqual(list(shrunk), items[:10])
+        self.assertEqual(len(grown), 1100)
+
+        changed = vector.set(1000, -1)
+        self.assertEqual(changed[1000], -1)
+        self.assertEqual(vector[1000], 1000)
+        with self.assertRaises(IndexError):
+            vector[1100]
+        with self.assertRaises(IndexError):
+            PersistentVector().pop()
+
+    def test_domain(self):
+        domain = BitsetDomain([1, 3, 5, 7])
+        self.assertEqual(list(domain.remove(3)), [1, 5, 7])
+        self.assertEqual(list(domain.assign(5)), [5])
+        self.assertEqual(len(domain.assign(4)), 0)
+        self.assertEqual(domain.intersect(BitsetDomain(range(4, 9))).min(), 5)
+        self.assertIn(7, domain)
+        self.assertNotIn(7, domain.remove(7))
+
+    def test_search(self):
+        var_to_domain = {"x": [1, 2, 3], "y": [1, 2], "z": [1, 2, 3, 4]}
+        explorer = Explorateur()
+        explorer.search(DomainState(var_to_domain),
+                        exploration_type=ExplorationType.DepthFirst(),
+                        search_type=SearchType.TreeSearch())
+
+        persistent_explorer = Explorateur()
+        persistent_explorer.search(PersistentDomainState(var_to_domain),
+                                   exploration_type=ExplorationType.DepthFirst(),
+                                   search_type=SearchType.TreeSearch())
+
+        # The same search, the successors only refer to the containers of their parent until changed
+        self.assertEqual(persistent_explorer.num_decisions, explorer.num_decisions)
+        self.assertEqual(persistent_explorer.num_failed_decisions, explorer.num_failed_decisions)
+
+        state = PersistentDomainState(var_to_domain)
+        successor = cp.deepcopy(state)
+        self.assertIs(successor.var_to_domain, state.var_to_domain)
+        successor.execute(AssignMove("x", True, 2))
+        self.assertEqual(list(state.var_to_domain["x"]), [1, 2, 3])
+        self.assertEqual(list(successor.var_to_domain["x"]), [2])
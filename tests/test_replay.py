@@ -0,0 +1,85 @@
+from typing import List
+
+from explorateur import Explorateur, BaseState, ExplorationType, SearchType, SearchStats
+from explorateur.search.node import SearchTree, NO_PARENT
+from tests.test_base import BaseTest, MyState
+from tests.test_solution_path import IncrementMove
+
+
+class SumState(BaseState):
+
+    # Reaches the target sum with steps of one or two
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+        self.val = 0
+
+    def get_moves(self) -> List[IncrementMove]:
+        return [IncrementMove(1), IncrementMove(2)]
+
+    def execute(self, move: IncrementMove) -> bool:
+        self.val += move.step
+        return self.val <= self.target
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return self.val == self.target
+
+    def __str__(self) -> str:
+        return str(self.val)
+
+
+class ReplayTest(BaseTest):
+
+    def test_tree_replay(self):
+        tree = SearchTree(snapshot_interval=3, cache_size=0)
+        index = tree.add(SumState(10), NO_PARENT, None, 0)
+        state = tree.get_state(index)
+        for depth in range(1, 5):
+            tree.add_pending(index, 1)
+            state = SumState(10)
+            state.val = depth * 2
+            index = tree.add(state, index, IncrementMove(2), depth)
+
+        # Only the root and the snapshot at depth 3 are kept
+        self.assertEqual([state is not None for state in tree.states], [True, False, False, True, False])
+
+        # Depth 4 is rebuilt from the snapshot at depth 3, and depth 2 from the root
+        self.assertEqual(tree.get_state(4).val, 8)
+        self.assertEqual(tree.get_state(2).val, 4)
+        self.assertEqual(tree.num_replayed_moves, 3)
+
+    def test_replay_same_search(self):
+        for exploration_type in [ExplorationType.BreadthFirst(), ExplorationType.DepthFirst()]:
+            explorer = Explorateur()
+            explorer.search(SumState(9), exploration_type=exploration_type, max_moves=1000)
+
+            replayer = Explorateur()
+            replayer.search(SumState(9), exploration_type=exploration_type, max_moves=1000,
+                            stats_level=SearchStats.LOW, snapshot_interval=2, snapshot_cache_size=0)
+
+            # Replay mode only changes where states come from, not the search itself
+            self.assertEqual(replayer.num_decisions, explorer.num_decisions)
+            self.assertEqual(replayer.num_failed_decisions, explorer.num_failed_decisions)
+            self.assertEqual([move.step for move in replayer.solution_moves],
+                             [move.step for move in explorer.solution_moves])
+            self.assertEqual([state.val for state in replayer.solution_path],
+                             [state.val for state in explorer.solution_path])
+            self.assertGreater(replayer.stats.num_replayed_moves, 0)
+
+    def test_replay_graph_search(self):
+        initial_state = MyState({"x": [1, 2], "y": [10, 20], "z": [100, 200]})
+        goal_state = MyState({"x": [2], "y": [20], "z": [200]})
+
+        explorer = Explorateur()
+        explorer.search(initial_state, goal_state,
+                        exploration_type=ExplorationType.BestFirst(),
+                        search_type=SearchType.GraphSearch(),
+                        snapshot_interval=1)
+        self.assertEqual(explorer.num_decisions, 14)
+        self.assertEqual(explorer.stats.num_replayed_moves, 0)
+
+    def test_replay_invalid(self):
+        with self.assertRaises(ValueError):
+            Explorateur().search(SumState(3), snapshot_interval=0)
+        with self.assertRaises(TypeError):
+            Explorateur().search(SumState(3), snapshot_cache_size=1.5)
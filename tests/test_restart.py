@@ -0,0 +1,78 @@
+from explorateur import Explorateur, ExplorationType, Restart, SearchType
+from explorateur.search.restart import get_cutoff, luby
+from tests.test_base import BaseTest
+from tests.test_limited_discrepancy import BinaryState
+
+
+class FirstOneState(BinaryState):
+
+    # Any full assignment where the first variable is one is a solution, so the first move traps depth first search
+    def is_terminate(self, goal_state=None) -> bool:
+        return len(self.vals) == len(self.target) and self.vals[0] == 1
+
+
+class RestartTest(BaseTest):
+
+    def search(self, restart):
+        explorer = Explorateur()
+        is_solution = explorer.search(FirstOneState([0] * 12),
+                                      exploration_type=ExplorationType.DepthFirst(),
+                                      search_type=SearchType.TreeSearch(),
+                                      max_moves=100000,
+                                      restart=restart)
+        return explorer, is_solution
+
+    def test_sequences(self):
+        self.assertEqual([luby(i) for i in range(15)], [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8])
+        self.assertEqual([get_cutoff(Restart.Luby(10), i) for i in range(4)], [10, 10, 20, 10])
+        self.assertEqual([get_cutoff(Restart.Geometric(10, 1.5), i) for i in range(4)], [10, 15, 22, 34])
+
+    def test_heavy_tail(self):
+        explorer, is_solution = self.search(None)
+        self.assertTrue(is_solution)
+        self.assertEqual(explorer.num_decisions, 4107)
+
+        # Random move orders escape the trap within a few short runs
+        explorer, is_solution = self.search(Restart.Luby(16))
+        self.assertTrue(is_solution)
+        self.assertEqual(explorer.solution_state.vals[0], 1)
+        self.assertLess(explorer.num_decisions, 200)
+
+        # Every run is reported, and the runs add up to the whole search
+        runs = explorer.stats.restarts
+        self.assertEqual(len(runs), explorer.num_restarts + 1)
+        self.assertEqual(sum(run["num_decisions"] for run in runs), explorer.num_decisions)
+        self.assertEqual([run["cutoff"] for run in runs], [get_cutoff(Restart.Luby(16), i) for i in range(len(runs))])
+
+        # The same seed gives the same search
+        same_explorer, _ = self.search(Restart.Luby(16))
+        self.assertEqual(same_explorer.num_decisions, explorer.num_decisions)
+
+    def test_run_times(self):
+        # Run times are measured from the start of this search, also when the explorer is reused
+        explorer = Explorateur()
+        for _ in range(2):
+            explorer.search(FirstOneState([0] * 12),
+                            exploration_type=ExplorationType.DepthFirst(),
+                            search_type=SearchType.TreeSearch(),
+                            max_moves=100000,
+                            restart=Restart.Luby(16))
+            run_times = [run["run_time"] for run in explorer.stats.restarts]
+            self.assertGreater(len(run_times), 1)
+            self.assertLessEqual(run_times[0], explorer.total_time)
+            self.assertLessEqual(sum(run_times), explorer.total_time + 1e-9)
+
+    def test_max_restarts(self):
+        explorer, is_solution = self.search(Restart.Geometric(4, 1, max_restarts=3, is_randomized=False))
+
+        # Without randomization, runs repeat the trap until the last run, which has no cutoff
+        self.assertTrue(is_solution)
+        self.assertEqual(explorer.num_restarts, 3)
+        self.assertEqual(explorer.num_decisions, 3 * 4 + 4107)
+        self.assertEqual(explorer.stats.restarts[-1]["cutoff"], float("inf"))
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            self.search("luby")
+        with self.assertRaises(ValueError):
+            self.search(Restart.Geometric(factor=0.5))
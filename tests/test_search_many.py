@@ -0,0 +1,81 @@
+from explorateur import Explorateur, ExplorationType, SearchType
+from explorateur.state.storage.base_storage import BaseStorage
+from explorateur.state.storage.factory import StorageFactory
+from explorateur.state.storage.hash import HashSet
+from tests.test_base import BaseTest
+from tests.test_cost_search import VertexState
+from tests.test_multi_goal import NETWORK
+
+
+class SearchManyTest(BaseTest):
+
+    def setUp(self):
+        self.explorer = Explorateur()
+        self.args = dict(exploration_type=ExplorationType.BestFirst(), search_type=SearchType.CostGraphSearch())
+
+    def test_same_as_search(self):
+        pairs = [(1, 4), (1, 3), (5, 3), (2, 4), (4, 1)]
+        results = list(self.explorer.search_many([VertexState(NETWORK, s, t) for s, t in pairs], **self.args))
+        self.assertEqual(len(results), len(pairs))
+
+        for (source, target), result in zip(pairs, results):
+            explorer = Explorateur()
+            is_solution = explorer.search(VertexState(NETWORK, source, target), **self.args)
+            self.assertEqual(result.is_solution, is_solution)
+            self.assertEqual(result.num_decisions, explorer.num_decisions)
+            if is_solution:
+                self.assertEqual(result.solution_state.cost, explorer.solution_state.cost)
+                self.assertEqual([state.v for state in result.solution_path],
+                                 [state.v for state in explorer.solution_path])
+
+    def test_reused_storages(self):
+        storages = []
+        for _ in self.explorer.search_many([VertexState(NETWORK, 1, 4), VertexState(NETWORK, 5, 3)], **self.args):
+            storages.append((self.explorer._open, self.explorer.closed))
+        self.assertIs(storages[0][0], storages[1][0])
+        self.assertIs(storages[0][1], storages[1][1])
+
+    def test_storage_without_clear(self):
+        # A storage that cannot be cleared is created anew for every query
+        class UnclearedHashSet(HashSet):
+            clear = BaseStorage.clear
+
+        StorageFactory.factory[SearchType.GraphSearch] = UnclearedHashSet
+        try:
+            args = dict(self.args, search_type=SearchType.GraphSearch())
+            storages = []
+            for _ in self.explorer.search_many([VertexState(NETWORK, 1, 4), VertexState(NETWORK, 5, 3)], **args):
+                storages.append(self.explorer.closed)
+        finally:
+            StorageFactory.factory[SearchType.GraphSearch] = HashSet
+        self.assertIsNot(storages[0], storages[1])
+
+    def test_unchanged_queries(self):
+        queries = [VertexState(NETWORK, 1, 4), VertexState(NETWORK, 5, 3)]
+        ids = [query.id for query in queries]
+        list(self.explorer.search_many(queries, **self.args))
+        self.assertEqual([query.id for query in queries], ids)
+
+    def test_query_arguments(self):
+        # Queries can override arguments, e.g., multi-target queries
+        queries = [{"initial_state": VertexState(NETWORK, 1, None), "goal_keys": [3, 4]},
+                   {"initial_state": [VertexState(NETWORK, 1, None), VertexState(NETWORK, 5, None)],
+                    "goal_keys": [6]}]
+        results = list(self.explorer.search_many(queries, **self.args))
+        self.assertEqual({key: solution.cost for key, solution in results[0].solutions.items()}, {3: 2, 4: 3})
+        self.assertEqual(results[1].solutions[6].cost, 1)
+
+    def test_process_pool(self):
+        queries = [VertexState(NETWORK, s, t) for s, t in [(1, 4), (5, 3), (4, 1)] * 10]
+        results = list(self.explorer.search_many(queries, num_workers=2, **self.args))
+        self.assertEqual([result.is_solution for result in results[:3]], [True, True, False])
+        self.assertEqual([state.v for state in results[0].solution_path], [4, 3, 2, 1])
+        self.assertEqual(results[-2].solution_state.cost, 5)
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            list(self.explorer.search_many([VertexState(NETWORK, 1, 4)], max_move=10))
+        with self.assertRaises(TypeError):
+            list(self.explorer.search_many([VertexState(NETWORK, 1, 4), 5], **self.args))
+        with self.assertRaises(ValueError):
+            list(self.explorer.search_many([{"initial_state": VertexState(NETWORK, 1, 4), "max_moves": 0}]))
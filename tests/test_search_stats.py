@@ -0,0 +1,60 @@
+from explorateur import Explorateur, ExplorationType, SearchType, SearchStats
+from tests.test_base import BaseTest, MyState
+
+
+class SearchStatsTest(BaseTest):
+
+    def search_stats(self, stats_level, exploration_type=ExplorationType.DepthFirst()):
+        explorer = Explorateur()
+        initial_state = MyState({"x": [1, 2], "y": [10, 20], "z": [100, 200]})
+        explorer.search(initial_state,
+                        exploration_type=exploration_type,
+                        search_type=SearchType.TreeSearch(),
+                        max_moves=100,
+                        stats_level=stats_level)
+        return explorer
+
+    def test_stats_off(self):
+        explorer = self.search_stats(SearchStats.OFF)
+        stats = explorer.stats
+
+        self.assertEqual(stats.num_decisions, 14)
+        self.assertEqual(stats.num_failed_decisions, 0)
+        self.assertEqual(stats.total_time, explorer.total_time)
+        self.assertEqual(sum(stats.call_counts.values()), 0)
+
+    def test_stats_low(self):
+        explorer = self.search_stats(SearchStats.LOW)
+        stats = explorer.stats
+
+        # 14 decisions executed, plus the root, are all checked for termination
+        self.assertEqual(stats.call_counts[SearchStats.EXECUTE], 14)
+        self.assertEqual(stats.call_counts[SearchStats.OPEN_REMOVE], 14)
+        self.assertEqual(stats.call_counts[SearchStats.IS_TERMINATE], 15)
+        self.assertEqual(stats.call_counts[SearchStats.OPEN_INSERT], 14)
+        self.assertEqual(stats.call_counts[SearchStats.GET_OBJECTIVE], 0)
+
+        # Binary branching over 3 variables
+        self.assertEqual(stats.depth_histogram, {0: 1, 1: 2, 2: 4, 3: 8})
+        self.assertEqual(stats.branching_histogram[2], 7)
+        self.assertEqual(stats.branching_histogram[0], 8)
+        self.assertEqual(stats.peak_open_size, 4)
+
+        # No timing below HIGH
+        self.assertEqual(sum(stats.call_times.values()), 0)
+
+    def test_stats_high(self):
+        explorer = self.search_stats(SearchStats.HIGH, ExplorationType.BestFirst())
+        stats = explorer.stats
+
+        self.assertEqual(stats.call_counts[SearchStats.GET_OBJECTIVE], 7)
+        self.assertGreater(stats.user_time, 0)
+        self.assertGreater(stats.engine_time, 0)
+        self.assertGreater(stats.nodes_per_second, 0)
+        self.assertEqual(stats.to_dict()["num_decisions"], 14)
+
+    def test_invalid_stats_level(self):
+        explorer = Explorateur()
+        initial_state = MyState({"x": [1, 2]})
+        with self.assertRaises(ValueError):
+            explorer.search(initial_state, stats_level=5)
@@ -0,0 +1,86 @@
+from typing import List
+
+from explorateur import Explorateur, BaseMove, BaseState, ExplorationType, SearchType
+from tests.test_base import BaseTest, MyState
+
+
+class IncrementMove(BaseMove):
+
+    def __init__(self, step):
+        self.step = step
+
+    def __str__(self) -> str:
+        return "+" + str(self.step)
+
+
+class CounterState(BaseState):
+
+    # Counts up to the target, one step at a time
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+        self.val = 0
+
+    def get_moves(self) -> List[IncrementMove]:
+        return [IncrementMove(1)]
+
+    def execute(self, move: IncrementMove) -> bool:
+        self.val += move.step
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return self.val == self.target
+
+    def __str__(self) -> str:
+        return str(self.val)
+
+
+class SolutionPathTest(BaseTest):
+
+    def test_path(self):
+        explorer = Explorateur()
+        initial_state = MyState({"x": [1, 2], "y": [10, 20], "z": [100, 200]}, is_exhaustive_search=False)
+        self.assertTrue(explorer.search(initial_state))
+
+        path = explorer.solution_path
+        self.assertEqual(len(path), 4)
+        self.assertIs(path[0], explorer.solution_state)
+        self.assertEqual(path[-1], initial_state)
+        self.assertEqual(path[1:3], list(path)[1:3])
+        self.assertEqual([str(m) for m in explorer.solution_moves], ["x == 1", "y == 10", "z == 100"])
+        self.assertEqual(path.get_moves(), explorer.solution_moves)
+
+        # Initial state first
+        states = explorer._get_solution_path(is_initial_first=True)
+        self.assertEqual(states[0], initial_state)
+        self.assertIs(states[-1], explorer.solution_state)
+
+    def test_deep_path(self):
+        depth = 20000
+        explorer = Explorateur()
+        self.assertTrue(explorer.search(CounterState(depth),
+                                        exploration_type=ExplorationType.DepthFirst(),
+                                        search_type=SearchType.TreeSearch(),
+                                        max_depth=depth,
+                                        max_moves=depth))
+
+        path = explorer.solution_path
+        self.assertEqual(len(path), depth + 1)
+        self.assertEqual(path[-1].val, 0)
+        self.assertEqual(path[-2].val, 1)
+        self.assertEqual([state.val for state in path][:3], [depth, depth - 1, depth - 2])
+
+        # Indexing every state is as fast as iterating the path
+        self.assertEqual([path[i].val for i in range(len(path))], list(range(depth, -1, -1)))
+        self.assertEqual([state.val for state in reversed(path)], list(range(depth + 1)))
+        with self.assertRaises(IndexError):
+            path[depth + 1]
+        self.assertEqual(len(explorer.solution_moves), depth)
+
+    def test_moves_only(self):
+        explorer = Explorateur()
+        self.assertTrue(explorer.search(CounterState(100), is_solution_path=False))
+
+        self.assertIsNone(explorer.solution_path)
+        self.assertEqual(len(explorer.solution_moves), 100)
+        self.assertEqual(explorer.solution_state.val, 100)
@@ -3,6 +3,7 @@ from explorateur.state.storage.queue import Queue
 from explorateur.state.storage.stack import Stack
 from explorateur.state.storage.hash import HashSet
 from explorateur.state.storage.priority_queue import PriorityQueue
+from explorateur.state.storage.bucket_queue import BucketQueue
 from tests.test_base import BaseTest, MyState, MyMove
 
 
@@ -76,14 +77,84 @@ class StorageTest(BaseTest):
 
 
     def test_priority_queue(self):
-        # TODO
-        pass
-        # pq = PriorityQueue()
-        # b1 = StorageState(1)
-        # b2 = StorageState(2)
-        # pq.insert(b1)
-        # pq.insert(b2)
-        # self.assertEqual(pq.size(), 2)
-        # res = pq.remove()
-        # self.assertEqual(res, b2)
-        # self.assertFalse(pq.is_empty())
+        pq = PriorityQueue()
+        b1 = StorageState(1)
+        b2 = StorageState(2)
+        pq.insert(b1)
+        pq.insert(b2)
+        self.assertEqual(pq.size(), 2)
+        self.assertEqual(pq.contains(b1), b1)
+        res = pq.remove()
+        self.assertEqual(res, b2)
+        self.assertFalse(pq.is_empty())
+
+    def test_priority_queue_ties(self):
+        # Equal objectives do not compare states, and are removed in insertion order
+        pq = PriorityQueue()
+        b1 = StorageState(1)
+        b3 = StorageState(3)
+        pq.insert(b1)
+        pq.insert(b3)
+        self.assertEqual(pq.remove(), b1)
+        self.assertEqual(pq.remove(), b3)
+        self.assertTrue(pq.is_empty())
+
+    def test_bucket_queue(self):
+        bq = BucketQueue()
+        states = [StorageState(i) for i in range(6)]
+        for state, objective in zip(states, [5, 3, 5, -2, 3, 0]):
+            bq.insert(state, objective)
+        self.assertEqual(bq.size(), 6)
+        self.assertEqual(bq.contains(states[0]), states[0])
+        self.assertEqual([bq.remove() for _ in range(3)], [states[3], states[5], states[1]])
+
+        # Lower objectives inserted after removals are still removed first
+        bq.insert(states[3], 1)
+        self.assertEqual([bq.remove() for _ in range(4)], [states[3], states[4], states[0], states[2]])
+        self.assertTrue(bq.is_empty())
+        self.assertFalse(bq.is_heap)
+
+    def test_bucket_queue_lifo(self):
+        bq = BucketQueue(is_lifo=True)
+        b1, b2, b3 = StorageState(1), StorageState(2), StorageState(3)
+        for state in (b1, b2, b3):
+            bq.insert(state, 4)
+        self.assertEqual([bq.remove() for _ in range(3)], [b3, b2, b1])
+
+    def test_bucket_queue_fall_back(self):
+        for is_lifo in (False, True):
+            bq = BucketQueue(is_lifo=is_lifo)
+            b1, b2, b3, b4 = StorageState(1), StorageState(2), StorageState(3), StorageState(4)
+            bq.insert(b1, 2)
+            bq.insert(b2, 2)
+            bq.insert(b3, 1.5)
+            self.assertTrue(bq.is_heap)
+            bq.insert(b4, 2)
+            expected = [b3, b4, b2, b1] if is_lifo else [b3, b1, b2, b4]
+            self.assertEqual([bq.remove() for _ in range(4)], expected)
+
+        # Keys too far apart fall back too
+        bq = BucketQueue()
+        bq.insert(b1, 0)
+        bq.insert(b2, BucketQueue.MAX_BUCKETS)
+        self.assertTrue(bq.is_heap)
+        self.assertEqual(bq.remove(), b1)
+
+    def test_bucket_queue_key_range(self):
+        # Objectives are discretized to their floor
+        bq = BucketQueue(key_range=(0, 10))
+        b1, b2, b3 = StorageState(1), StorageState(2), StorageState(3)
+        bq.insert(b1, 2.7)
+        bq.insert(b2, 2.1)
+        bq.insert(b3, 0.5)
+        self.assertEqual([bq.remove() for _ in range(3)], [b3, b1, b2])
+        self.assertFalse(bq.is_heap)
+
+        # Objectives out of the range fall back to a heap, in order with the discretized ones
+        b4 = StorageState(4)
+        bq.insert(b1, 2.7)
+        bq.insert(b2, 11.5)
+        bq.insert(b3, -2)
+        bq.insert(b4, 2.1)
+        self.assertTrue(bq.is_heap)
+        self.assertEqual([bq.remove() for _ in range(4)], [b3, b1, b4, b2])
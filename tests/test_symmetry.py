@@ -0,0 +1,73 @@
+from typing import List
+
+from explorateur import Explorateur, BaseMove, BaseState, ExplorationType, SearchType
+from explorateur.state.symmetry import dihedral_key, dihedral_transforms, value_permutation_key
+from tests.test_base import BaseTest
+
+
+class MarkMove(BaseMove):
+
+    def __init__(self, row, col):
+        self.row = row
+        self.col = col
+
+    def __str__(self) -> str:
+        return "mark " + str(self.row) + "," + str(self.col)
+
+
+class MarkState(BaseState):
+
+    # Places up to two marks on an empty 3x3 grid
+    def __init__(self, is_symmetric):
+        super().__init__()
+        self.is_symmetric = is_symmetric
+        self.grid = [[0] * 3 for _ in range(3)]
+
+    def get_key(self):
+        return dihedral_key(self.grid) if self.is_symmetric else tuple(map(tuple, self.grid))
+
+    def get_moves(self) -> List[MarkMove]:
+        if sum(map(sum, self.grid)) == 2:
+            return []
+        return [MarkMove(row, col) for row in range(3) for col in range(3) if self.grid[row][col] == 0]
+
+    def execute(self, move: MarkMove) -> bool:
+        self.grid[move.row][move.col] = 1
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return False
+
+    def __str__(self) -> str:
+        return str(self.grid)
+
+
+class SymmetryTest(BaseTest):
+
+    def test_dihedral(self):
+        grid = [[1, 2], [3, 4]]
+        transforms = list(dihedral_transforms(grid))
+        self.assertEqual(len(set(transforms)), 8)
+        self.assertEqual(transforms[0], ((1, 2), (3, 4)))
+        self.assertEqual(transforms[1], ((3, 1), (4, 2)))
+
+        # Every symmetry of the grid has the same key
+        for transform in transforms:
+            self.assertEqual(dihedral_key(transform), ((1, 2), (3, 4)))
+
+    def test_value_permutation(self):
+        self.assertEqual(value_permutation_key("aab"), (0, 0, 1))
+        self.assertEqual(value_permutation_key("bba"), value_permutation_key("aab"))
+        self.assertNotEqual(value_permutation_key("aba"), value_permutation_key("aab"))
+
+    def test_graph_search_symmetry(self):
+        num_decisions = []
+        for is_symmetric in [False, True]:
+            explorer = Explorateur()
+            explorer.search(MarkState(is_symmetric),
+                            exploration_type=ExplorationType.DepthFirst(),
+                            search_type=SearchType.GraphSearch())
+            num_decisions.append(explorer.num_decisions)
+
+        # Expanded grids are visited once per symmetry class, instead of once per grid
+        self.assertEqual(num_decisions, [81, 27])
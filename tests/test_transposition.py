@@ -0,0 +1,107 @@
+from typing import List
+
+from explorateur import Explorateur, BaseMove, BaseState, ExplorationType, SearchType
+from explorateur.state.storage.transposition_table import TranspositionTable
+from tests.test_base import BaseTest
+
+# Node 3 is first reached at depth 3 through 1 and 2, and then at depth 1 directly from 0
+GRAPH = {0: [1, 3], 1: [2], 2: [3], 3: [4], 4: [5], 5: []}
+
+
+class EdgeMove(BaseMove):
+
+    def __init__(self, target):
+        self.target = target
+
+    def __str__(self) -> str:
+        return "-> " + str(self.target)
+
+
+class NodeState(BaseState):
+
+    def __init__(self, node=0):
+        super().__init__()
+        self.node = node
+
+    def get_key(self):
+        return self.node
+
+    def get_moves(self) -> List[EdgeMove]:
+        return [EdgeMove(target) for target in GRAPH[self.node]]
+
+    def execute(self, move: EdgeMove) -> bool:
+        self.node = move.target
+        return True
+
+    def is_terminate(self, goal_state=None) -> bool:
+        return self.node == 5
+
+    def __str__(self) -> str:
+        return str(self.node)
+
+
+class TranspositionTest(BaseTest):
+
+    def test_graph_search_prunes_shallower(self):
+        explorer = Explorateur()
+        is_solution = explorer.search(NodeState(),
+                                      exploration_type=ExplorationType.DepthFirst(),
+                                      search_type=SearchType.GraphSearch(),
+                                      max_depth=4)
+        self.assertFalse(is_solution)
+
+    def test_transposition_search(self):
+        explorer = Explorateur()
+        is_solution = explorer.search(NodeState(),
+                                      exploration_type=ExplorationType.DepthFirst(),
+                                      search_type=SearchType.TranspositionSearch(),
+                                      max_depth=4)
+        self.assertTrue(is_solution)
+        self.assertEqual([state.node for state in explorer.solution_path], [5, 4, 3, 0])
+
+        # The shallowest depth of node 3 replaced the first one
+        self.assertEqual(explorer.closed.get_depth(NodeState(3)), 1)
+
+    def test_table_unbounded(self):
+        table = TranspositionTable()
+        table.insert(NodeState(1), 3)
+        self.assertTrue(table.contains(NodeState(1), 3))
+        self.assertTrue(table.contains(NodeState(1), 4))
+        self.assertFalse(table.contains(NodeState(1), 2))
+        self.assertFalse(table.contains(NodeState(2), 5))
+
+        table.insert(NodeState(1), 5)
+        self.assertEqual(table.get_depth(NodeState(1)), 3)
+        table.insert(NodeState(1), 2)
+        self.assertEqual(table.get_depth(NodeState(1)), 2)
+        self.assertEqual(table.size(), 1)
+
+    def test_table_policies(self):
+        # Keys 1 and 3 collide in the same slot
+        depth_preferred = TranspositionTable(2, TranspositionTable.DEPTH_PREFERRED)
+        always_replace = TranspositionTable(2, TranspositionTable.ALWAYS_REPLACE)
+        two_tier = TranspositionTable(2, TranspositionTable.TWO_TIER)
+        for table in [depth_preferred, always_replace, two_tier]:
+            table.insert(NodeState(1), 2)
+            table.insert(NodeState(3), 4)
+
+        self.assertEqual(depth_preferred.get_depth(NodeState(1)), 2)
+        self.assertIsNone(depth_preferred.get_depth(NodeState(3)))
+
+        self.assertIsNone(always_replace.get_depth(NodeState(1)))
+        self.assertEqual(always_replace.get_depth(NodeState(3)), 4)
+
+        self.assertEqual(two_tier.get_depth(NodeState(1)), 2)
+        self.assertEqual(two_tier.get_depth(NodeState(3)), 4)
+        self.assertEqual(two_tier.size(), 2)
+
+        # Shallower entries take over the depth-preferred slot
+        depth_preferred.insert(NodeState(3), 1)
+        self.assertEqual(depth_preferred.get_depth(NodeState(3)), 1)
+        self.assertEqual(depth_preferred.size(), 1)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Explorateur().search(NodeState(), search_type=SearchType.TranspositionSearch(capacity=0))
+        with self.assertRaises(ValueError):
+            Explorateur().search(NodeState(), search_type=SearchType.TranspositionSearch(policy="random"))